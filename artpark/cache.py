@@ -0,0 +1,214 @@
+"""
+In-process table cache for ARTPARKData.
+
+Parsed DataFrames are kept in memory keyed by the resolved CSV path, so repeated
+3_get_metadata / 4_get_data calls on the same table skip pd.read_csv entirely.
+
+Key behaviors:
+    - LRU eviction once the summed DataFrame footprint exceeds the byte budget
+    - Entries are invalidated when the file's mtime or size changes
+    - A table larger than the whole budget is returned but never cached
+    - Derived structures (e.g. value indexes) attach to an entry, count toward
+      the budget and are dropped with it
+    - Per-table footprint and hit/miss counters are exposed via stats()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from artpark.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+DEFAULT_CACHE_MB = 512
+
+
+def default_cache_bytes() -> int:
+    """Byte budget from ARTPARK_TABLE_CACHE_MB (default 512 MB)."""
+    try:
+        return int(float(os.environ.get("ARTPARK_TABLE_CACHE_MB", DEFAULT_CACHE_MB)) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_CACHE_MB * 1024 * 1024
+
+
+def file_fingerprint(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file -- cheap change detection without reading it."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Resident size of a DataFrame, including object/string payloads."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class _Entry:
+    __slots__ = ("frame", "fingerprint", "nbytes", "hits", "attachments")
+
+    def __init__(self, frame: pd.DataFrame, fingerprint: Tuple[int, int], nbytes: int):
+        self.frame = frame
+        self.fingerprint = fingerprint
+        self.nbytes = nbytes
+        self.hits = 0
+        self.attachments: Dict[str, Any] = {}
+
+
+class TableCache:
+    """
+    Byte-budgeted LRU cache of parsed tables.
+
+    Cached frames are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = default_cache_bytes() if max_bytes is None else max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, path: str, loader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        """Return the cached frame for path, calling loader(path) on a miss or stale entry."""
+        key = os.path.realpath(path)
+        fingerprint = file_fingerprint(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.fingerprint == fingerprint:
+                    entry.hits += 1
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return entry.frame
+                self._drop(key)
+                self.invalidations += 1
+            self.misses += 1
+
+        # Parse outside the lock so other tables stay servable meanwhile.
+        df = loader(key)
+        nbytes = frame_nbytes(df)
+        if nbytes > self.max_bytes:
+            return df
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(df, fingerprint, nbytes)
+            self._used_bytes += nbytes
+            self._evict()
+        return df
+
+    def peek(self, path: str) -> Optional[pd.DataFrame]:
+        """The cached frame for path if present and fresh; never loads or counts."""
+        key = os.path.realpath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.fingerprint != file_fingerprint(key):
+            return None
+        return entry.frame
+
+    def attachment(
+        self,
+        path: str,
+        frame: pd.DataFrame,
+        name: str,
+        factory: Callable[[Callable[[int], None]], Any],
+    ) -> Any:
+        """
+        Return the structure called name derived from the cached frame for path,
+        creating it with factory(on_grow). Its initial nbytes (if any) and any
+        memory it reports later through on_grow(nbytes) count toward the budget.
+        Frames that aren't (or are no longer) cached get a throwaway structure.
+        """
+        key = os.path.realpath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.frame is not frame:
+                entry = None
+            else:
+                attached = entry.attachments.get(name)
+                if attached is not None:
+                    return attached
+        if entry is None:
+            return factory(lambda nbytes: None)
+
+        # Build outside the lock; if another thread won the race, keep theirs
+        built = factory(lambda nbytes: self._grow(key, entry, nbytes))
+        with self._lock:
+            attached = entry.attachments.setdefault(name, built)
+        if attached is built:
+            self._grow(key, entry, int(getattr(built, "nbytes", 0) or 0))
+        return attached
+
+    def _grow(self, key: str, entry: _Entry, nbytes: int) -> None:
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                return
+            entry.nbytes += nbytes
+            self._used_bytes += nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._used_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop one table (or everything when path is None)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._used_bytes = 0
+                return
+            key = os.path.realpath(path)
+            if key in self._entries:
+                self._drop(key)
+
+    def invalidate_dir(self, directory: str) -> int:
+        """Drop every table under directory (a reloaded dataset). Returns how many."""
+        prefix = os.path.join(os.path.realpath(directory), "")
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._drop(key)
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._used_bytes -= entry.nbytes
+
+    def stats(self, base_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Cache counters plus per-table footprint, most recently used last."""
+        base = os.path.realpath(base_dir) if base_dir else None
+        with self._lock:
+            tables = [
+                {
+                    "path": os.path.relpath(key, base) if base else key,
+                    "bytes": entry.nbytes,
+                    "rows": len(entry.frame),
+                    "hits": entry.hits,
+                }
+                for key, entry in self._entries.items()
+            ]
+            lookups = self.hits + self.misses
+            return {
+                "max_bytes": self.max_bytes,
+                "used_bytes": self._used_bytes,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "tables": tables,
+            }
@@ -14,15 +14,69 @@ Architecture:
 
 Key behaviors:
     - Table names in metadata.yaml may differ from CSV filenames (hyphens vs underscores)
-    - _resolve_csv_path tries multiple name variants and subdirectories
-    - Filter values are case-insensitive (str.lower() comparison)
+    - _resolve_csv_path tries multiple name variants and subdirectories, answered
+      from a resolution index built with the catalogue (artpark/names.py)
+    - Filter values are case-insensitive (str.lower() comparison), answered
+      from a lazily built inverted index (artpark/index.py)
     - Summary stats are auto-computed for up to 10 numeric columns
+    - metadata.yaml files are parsed once per change into a table map (artpark/metadata.py)
+    - Parsed tables are shared through a byte-budgeted LRU cache (artpark/cache.py)
+    - Tables load from compiled Arrow artifacts when present (artpark/store.py),
+      falling back to pd.read_csv
+    - 3_get_metadata reads persisted table profiles (artpark/profile.py)
+      instead of scanning the data
+    - Tables split across round*.csv files or state subdirectories are also
+      served whole, as partitioned virtual tables (artpark/partitions.py)
+    - Identical concurrent schema/query calls and table parses are coalesced
+      (artpark/singleflight.py), and finished responses are cached with a TTL
+      until their files change (artpark/responses.py)
+    - The catalogue (and 2_get_tables listings) is built once; a watcher
+      re-scans only changed datasets and evicts their cached state (artpark/watcher.py)
 """
 
+from __future__ import annotations
+
 import os
-import yaml
-import pandas as pd
-from typing import Dict, Any, Optional, List
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
+
+from artpark.cache import TableCache, file_fingerprint
+from artpark.columnar import DECODING_NOTE, FORMATS, encode_rows
+from artpark.compact import compact_frame, compaction_enabled, expand_categoricals, restore_dtypes
+from artpark.index import ValueIndex, filter_mask
+from artpark.join import (
+    LGD_DATASET, LGD_TABLE, LocationDirectory, composite_keys, infer_level, normalize_keys,
+)
+from artpark.lazy import lazy_import
+from artpark.metadata import MetadataRegistry
+from artpark.names import NameIndex
+from artpark.partitions import PartitionedTable, find_partitioned_tables
+from artpark.profile import build_profile
+from artpark.results import (
+    CursorError, ResultSet, ResultSetCache, decode_cursor, encode_cursor, normalize_filters,
+)
+from artpark.responses import ResponseCache
+from artpark.singleflight import SingleFlight
+from artpark.store import TableStore, read_csv
+from artpark.watcher import CatalogueWatcher
+from observability.metrics import TABLE_LOAD_SECONDS
+from observability.stages import stage
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+SCAN_CHUNK_ROWS = 50_000
+AGGREGATIONS = ("sum", "mean", "min", "max", "count", "nunique")
+JOIN_TYPES = ("inner", "left")
+JOIN_KEY_COLUMN = "join_key"
+MAX_UNMATCHED_KEYS = 20
+MAX_JOIN_ROWS = 1_000_000
+STREAM_FIRST_CHUNK_ROWS = 2_000
+PARTITION_LOAD_WORKERS = 4
 
 
 class ARTPARKData:
@@ -31,11 +85,34 @@ class ARTPARKData:
     Reads CSVs and metadata.yaml files from publicdata/data/*/.
     """
 
-    def __init__(self, data_dir: Optional[str] = None):
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        cache_bytes: Optional[int] = None,
+        store_dir: Optional[str] = None,
+        compact_dtypes: Optional[bool] = None,
+    ):
         if data_dir is None:
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "publicdata", "data")
+            data_dir = os.environ.get("ARTPARK_DATA_DIR") or os.path.join(
+                os.path.dirname(os.path.dirname(__file__)), "publicdata", "data"
+            )
         self.data_dir = data_dir
         self._catalogue: Optional[Dict[str, Any]] = None
+        self._tables = TableCache(max_bytes=cache_bytes)
+        self._store = TableStore(store_dir)
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._results = ResultSetCache()
+        self._flights = SingleFlight()
+        self._responses = ResponseCache()
+        self._partitions: Dict[str, Dict[str, PartitionedTable]] = {}
+        self._watcher: Optional[CatalogueWatcher] = None
+        self._metadata = MetadataRegistry()
+        # Cached tables hold compact dtypes (artpark/compact.py); per-table reports by real path
+        self._compact = compaction_enabled() if compact_dtypes is None else compact_dtypes
+        self._compaction: Dict[str, Dict[str, Any]] = {}
+        # Guards lazily built shared state (catalogue, partition maps) across tool
+        # workers; reentrant because building the catalogue discovers partitions
+        self._lock = threading.RLock()
 
     # =========================================================================
     # Catalogue / Discovery
@@ -48,50 +125,57 @@ class ARTPARKData:
             return catalogue
 
         for entry in sorted(os.listdir(self.data_dir)):
-            dataset_path = os.path.join(self.data_dir, entry)
-            if not os.path.isdir(dataset_path):
-                continue
-
-            meta_path = os.path.join(dataset_path, "metadata.yaml")
-            csv_files = self._find_csv_files(dataset_path)
-
-            info = {"dataset_id": entry, "tables": [], "csv_files": csv_files}
-
-            tables_from_meta = []
-            if os.path.exists(meta_path):
-                meta = self._load_yaml(meta_path)
-                tables_meta = meta.get("tables", {})
-                for table_name, table_data in tables_meta.items():
-                    if not isinstance(table_data, dict):
-                        continue
-                    table_info = table_data.get("info", {})
-                    if not isinstance(table_info, dict):
-                        table_info = {}
-                    tables_from_meta.append({
-                        "name": table_name,
-                        "about": table_info.get("about", ""),
-                        "source": table_info.get("source", ""),
-                    })
-
-            if tables_from_meta:
-                info["tables"] = tables_from_meta
-            else:
-                # Fallback: metadata.yaml missing, empty, or failed to parse.
-                for csv_file in csv_files:
-                    table_name = os.path.splitext(csv_file)[0]
-                    info["tables"].append({"name": table_name, "about": "", "source": ""})
-
-            catalogue[entry] = info
+            info = self._scan_dataset(entry)
+            if info is not None:
+                catalogue[entry] = info
 
         return catalogue
 
-    def _load_yaml(self, path: str) -> dict:
-        """Load a YAML file, returning empty dict on parse errors."""
-        try:
-            with open(path, "r") as f:
-                return yaml.safe_load(f) or {}
-        except yaml.YAMLError:
-            return {}
+    def _scan_dataset(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """Catalogue entry for one dataset directory (None if it isn't one)."""
+        dataset_path = os.path.join(self.data_dir, dataset_id)
+        if not os.path.isdir(dataset_path):
+            return None
+
+        csv_files = self._find_csv_files(dataset_path)
+        metadata = self._metadata.get(dataset_path)
+
+        # metadata also fingerprints the directory layout; see _dataset_entry
+        info = {"dataset_id": dataset_id, "tables": [], "csv_files": csv_files, "metadata": metadata}
+
+        tables_from_meta = [
+            {
+                "name": table.name,
+                "about": table.info.get("about", ""),
+                "source": table.info.get("source", ""),
+            }
+            for table in metadata.top_level
+        ]
+
+        if tables_from_meta:
+            info["tables"] = tables_from_meta
+        else:
+            # Fallback: metadata.yaml missing, empty, or failed to parse.
+            for csv_file in csv_files:
+                table_name = os.path.splitext(csv_file)[0]
+                info["tables"].append({"name": table_name, "about": "", "source": ""})
+
+        # Table name -> CSV path / partitioned table, so requests never probe the filesystem
+        declared = metadata.declared + [name for name in metadata.tables if name not in metadata.declared]
+        names = NameIndex(dataset_path, declared, self._partitioned_tables(dataset_id))
+        info["names"] = names
+
+        # What 2_get_tables returns, computed with the catalogue instead of per call
+        info["listing"] = self._list_tables(dataset_id)
+        if names.ambiguous:
+            info["listing"]["ambiguous_tables"] = names.ambiguous
+            for table_name, matches in names.ambiguous.items():
+                print(
+                    f"[CATALOGUE] {dataset_id}/{table_name} matches several CSVs {matches}; "
+                    f"resolving to {matches[0]}",
+                    file=sys.stderr,
+                )
+        return info
 
     def _find_csv_files(self, dataset_path: str) -> List[str]:
         """Find all CSV files in a dataset directory (non-recursive)."""
@@ -101,10 +185,71 @@ class ARTPARKData:
         ])
 
     def get_catalogue(self) -> Dict[str, Any]:
-        """Return cached catalogue of all datasets."""
-        if self._catalogue is None:
-            self._catalogue = self._build_catalogue()
-        return self._catalogue
+        """Return cached catalogue of all datasets (built once, even under concurrent callers)."""
+        catalogue = self._catalogue
+        if catalogue is None:
+            with self._lock:
+                if self._catalogue is None:
+                    self._catalogue = self._build_catalogue()
+                catalogue = self._catalogue
+        return catalogue
+
+    def reload_datasets(self, dataset_ids: Iterable[str]) -> None:
+        """
+        Re-scan only the given dataset directories and swap them into the
+        catalogue atomically, after dropping everything cached from their files
+        (tables, result sets, responses, partition maps, partitioned profiles).
+        Datasets that no longer exist are removed.
+        """
+        dataset_ids = set(dataset_ids)
+        with self._lock:
+            for dataset_id in dataset_ids:
+                self._partitions.pop(dataset_id, None)
+        for dataset_id in dataset_ids:
+            dataset_path = os.path.join(self.data_dir, dataset_id)
+            self._metadata.invalidate(dataset_path)
+            self._tables.invalidate_dir(dataset_path)
+            self._results.invalidate_dir(dataset_path)
+            stale = os.path.join(os.path.realpath(dataset_path), "")
+            for path in [p for p in list(self._compaction) if p.startswith(stale)]:
+                self._compaction.pop(path, None)
+        self._responses.invalidate(dataset_ids)
+        stale_profiles = tuple(f"partitioned:{dataset_id}/" for dataset_id in dataset_ids)
+        for key in [k for k in list(self._profiles) if k.startswith(stale_profiles)]:
+            self._profiles.pop(key, None)
+
+        scanned = {dataset_id: self._scan_dataset(dataset_id) for dataset_id in dataset_ids}
+        with self._lock:
+            if self._catalogue is None:
+                return
+            catalogue = dict(self._catalogue)
+            for dataset_id, info in scanned.items():
+                if info is None:
+                    catalogue.pop(dataset_id, None)
+                else:
+                    catalogue[dataset_id] = info
+            self._catalogue = dict(sorted(catalogue.items()))
+
+    def start_watching(self, **kwargs) -> CatalogueWatcher:
+        """Hot-reload changed datasets from now on (see artpark/watcher.py)."""
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = CatalogueWatcher(self.data_dir, self.reload_datasets, **kwargs)
+            watcher = self._watcher
+        return watcher.start()
+
+    def stop_watching(self) -> None:
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def watcher_stats(self) -> Optional[Dict[str, Any]]:
+        """Watcher mode and reload count, or None when not watching."""
+        watcher = self._watcher
+        if watcher is None:
+            return None
+        return {"mode": watcher.mode, "reloads": watcher.reloads}
 
     def list_datasets(self) -> Dict[str, Any]:
         """List all available datasets with basic info."""
@@ -124,13 +269,32 @@ class ARTPARKData:
     # Dataset Exploration (Tables)
     # =========================================================================
 
+    def _dataset_entry(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Catalogue entry for dataset_id, re-scanned first if its layout changed
+        since it was built: a CSV, subdirectory or metadata.yaml added, removed
+        or edited. A few stat calls, so listings stay current without the watcher.
+        """
+        info = self.get_catalogue().get(dataset_id)
+        if info is None:
+            stale = os.path.isdir(os.path.join(self.data_dir, dataset_id))
+        else:
+            stale = not info["metadata"].is_current()
+        if stale:
+            self.reload_datasets({dataset_id})
+            info = self.get_catalogue().get(dataset_id)
+        return info
+
     def get_dataset_tables(self, dataset_id: str) -> Dict[str, Any]:
-        """List tables and their info for a specific dataset."""
-        dataset_path = os.path.join(self.data_dir, dataset_id)
-        if not os.path.isdir(dataset_path):
+        """List tables and their info for a specific dataset (from the catalogue)."""
+        info = self._dataset_entry(dataset_id)
+        if info is None:
             return {"error": f"Dataset '{dataset_id}' not found."}
+        return dict(info["listing"])
 
-        meta_path = os.path.join(dataset_path, "metadata.yaml")
+    def _list_tables(self, dataset_id: str) -> Dict[str, Any]:
+        """Scan one dataset directory for its tables, subdirectories and partitioned tables."""
+        dataset_path = os.path.join(self.data_dir, dataset_id)
         csv_files = self._find_csv_files(dataset_path)
 
         # Check for subdirectories with additional data
@@ -148,27 +312,29 @@ class ARTPARKData:
             "subdirectories": subdirs,
             "tables": [],
         }
+        partitioned = self._partitioned_tables(dataset_id)
+        if partitioned:
+            result["partitioned_tables"] = [
+                {
+                    "name": name,
+                    "partition_column": ptable.column,
+                    "partitions": ptable.values,
+                    "about": f"All {len(ptable.partitions)} files combined; filter on {ptable.column} to read only some.",
+                }
+                for name, ptable in partitioned.items()
+            ]
 
-        tables_from_meta = []
-        if os.path.exists(meta_path):
-            meta = self._load_yaml(meta_path)
-            tables_meta = meta.get("tables", {})
-            for table_name, table_data in tables_meta.items():
-                if not isinstance(table_data, dict):
-                    continue
-                table_info = table_data.get("info", {})
-                if not isinstance(table_info, dict):
-                    table_info = {}
-                dd = table_data.get("data_dictionary", {})
-                columns = list(dd.keys()) if isinstance(dd, dict) else []
-                tables_from_meta.append({
-                    "name": table_name,
-                    "about": table_info.get("about", ""),
-                    "source": table_info.get("source", ""),
-                    "comments": table_info.get("comments", ""),
-                    "num_columns": len(columns),
-                    "columns": columns,
-                })
+        tables_from_meta = [
+            {
+                "name": table.name,
+                "about": table.info.get("about", ""),
+                "source": table.info.get("source", ""),
+                "comments": table.info.get("comments", ""),
+                "num_columns": len(table.data_dictionary),
+                "columns": list(table.data_dictionary),
+            }
+            for table in self._metadata.get(dataset_path).top_level
+        ]
 
         if tables_from_meta:
             result["tables"] = tables_from_meta
@@ -201,80 +367,53 @@ class ARTPARKData:
         """
         Get the data dictionary and summary stats for a specific table.
         Returns column descriptions + unique values for key columns (for filtering).
+        Served from the response cache when fresh; identical concurrent calls
+        share one computation.
         """
+        return self._respond(
+            ("schema", dataset_id, table_name), dataset_id, table_name,
+            lambda: self._get_table_schema(dataset_id, table_name),
+        )
+
+    def _get_table_schema(self, dataset_id: str, table_name: str) -> Dict[str, Any]:
         dataset_path = os.path.join(self.data_dir, dataset_id)
         if not os.path.isdir(dataset_path):
             return {"error": f"Dataset '{dataset_id}' not found."}
 
-        # Load metadata.yaml
-        meta_path = os.path.join(dataset_path, "metadata.yaml")
-        data_dictionary = {}
-        table_info = {}
-        if os.path.exists(meta_path):
-            meta = self._load_yaml(meta_path)
-            tables_meta = meta.get("tables", {})
-            table_meta = tables_meta.get(table_name, {})
-            if isinstance(table_meta, dict):
-                dd = table_meta.get("data_dictionary", {})
-                data_dictionary = dd if isinstance(dd, dict) else {}
-                ti = table_meta.get("info", {})
-                table_info = ti if isinstance(ti, dict) else {}
-
-        # Also check subdirectory metadata
-        if not data_dictionary:
-            for entry in os.listdir(dataset_path):
-                sub_path = os.path.join(dataset_path, entry)
-                sub_meta = os.path.join(sub_path, "metadata.yaml")
-                if os.path.isdir(sub_path) and os.path.exists(sub_meta):
-                    sub_yaml = self._load_yaml(sub_meta)
-                    sub_tables = sub_yaml.get("tables", {})
-                    if table_name in sub_tables:
-                        st = sub_tables[table_name]
-                        if isinstance(st, dict):
-                            dd = st.get("data_dictionary", {})
-                            data_dictionary = dd if isinstance(dd, dict) else {}
-                            ti = st.get("info", {})
-                            table_info = ti if isinstance(ti, dict) else {}
-                        break
+        # Top-level metadata.yaml, falling back to subdirectory metadata (parsed once, see artpark/metadata.py)
+        metadata = self._metadata.get(dataset_path)
+        table_meta = metadata.table(table_name)
+        data_dictionary = table_meta.data_dictionary if table_meta else {}
+        table_info = table_meta.info if table_meta else {}
+
+        # Partitioned tables: dictionary from a partition's metadata, profile over all partitions
+        ptable = self._partitioned_table(dataset_id, table_name)
+        if ptable is not None and not data_dictionary:
+            for partition in ptable.partitions:
+                partition_dir = os.path.dirname(partition.csv_path)
+                stem = os.path.splitext(os.path.basename(partition.csv_path))[0]
+                st = metadata.table(stem)
+                if st is not None and os.path.dirname(st.source) == partition_dir:
+                    data_dictionary = st.data_dictionary
+                    break
 
         # Find the CSV file
-        csv_path = self._resolve_csv_path(dataset_id, table_name)
+        csv_path = self._resolve_csv_path(dataset_id, table_name) if ptable is None else None
         csv_summary = {}
         filter_values = {}
 
-        if csv_path and os.path.exists(csv_path):
+        if ptable is not None:
             try:
-                df = pd.read_csv(csv_path, low_memory=False)
-                csv_summary = {
-                    "total_rows": len(df),
-                    "total_columns": len(df.columns),
-                    "columns": list(df.columns),
-                    "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-                }
-
-                # Extract unique values for categorical/ID columns (useful for filtering)
-                MAX_CATEGORICAL_VALUES = 50
-                MAX_TEMPORAL_VALUES = 100
-                omitted_columns = []
-                for col in df.columns:
-                    if df[col].dtype == "object" or "ID" in col or "name" in col.lower():
-                        unique_vals = df[col].dropna().unique()
-                        if 1 < len(unique_vals) <= MAX_CATEGORICAL_VALUES:
-                            filter_values[col] = sorted(unique_vals.tolist())
-                        elif len(unique_vals) > MAX_CATEGORICAL_VALUES:
-                            omitted_columns.append(f"{col} ({len(unique_vals)} unique values)")
-                    elif "year" in col.lower() or "round" in col.lower() or "date" in col.lower():
-                        unique_vals = df[col].dropna().unique()
-                        if 1 < len(unique_vals) <= MAX_TEMPORAL_VALUES:
-                            filter_values[col] = sorted(unique_vals.tolist())
-                        elif len(unique_vals) > MAX_TEMPORAL_VALUES:
-                            omitted_columns.append(f"{col} ({len(unique_vals)} unique values)")
-                if omitted_columns:
-                    filter_values["_omitted"] = (
-                        f"These columns have too many unique values to list: {', '.join(omitted_columns)}. "
-                        f"You can still filter on them -- use values from the data rows returned by 4_get_data()."
-                    )
-
+                profile = self._partitioned_profile(dataset_id, ptable)
+                csv_summary = profile["csv_summary"]
+                filter_values = profile["filter_values"]
+            except Exception as e:
+                csv_summary = {"error": f"Could not read CSV: {e}"}
+        elif csv_path and os.path.exists(csv_path):
+            try:
+                profile = self._get_profile(csv_path)
+                csv_summary = profile["csv_summary"]
+                filter_values = profile["filter_values"]
             except Exception as e:
                 csv_summary = {"error": f"Could not read CSV: {e}"}
 
@@ -286,6 +425,8 @@ class ARTPARKData:
             "csv_summary": csv_summary,
             "filter_values": filter_values,
         }
+        if ptable is not None:
+            result["partitions"] = {"column": ptable.column, "values": ptable.values}
         return result
 
     # =========================================================================
@@ -298,44 +439,229 @@ class ARTPARKData:
         table_name: str,
         filters: Optional[Dict[str, str]] = None,
         limit: int = 50,
+        columns: Optional[List[str]] = None,
+        stream: bool = False,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        format: str = "records",
     ) -> Dict[str, Any]:
         """
         Read a CSV table, apply optional filters, return rows + summary.
+
+        With columns, only those columns are returned (and summarised), and
+        unless the table is already cached the read itself is pushed down:
+        just the projected + filter columns are loaded, filtered chunk by chunk.
+
+        With stream=True and an uncached table, reading stops once limit rows
+        have matched; totals and summary_stats then cover only the scanned
+        prefix and are flagged as lower bounds / estimates.
+
+        Pages hold page_size rows (default: limit). When more rows match, the
+        response carries next_cursor; passing it back as cursor returns the
+        next page from the cached result set (filters/columns come from the
+        cursor). Cursors expire when the data file changes.
+
+        Partitioned tables are pruned on their partition column first; stream
+        does not apply to them.
+
+        format="columnar" returns data as one column-name list plus a value
+        array per column, repeated strings dictionary-encoded (see
+        artpark/columnar.py), instead of one dict per row.
+
+        Repeated calls (same table, normalized filters, limit, columns, paging
+        and format) are served from the response cache while the data is
+        unchanged; identical concurrent calls share one computation.
         """
-        csv_path = self._resolve_csv_path(dataset_id, table_name)
+        if format not in FORMATS:
+            return {
+                "error": f"Unknown format '{format}'.",
+                "valid_formats": list(FORMATS),
+                "hint": "Omit format for one dict per row, or pass format=\"columnar\" for compact column arrays.",
+            }
+        key = (
+            "query", dataset_id, table_name, normalize_filters(filters), limit,
+            tuple(columns) if columns else None, stream, cursor, page_size, format,
+        )
+        response = self._respond(key, dataset_id, table_name, lambda: self._query_table(
+            dataset_id, table_name, filters, limit, columns, stream, cursor, page_size, format,
+        ))
+        if cursor is None and "filters_applied" in response:
+            # The shared response may have been built for an equivalent spelling of filters
+            response["filters_applied"] = dict(filters) if filters else {}
+        return response
+
+    def _query_table(
+        self,
+        dataset_id: str,
+        table_name: str,
+        filters: Optional[Dict[str, str]] = None,
+        limit: int = 50,
+        columns: Optional[List[str]] = None,
+        stream: bool = False,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        format: str = "records",
+    ) -> Dict[str, Any]:
+        """query_table without coalescing."""
+        ptable = self._partitioned_table(dataset_id, table_name)
+        if ptable is not None:
+            return self._query_partitioned(
+                ptable, dataset_id, table_name, filters, limit, columns, cursor, page_size, format,
+            )
+
+        with stage("resolve", dataset=dataset_id, table=table_name) as span:
+            csv_path = self._resolve_csv_path(dataset_id, table_name)
+            span.set("found", csv_path is not None)
         if csv_path is None:
             return {"error": f"CSV not found for dataset '{dataset_id}', table '{table_name}'."}
 
+        offset = 0
         try:
-            df = pd.read_csv(csv_path, low_memory=False)
+            fingerprint = file_fingerprint(csv_path)
+            if cursor is not None:
+                state = decode_cursor(cursor)
+                if state.get("table") != [dataset_id, table_name]:
+                    raise CursorError("Cursor was issued for a different table.")
+                if tuple(state["fingerprint"]) != fingerprint:
+                    raise CursorError("Cursor expired: the data file changed since it was issued.")
+                filters, columns, offset = state.get("filters"), state.get("columns"), int(state["offset"])
+                page_size = page_size or state.get("page_size")
+                stream = False
+        except CursorError as e:
+            return {"error": str(e), "hint": "Call 4_get_data() again without cursor to start from the first page."}
+        except OSError as e:
+            return {"error": f"Failed to read CSV: {e}"}
+        page = page_size or limit
+
+        try:
+            df = self._tables.peek(csv_path)
+            table_columns = list(df.columns) if df is not None else self._table_columns(csv_path)
         except Exception as e:
             return {"error": f"Failed to read CSV: {e}"}
 
-        total_rows_before_filter = len(df)
+        # Validate requested columns before reading any rows
+        for col in list(filters or {}) + list(columns or []):
+            if col not in table_columns:
+                return {
+                    "error": f"Column '{col}' not found.",
+                    "valid_columns": sorted(table_columns),
+                    "hint": "Call 3_get_metadata() to see valid column names and filter values.",
+                }
+
+        result_key = (os.path.realpath(csv_path), fingerprint, normalize_filters(filters))
+        result_set = self._results.get(result_key) if cursor is not None else None
 
         # Apply filters (case-insensitive for string columns)
-        applied_filters = {}
-        if filters:
-            for col, value in filters.items():
-                if col not in df.columns:
-                    return {
-                        "error": f"Column '{col}' not found.",
-                        "valid_columns": sorted(df.columns.tolist()),
-                        "hint": "Call 3_get_metadata() to see valid column names and filter values.",
-                    }
-                col_vals = df[col].astype(str)
-                if isinstance(value, str) and "," in value:
-                    values = [v.strip() for v in value.split(",")]
-                    # Case-insensitive matching for string columns
-                    lower_vals = [v.lower() for v in values]
-                    df = df[col_vals.str.lower().isin(lower_vals)]
+        scan_complete = True
+        try:
+            if result_set is not None:
+                # Later page: slice the cached row positions, no re-filtering
+                table = self._load_table(csv_path)
+                total_rows_before_filter = len(table)
+                df = table.iloc[result_set.page(offset, page)]
+            elif df is None and (columns or stream) and cursor is None:
+                with stage("scan", filters=len(filters or {}), stream=bool(stream)) as span:
+                    df, positions, total_rows_before_filter, scan_complete = self._scan(
+                        csv_path, columns or table_columns, filters,
+                        stop_after=max(page, 1) if stream else None,
+                    )
+                    span.set("rows.before_filter", total_rows_before_filter)
+                    span.set("rows.after_filter", len(df))
+                    span.set("columns", len(df.columns))
+                    span.set("complete", scan_complete)
+                result_set = ResultSet(positions if filters else None, total_rows_before_filter)
+            else:
+                df = self._load_table(csv_path)
+                total_rows_before_filter = len(df)
+                positions = None
+                if filters:
+                    with stage("filter", filters=len(filters), **{"rows.before_filter": total_rows_before_filter}) as span:
+                        index = self._value_index(csv_path, df)
+                        positions = index.select(filters)
+                        df = df.iloc[positions]
+                        span.set("rows.after_filter", len(df))
+                result_set = ResultSet(positions, total_rows_before_filter)
+                if cursor is not None:
+                    df = df.iloc[offset:offset + page]
+        except Exception as e:
+            return {"error": f"Failed to read CSV: {e}"}
+
+        if scan_complete:
+            self._results.put(result_key, result_set)
+
+        applied_filters = dict(filters) if filters else {}
+        if columns:
+            df = df[columns]
+
+        total_rows_after_filter = len(result_set) if scan_complete else len(df)
+
+        # Build summary stats for numeric columns (over all matches, once per result set)
+        stats_key = tuple(columns or ())
+        summary_stats = result_set.summary_stats.get(stats_key) if scan_complete else None
+        with stage("summary_stats", **{"cache.hit": summary_stats is not None}) as span:
+            if summary_stats is None:
+                if cursor is not None:
+                    matches = self._load_table(csv_path)
+                    if result_set.positions is not None:
+                        matches = matches.iloc[result_set.positions]
+                    matches = matches[columns] if columns else matches
                 else:
-                    df = df[col_vals.str.lower() == str(value).lower()]
-                applied_filters[col] = value
+                    matches = df
+                summary_stats = self._summary_stats(matches)
+                span.set("rows", len(matches))
+                span.set("columns", len(matches.columns))
+                if scan_complete:
+                    result_set.summary_stats[stats_key] = summary_stats
+
+        # Return limited rows
+        with stage("serialize", format=format) as span:
+            page_df = df if cursor is not None else df.head(page)
+            rows = encode_rows(page_df, format)
+            span.set("rows", len(page_df))
+            span.set("columns", len(page_df.columns))
 
-        total_rows_after_filter = len(df)
+        next_offset = offset + len(page_df)
+        next_cursor = None
+        if scan_complete and next_offset < total_rows_after_filter:
+            next_cursor = encode_cursor({
+                "table": [dataset_id, table_name],
+                "filters": applied_filters,
+                "columns": list(columns) if columns else None,
+                "offset": next_offset,
+                "page_size": page,
+                "fingerprint": list(fingerprint),
+            })
 
-        # Build summary stats for numeric columns
+        result = {
+            "dataset_id": dataset_id,
+            "table_name": table_name,
+            "total_rows_before_filter": total_rows_before_filter,
+            "total_rows_after_filter": total_rows_after_filter,
+            "filters_applied": applied_filters,
+            "rows_returned": len(page_df),
+            "limit": limit,
+            "summary_stats": summary_stats,
+            "data": rows,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        }
+        if columns:
+            result["columns"] = list(columns)
+        if format == "columnar":
+            result["format"] = format
+            result["_format"] = DECODING_NOTE
+        if not scan_complete:
+            result["totals_are_lower_bounds"] = True
+            result["_scan"] = (
+                f"Streaming mode stopped after {total_rows_before_filter} rows once {page} matches were found. "
+                f"total_rows_* are lower bounds and summary_stats are estimates from the matches seen. "
+                f"Call again without stream for exact totals."
+            )
+        return result
+
+    @staticmethod
+    def _summary_stats(df: pd.DataFrame) -> Dict[str, Any]:
+        """min/max/mean for up to MAX_STATS_COLUMNS numeric columns."""
         MAX_STATS_COLUMNS = 10
         numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
         summary_stats = {}
@@ -355,29 +681,772 @@ class ARTPARKData:
                     f"Showing stats for {MAX_STATS_COLUMNS} of {len(numeric_cols)} numeric columns. "
                     f"Omitted: {', '.join(numeric_cols[MAX_STATS_COLUMNS:])}"
                 )
+        return summary_stats
 
-        # Return limited rows
-        rows = df.head(limit).to_dict(orient="records")
+    def _table_columns(self, csv_path: str) -> List[str]:
+        """Column names without loading rows: persisted profile, else the CSV header."""
+        profile = self._stored_profile(csv_path)
+        if profile is not None:
+            return profile["csv_summary"]["columns"]
+        return list(pd.read_csv(csv_path, nrows=0).columns)
 
-        return {
+    def _scan(
+        self,
+        csv_path: str,
+        columns: List[str],
+        filters: Optional[Dict[str, str]],
+        stop_after: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, np.ndarray, int, bool]:
+        """
+        Read only the projected + filter columns and filter as they stream in;
+        the full frame is never built. With stop_after, reading stops at the
+        first chunk boundary once that many rows have matched.
+
+        Returns (matching rows, their row positions in the table, rows scanned,
+        whether the whole table was scanned).
+        """
+        wanted = set(columns) | set(filters or {})
+        needed = [c for c in self._table_columns(csv_path) if c in wanted]
+
+        if stop_after is None:
+            df = self._store.load(csv_path, columns=needed)
+            if df is not None:
+                if not filters:
+                    return df, np.arange(len(df)), len(df), True
+                mask = filter_mask(df, filters)
+                return df[mask], np.flatnonzero(mask), len(df), True
+
+        scanned = 0
+        matched = 0
+        parts = []
+        positions = []
+        complete = True
+        first_chunk = STREAM_FIRST_CHUNK_ROWS if stop_after is not None else SCAN_CHUNK_ROWS
+        for chunk, last in self._iter_chunks(csv_path, needed, first_chunk_rows=first_chunk):
+            mask = filter_mask(chunk, filters) if filters else np.ones(len(chunk), dtype=bool)
+            parts.append(chunk[mask])
+            positions.append(np.flatnonzero(mask) + scanned)
+            scanned += len(chunk)
+            matched += len(parts[-1])
+            if stop_after is not None and matched >= stop_after:
+                complete = last
+                break
+        if not parts:
+            empty = pd.read_csv(csv_path, usecols=needed, nrows=0)
+            return empty, np.arange(0), 0, True
+        return pd.concat(parts, ignore_index=True), np.concatenate(positions), scanned, complete
+
+    def _iter_chunks(
+        self,
+        csv_path: str,
+        columns: List[str],
+        first_chunk_rows: int = SCAN_CHUNK_ROWS,
+    ) -> Iterator[Tuple[pd.DataFrame, bool]]:
+        """
+        Table rows in order as (chunk, whether it is the last): store record
+        batches, else CSV chunks that start at first_chunk_rows and double up
+        to SCAN_CHUNK_ROWS.
+        """
+        batches = self._store.iter_batches(csv_path, columns=columns)
+        if batches is not None:
+            batch = next(batches, None)
+            while batch is not None:
+                following = next(batches, None)
+                yield batch, following is None
+                batch = following
+            return
+
+        # Pin dtypes to the full-file parse so chunks can't infer differently
+        summary = self._scan_profile(csv_path)["csv_summary"]
+        dtype = {c: summary["dtypes"][c] for c in columns if c in summary["dtypes"]}
+        chunk_rows = first_chunk_rows
+        rows = 0
+        with pd.read_csv(csv_path, usecols=columns, dtype=dtype, iterator=True) as reader:
+            while True:
+                try:
+                    chunk = reader.get_chunk(chunk_rows)
+                except StopIteration:
+                    return
+                rows += len(chunk)
+                yield chunk, rows >= summary["total_rows"]
+                chunk_rows = min(chunk_rows * 2, SCAN_CHUNK_ROWS)
+
+    # =========================================================================
+    # Aggregation
+    # =========================================================================
+
+    def aggregate_table(
+        self,
+        dataset_id: str,
+        table_name: str,
+        aggregations: Dict[str, Any],
+        group_by: Optional[List[str]] = None,
+        filters: Optional[Dict[str, str]] = None,
+        limit: int = 1000,
+    ) -> Dict[str, Any]:
+        """
+        Group the (filtered) table and aggregate server-side; only grouped rows are returned.
+
+        aggregations maps column -> function name or list of names
+        (sum, mean, min, max, count, nunique). Output columns are "{column}.{function}",
+        plus row_count per group. sum/mean on text columns coerce numeric-looking
+        strings and skip the rest.
+        """
+        ptable = self._partitioned_table(dataset_id, table_name)
+        csv_path = self._resolve_csv_path(dataset_id, table_name) if ptable is None else None
+        if ptable is None and csv_path is None:
+            return {"error": f"CSV not found for dataset '{dataset_id}', table '{table_name}'."}
+
+        try:
+            if ptable is not None:
+                df = None
+                table_columns = self._partitioned_columns(ptable)
+            else:
+                df = self._load_table(csv_path)
+                table_columns = df.columns.tolist()
+        except Exception as e:
+            return {"error": f"Failed to read CSV: {e}"}
+
+        group_by = list(group_by or [])
+        if not aggregations:
+            return {
+                "error": "No aggregations given.",
+                "hint": f"Pass e.g. {{\"<column>\": \"sum\"}}. Supported: {', '.join(AGGREGATIONS)}.",
+            }
+        for col in group_by + list(filters or {}) + list(aggregations):
+            if col not in table_columns:
+                return {
+                    "error": f"Column '{col}' not found.",
+                    "valid_columns": sorted(table_columns),
+                    "hint": "Call 3_get_metadata() to see valid column names and filter values.",
+                }
+        spec: Dict[str, List[str]] = {}
+        for col, funcs in aggregations.items():
+            funcs = [funcs] if isinstance(funcs, str) else list(funcs)
+            for func in funcs:
+                if func not in AGGREGATIONS:
+                    return {
+                        "error": f"Unsupported aggregation '{func}' for column '{col}'.",
+                        "valid_aggregations": list(AGGREGATIONS),
+                    }
+            spec[col] = funcs
+
+        partitions = None
+        if ptable is not None:
+            try:
+                df, total_rows_before_filter, partitions = self._load_partitions(ptable, filters)
+            except Exception as e:
+                return {"error": f"Failed to read CSV: {e}"}
+        else:
+            total_rows_before_filter = len(df)
+            if filters:
+                with stage("filter", filters=len(filters), **{"rows.before_filter": total_rows_before_filter}) as span:
+                    df = df.iloc[self._value_index(csv_path, df).select(filters)]
+                    span.set("rows.after_filter", len(df))
+
+        # Work on just the needed columns; coerce text columns only where arithmetic needs it.
+        # Group keys are expanded too: categorical keys would add a group per unobserved category.
+        work = expand_categoricals(df[list(dict.fromkeys(group_by + list(spec)))])
+        coerced = []
+        for col, funcs in spec.items():
+            if {"sum", "mean"} & set(funcs) and not pd.api.types.is_numeric_dtype(work[col]):
+                work = work.assign(**{col: pd.to_numeric(work[col], errors="coerce")})
+                coerced.append(col)
+
+        named = {f"{col}.{func}": (col, func) for col, funcs in spec.items() for func in funcs}
+        try:
+            with stage("aggregate", rows=len(work), group_by=len(group_by), aggregations=len(named)) as span:
+                if group_by:
+                    grouped = work.groupby(group_by, dropna=False, sort=True)
+                    out = grouped.agg(**named)
+                    out.insert(0, "row_count", grouped.size())
+                    out = out.reset_index()
+                else:
+                    out = pd.DataFrame([{
+                        "row_count": len(work),
+                        **{name: work[col].agg(func) for name, (col, func) in named.items()},
+                    }])
+                span.set("groups", len(out))
+        except Exception as e:
+            return {"error": f"Aggregation failed: {e}"}
+
+        for name, (col, func) in named.items():
+            if func == "mean":
+                out[name] = out[name].round(4)
+        total_groups = len(out)
+        out = out.head(limit)
+        out = out.astype(object).where(out.notna(), None)
+        result = {
             "dataset_id": dataset_id,
             "table_name": table_name,
             "total_rows_before_filter": total_rows_before_filter,
-            "total_rows_after_filter": total_rows_after_filter,
-            "filters_applied": applied_filters,
+            "total_rows_after_filter": len(df),
+            "filters_applied": dict(filters) if filters else {},
+            "group_by": group_by,
+            "aggregations": spec,
+            "total_groups": total_groups,
+            "groups_returned": len(out),
+            "limit": limit,
+            "data": out.to_dict(orient="records"),
+        }
+        if partitions is not None:
+            result["partitions"] = partitions
+        if coerced:
+            result["_coerced"] = (
+                f"Text columns {', '.join(coerced)} were converted to numbers for sum/mean; "
+                f"non-numeric values were skipped."
+            )
+        return result
+
+    # =========================================================================
+    # Cross-Dataset Joins
+    # =========================================================================
+
+    def join_tables(
+        self,
+        left_dataset_id: str,
+        left_table_name: str,
+        right_dataset_id: str,
+        right_table_name: str,
+        left_on: List[str],
+        right_on: List[str],
+        left_filters: Optional[Dict[str, str]] = None,
+        right_filters: Optional[Dict[str, str]] = None,
+        left_columns: Optional[List[str]] = None,
+        right_columns: Optional[List[str]] = None,
+        how: str = "inner",
+        limit: int = 500,
+    ) -> Dict[str, Any]:
+        """
+        Hash-join two tables on location keys, server-side.
+
+        Each side is filtered first (same syntax as query_table). Key values are
+        normalized through artpark/join.py -- names match case/punctuation-
+        insensitively and are mapped to LGD regionIDs via the 0034 directory --
+        so "Mysuru", "MYSURU" and "district_xxx" can meet. how is "inner" or "left".
+        Overlapping non-key column names get ".left" / ".right" suffixes.
+        """
+        if how not in JOIN_TYPES:
+            return {"error": f"Unsupported join type '{how}'.", "valid_join_types": list(JOIN_TYPES)}
+        left_on, right_on = list(left_on or []), list(right_on or [])
+        if not left_on or len(left_on) != len(right_on):
+            return {
+                "error": "left_on and right_on must name the same number (at least one) of key columns.",
+                "hint": 'e.g. left_on=["location.admin2.name"], right_on=["location.admin2.name"]',
+            }
+
+        sides = []
+        for side, dataset_id, table_name, keys, filters, columns in (
+            ("left", left_dataset_id, left_table_name, left_on, left_filters, left_columns),
+            ("right", right_dataset_id, right_table_name, right_on, right_filters, right_columns),
+        ):
+            ptable = self._partitioned_table(dataset_id, table_name)
+            csv_path = self._resolve_csv_path(dataset_id, table_name) if ptable is None else None
+            if ptable is None and csv_path is None:
+                return {"error": f"CSV not found for {side} dataset '{dataset_id}', table '{table_name}'."}
+            try:
+                if ptable is not None:
+                    df = None
+                    table_columns = self._partitioned_columns(ptable)
+                else:
+                    df = self._load_table(csv_path)
+                    table_columns = df.columns.tolist()
+            except Exception as e:
+                return {"error": f"Failed to read {side} CSV: {e}"}
+            for col in keys + list(filters or {}) + list(columns or []):
+                if col not in table_columns:
+                    return {
+                        "error": f"Column '{col}' not found in {side} table '{table_name}'.",
+                        "valid_columns": sorted(table_columns),
+                        "hint": "Call 3_get_metadata() to see valid column names and filter values.",
+                    }
+            if ptable is not None:
+                # Pruned and filtered up front; keys are then normalized per request
+                try:
+                    df = self._load_partitions(ptable, filters)[0]
+                except Exception as e:
+                    return {"error": f"Failed to read {side} CSV: {e}"}
+                positions = np.arange(len(df))
+            else:
+                positions = self._value_index(csv_path, df).select(filters) if filters else np.arange(len(df))
+            sides.append((side, dataset_id, table_name, csv_path, df, keys, filters, columns, positions))
+
+        directory, directory_token = self._location_directory()
+        frames = []
+        meta = {}
+        for side, dataset_id, table_name, csv_path, df, keys, filters, columns, positions in sides:
+            key_parts = [
+                self._join_keys(csv_path, df, col, directory, directory_token)[positions] for col in keys
+            ]
+            out_cols = list(dict.fromkeys(keys + list(columns or df.columns)))
+            frame = df.iloc[positions][out_cols].reset_index(drop=True)
+            frame.insert(0, JOIN_KEY_COLUMN, composite_keys(key_parts).to_numpy())
+            frames.append(frame)
+            meta[side] = {
+                "dataset_id": dataset_id,
+                "table_name": table_name,
+                "on": keys,
+                "filters_applied": dict(filters) if filters else {},
+                "rows_after_filter": len(frame),
+            }
+
+        left, right = frames
+        right = right[right[JOIN_KEY_COLUMN].notna()]
+        if how == "inner":
+            left = left[left[JOIN_KEY_COLUMN].notna()]
+
+        # Many-to-many keys multiply; size the output before materializing it
+        left_counts = left[JOIN_KEY_COLUMN].value_counts()
+        right_counts = right[JOIN_KEY_COLUMN].value_counts()
+        matched = int((left_counts * right_counts.reindex(left_counts.index, fill_value=0)).sum())
+        if how == "left":
+            matched += int(left[JOIN_KEY_COLUMN].isna().sum())
+            matched += int(left_counts[~left_counts.index.isin(right_counts.index)].sum())
+        if matched > MAX_JOIN_ROWS:
+            return {
+                "error": f"Join would produce {matched:,} rows (limit {MAX_JOIN_ROWS:,}).",
+                "left_rows": len(left),
+                "right_rows": len(right),
+                "hint": "Keys repeat on both sides. Add left_filters/right_filters (e.g. a single year or "
+                        "round), or aggregate one side first with 5_aggregate_data().",
+            }
+
+        joined = pd.merge(left, right, on=JOIN_KEY_COLUMN, how=how, suffixes=(".left", ".right"), sort=False)
+
+        right_keys = set(right[JOIN_KEY_COLUMN])
+        unmatched = left[~left[JOIN_KEY_COLUMN].isin(right_keys)]
+        unmatched_values = unmatched[left_on].drop_duplicates().head(MAX_UNMATCHED_KEYS)
+
+        rows = joined.head(limit)
+        rows = rows.astype(object).where(rows.notna(), None).to_dict(orient="records")
+        result = {
+            "left": meta["left"],
+            "right": meta["right"],
+            "how": how,
+            "key_normalization": "lgd" if len(directory) else "name",
+            "total_rows": len(joined),
             "rows_returned": len(rows),
             "limit": limit,
-            "summary_stats": summary_stats,
+            "unmatched_left_keys": unmatched_values.astype(object).where(unmatched_values.notna(), None)
+                                                   .to_dict(orient="records"),
+            "data": rows,
+        }
+        return result
+
+    def _location_directory(self) -> Tuple[LocationDirectory, str]:
+        """LGD name -> regionID directory from 0034 (empty if unavailable), plus a version token."""
+        csv_path = self._resolve_csv_path(LGD_DATASET, LGD_TABLE)
+        if csv_path is None:
+            return LocationDirectory(), "none"
+        try:
+            lgd = self._load_table(csv_path)
+        except Exception:
+            return LocationDirectory(), "none"
+        directory = self._tables.attachment(
+            csv_path, lgd, "location_directory", lambda on_grow: LocationDirectory(lgd)
+        )
+        return directory, "%d-%d" % file_fingerprint(csv_path)
+
+    def _join_keys(
+        self,
+        csv_path: Optional[str],
+        df: pd.DataFrame,
+        col: str,
+        directory: LocationDirectory,
+        directory_token: str,
+    ) -> np.ndarray:
+        """Normalized key array for a whole column, cached with the table (if it is a cached file)."""
+        if csv_path is None:
+            return normalize_keys(df[col], directory, infer_level(col))
+        return self._tables.attachment(
+            csv_path, df, f"join_keys:{col}:{directory_token}",
+            lambda on_grow: normalize_keys(df[col], directory, infer_level(col)),
+        )
+
+    # =========================================================================
+    # Partitioned Tables
+    # =========================================================================
+
+    def _partitioned_tables(self, dataset_id: str) -> Dict[str, PartitionedTable]:
+        """Partitioned virtual tables of a dataset, discovered once from its file layout."""
+        tables = self._partitions.get(dataset_id)
+        if tables is None:
+            dataset_path = os.path.join(self.data_dir, dataset_id)
+            declared = self._metadata.get(dataset_path).declared
+            tables = find_partitioned_tables(dataset_path, declared)
+            with self._lock:
+                tables = self._partitions.setdefault(dataset_id, tables)
+        return tables
+
+    def _partitioned_table(self, dataset_id: str, table_name: str) -> Optional[PartitionedTable]:
+        names = self._name_index(dataset_id)
+        return names.partition(table_name) if names is not None else None
+
+    def _partitioned_columns(self, ptable: PartitionedTable) -> List[str]:
+        """Partition column followed by the union of the partitions' columns, without reading rows."""
+        return ptable.columns(self._table_columns)
+
+    def _load_partitions(
+        self,
+        ptable: PartitionedTable,
+        filters: Optional[Dict[str, str]],
+        columns: Optional[List[str]] = None,
+    ) -> Tuple[pd.DataFrame, int, Dict[str, Any]]:
+        """
+        Rows matching filters from the partitions that survive pruning. Only
+        those files are opened -- in parallel, through the table cache -- and each
+        is filtered with its own value index before the results are concatenated.
+
+        Returns (matching rows, rows in the surviving partitions, pruning report).
+        """
+        survivors, remaining = ptable.prune(filters)
+
+        def load(partition) -> Tuple[pd.DataFrame, int]:
+            df = self._load_table(partition.csv_path)
+            total = len(df)
+            if any(col not in df.columns for col in remaining):
+                df = df.iloc[:0]
+            elif remaining:
+                df = df.iloc[self._value_index(partition.csv_path, df).select(remaining)]
+            if columns is not None:
+                df = df[[c for c in columns if c in df.columns]]
+            # Parsed dtypes, so partitions concatenate exactly as the CSVs would
+            df = restore_dtypes(df, self._parsed_dtypes(partition.csv_path))
+            df = df.assign(**{ptable.column: partition.value})
+            return df[[ptable.column] + [c for c in df.columns if c != ptable.column]], total
+
+        if survivors:
+            with ThreadPoolExecutor(max_workers=min(PARTITION_LOAD_WORKERS, len(survivors))) as pool:
+                loaded = list(pool.map(load, survivors))
+            df = pd.concat([part for part, _ in loaded], ignore_index=True)
+        else:
+            loaded = []
+            df = pd.DataFrame(columns=self._partitioned_columns(ptable))
+        if columns is not None:
+            df = df.reindex(columns=columns)
+
+        report = {
+            "column": ptable.column,
+            "partitions_total": len(ptable.partitions),
+            "partitions_read": [p.value for p in survivors],
+        }
+        return df, sum(total for _, total in loaded), report
+
+    def _partitioned_profile(self, dataset_id: str, ptable: PartitionedTable) -> Dict[str, Any]:
+        """Profile of the whole virtual table, memoized until any partition changes."""
+        key = "partitioned:%s/%s:%d-%d" % ((dataset_id, ptable.name) + ptable.fingerprint())
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = build_profile(self._load_partitions(ptable, None)[0])
+            # Partition values are what prunes; always list them
+            profile["filter_values"][ptable.column] = ptable.values
+            self._profiles[key] = profile
+        return profile
+
+    def _query_partitioned(
+        self,
+        ptable: PartitionedTable,
+        dataset_id: str,
+        table_name: str,
+        filters: Optional[Dict[str, str]],
+        limit: int,
+        columns: Optional[List[str]],
+        cursor: Optional[str],
+        page_size: Optional[int],
+        format: str = "records",
+    ) -> Dict[str, Any]:
+        """query_table for a partitioned table; later pages re-filter the (cached) partitions."""
+        offset = 0
+        try:
+            fingerprint = ptable.fingerprint()
+            if cursor is not None:
+                state = decode_cursor(cursor)
+                if state.get("table") != [dataset_id, table_name]:
+                    raise CursorError("Cursor was issued for a different table.")
+                if tuple(state["fingerprint"]) != fingerprint:
+                    raise CursorError("Cursor expired: the data file changed since it was issued.")
+                filters, columns, offset = state.get("filters"), state.get("columns"), int(state["offset"])
+                page_size = page_size or state.get("page_size")
+        except CursorError as e:
+            return {"error": str(e), "hint": "Call 4_get_data() again without cursor to start from the first page."}
+        except OSError as e:
+            return {"error": f"Failed to read CSV: {e}"}
+        page = page_size or limit
+
+        try:
+            table_columns = self._partitioned_columns(ptable)
+        except Exception as e:
+            return {"error": f"Failed to read CSV: {e}"}
+        for col in list(filters or {}) + list(columns or []):
+            if col not in table_columns:
+                return {
+                    "error": f"Column '{col}' not found.",
+                    "valid_columns": sorted(table_columns),
+                    "hint": "Call 3_get_metadata() to see valid column names and filter values.",
+                }
+
+        try:
+            df, total_rows_before_filter, partitions = self._load_partitions(ptable, filters, columns)
+        except Exception as e:
+            return {"error": f"Failed to read CSV: {e}"}
+
+        applied_filters = dict(filters) if filters else {}
+        with stage("serialize", format=format) as span:
+            page_df = df.iloc[offset:offset + page]
+            rows = encode_rows(page_df, format)
+            span.set("rows", len(page_df))
+            span.set("columns", len(page_df.columns))
+        next_offset = offset + len(page_df)
+        next_cursor = None
+        if next_offset < len(df):
+            next_cursor = encode_cursor({
+                "table": [dataset_id, table_name],
+                "filters": applied_filters,
+                "columns": list(columns) if columns else None,
+                "offset": next_offset,
+                "page_size": page,
+                "fingerprint": list(fingerprint),
+            })
+
+        result = {
+            "dataset_id": dataset_id,
+            "table_name": table_name,
+            "total_rows_before_filter": total_rows_before_filter,
+            "total_rows_after_filter": len(df),
+            "filters_applied": applied_filters,
+            "rows_returned": len(page_df),
+            "limit": limit,
+            "summary_stats": self._summary_stats(df.drop(columns=[ptable.column], errors="ignore")),
             "data": rows,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "partitions": partitions,
+        }
+        if columns:
+            result["columns"] = list(columns)
+        if format == "columnar":
+            result["format"] = format
+            result["_format"] = DECODING_NOTE
+        return result
+
+    # =========================================================================
+    # Response Cache
+    # =========================================================================
+
+    def _respond(
+        self,
+        key: Tuple,
+        dataset_id: str,
+        table_name: str,
+        compute: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Serve key from the response cache, else compute it -- once across
+        concurrent callers -- and cache it. Always returns a copy.
+        """
+        fingerprint = self._response_fingerprint(dataset_id, table_name)
+        response = self._responses.get(key, fingerprint)
+        if response is None:
+            response = self._flights.do(key, compute)
+            self._responses.put(key, fingerprint, response)
+        return dict(response)
+
+    def _response_fingerprint(self, dataset_id: str, table_name: str) -> Tuple:
+        """(mtime, size) of every file a schema/query response for the table is built from."""
+        try:
+            ptable = self._partitioned_table(dataset_id, table_name)
+            if ptable is not None:
+                data = ptable.fingerprint()
+                meta_dirs = {os.path.dirname(p.csv_path) for p in ptable.partitions}
+            else:
+                csv_path = self._resolve_csv_path(dataset_id, table_name)
+                data = file_fingerprint(csv_path) if csv_path else None
+                meta_dirs = {os.path.dirname(csv_path)} if csv_path else set()
+            meta_dirs.add(os.path.join(self.data_dir, dataset_id))
+            metas = tuple(
+                file_fingerprint(path)
+                for path in sorted(os.path.join(d, "metadata.yaml") for d in meta_dirs)
+                if os.path.exists(path)
+            )
+        except OSError:
+            return ("unavailable",)
+        return data, metas
+
+    # =========================================================================
+    # Table Cache
+    # =========================================================================
+
+    def _load_table(self, csv_path: str) -> pd.DataFrame:
+        """
+        Return the parsed table for csv_path, served from the shared cache when
+        fresh. Concurrent misses for the same file share one parse.
+        """
+        with stage("load_table", table=os.path.basename(csv_path)) as span:
+            misses = []
+
+            def parse(path: str) -> pd.DataFrame:
+                misses.append(path)
+                return self._flights.do(("parse", path), lambda: self._read_table(path))
+
+            df = self._tables.get(csv_path, parse)
+            span.set("cache.hit", not misses)
+            span.set("rows", len(df))
+            span.set("columns", len(df.columns))
+        return df
+
+    def _read_table(self, csv_path: str) -> pd.DataFrame:
+        """Memory-map the compiled artifact if one exists, otherwise parse the CSV."""
+        with stage("read_table", table=os.path.basename(csv_path)) as span:
+            start = time.perf_counter()
+            try:
+                df = self._store.load(csv_path)
+            except Exception:
+                df = None
+            source, read_path = "columnar", self._store.artifact_path(csv_path)
+            if df is None:
+                df = read_csv(csv_path)
+                source, read_path = "csv", csv_path
+            TABLE_LOAD_SECONDS.observe(time.perf_counter() - start, source=source)
+            span.set("source", source)
+            span.set("bytes.read", os.path.getsize(read_path))
+            span.set("rows", len(df))
+            span.set("columns", len(df.columns))
+        if self._compact:
+            with stage("compact_table") as span:
+                df, report = compact_frame(df)
+                self._compaction[os.path.realpath(csv_path)] = report
+                span.set("bytes.before", report["before_bytes"])
+                span.set("bytes.after", report["after_bytes"])
+        return df
+
+    def _parsed_dtypes(self, csv_path: str) -> Optional[Dict[str, str]]:
+        """Dtypes of csv_path as parsed, before compaction (None if it wasn't compacted)."""
+        report = self._compaction.get(os.path.realpath(csv_path))
+        return report["dtypes"] if report is not None else None
+
+    def _value_index(self, csv_path: str, df: pd.DataFrame) -> ValueIndex:
+        """Lazily built filter index that lives alongside the cached table."""
+        return self._tables.attachment(
+            csv_path, df, "value_index", lambda on_grow: ValueIndex(df, on_grow=on_grow)
+        )
+
+    def _stored_profile(self, csv_path: str) -> Optional[Dict[str, Any]]:
+        """Profile from memory or the store, without ever building one."""
+        content_hash = self._store.content_hash(csv_path)
+        profile = self._profiles.get(content_hash)
+        if profile is None:
+            profile = self._store.load_profile(csv_path)
+            if profile is not None:
+                self._profiles[content_hash] = profile
+        return profile
+
+    def _scan_profile(self, csv_path: str) -> Dict[str, Any]:
+        """
+        Profile for chunked reads of csv_path: the stored one, else one built
+        from a full parse and saved -- without caching the table, which a scan
+        exists to avoid -- so chunks parse (and filter) like the whole file.
+        """
+        profile = self._stored_profile(csv_path)
+        if profile is None:
+            if self._tables.peek(csv_path) is not None:
+                return self._get_profile(csv_path)
+            with stage("profile", table=os.path.basename(csv_path), **{"cache.hit": False}):
+                profile = build_profile(read_csv(csv_path))
+            self._store.save_profile(csv_path, profile)
+            self._profiles[self._store.content_hash(csv_path)] = profile
+        return profile
+
+    def _get_profile(self, csv_path: str) -> Dict[str, Any]:
+        """
+        Return the table profile (csv_summary + filter_values) for csv_path.
+        Looked up by content hash in memory, then in the store; built from the
+        table only when neither has it.
+        """
+        with stage("profile", table=os.path.basename(csv_path)) as span:
+            profile = self._stored_profile(csv_path)
+            span.set("cache.hit", profile is not None)
+            if profile is None:
+                df = self._load_table(csv_path)
+                profile = build_profile(df, dtypes=self._parsed_dtypes(csv_path))
+                self._store.save_profile(csv_path, profile)
+                self._profiles[self._store.content_hash(csv_path)] = profile
+            span.set("columns", len(profile["csv_summary"].get("columns") or []))
+        return profile
+
+    def compile_tables(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Compile every CSV under data_dir into the columnar store (incremental)."""
+        return self._store.compile_dir(self.data_dir, force=force)
+
+    @property
+    def store_dir(self) -> str:
+        return self._store.store_dir
+
+    def warm_table(self, csv_path: str) -> Dict[str, Any]:
+        """Load csv_path into the table cache and its profile into memory (artpark/warmup.py)."""
+        start = time.perf_counter()
+        df = self._load_table(csv_path)
+        loaded = time.perf_counter()
+        self._get_profile(csv_path)
+        return {
+            "rows": len(df),
+            "load_seconds": round(loaded - start, 3),
+            "profile_seconds": round(time.perf_counter() - loaded, 3),
         }
 
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Parsed vs compacted bytes of every table loaded so far (artpark/compact.py),
+        with the columns that were converted, plus totals.
+        """
+        base = os.path.realpath(self.data_dir)
+        tables = [
+            {
+                "path": os.path.relpath(path, base),
+                "before_bytes": report["before_bytes"],
+                "after_bytes": report["after_bytes"],
+                "saved_pct": report["saved_pct"],
+                "columns": report["columns"],
+            }
+            for path, report in sorted(self._compaction.items())
+        ]
+        before = sum(t["before_bytes"] for t in tables)
+        after = sum(t["after_bytes"] for t in tables)
+        return {
+            "enabled": self._compact,
+            "before_bytes": before,
+            "after_bytes": after,
+            "saved_pct": round(100 * (1 - after / before), 1) if before else 0.0,
+            "tables": tables,
+        }
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Table cache budget, hit/miss counters and per-table footprint."""
+        return self._tables.stats(base_dir=self.data_dir)
+
+    def response_cache_stats(self) -> Dict[str, Any]:
+        """Response cache size, TTL, hit ratio and eviction counters."""
+        return self._responses.stats()
+
+    def metadata_stats(self) -> Dict[str, Any]:
+        """Parsed metadata.yaml registry: datasets held, parses, hits, libyaml in use."""
+        return self._metadata.stats()
+
+    def single_flight_stats(self) -> Dict[str, Any]:
+        """Coalescing counters and the most-coalesced call keys."""
+        return self._flights.stats()
+
     # =========================================================================
     # Helpers
     # =========================================================================
 
+    def _name_index(self, dataset_id: str) -> Optional[NameIndex]:
+        info = self._dataset_entry(dataset_id)
+        return info["names"] if info is not None else None
+
     def _resolve_csv_path(self, dataset_id: str, table_name: str) -> Optional[str]:
         """
-        Find the CSV file for a given dataset_id and table_name.
+        Find the CSV file for a given dataset_id and table_name, from the
+        resolution index built with the catalogue (artpark/names.py).
 
         Resolution order:
         1. Exact match: {table_name}.csv in dataset dir
@@ -386,43 +1455,8 @@ class ARTPARKData:
         4. Same variants in subdirectories
         5. Fuzzy: any CSV in dataset dir whose stem contains table_name (or vice versa)
         """
-        dataset_path = os.path.join(self.data_dir, dataset_id)
-        if not os.path.isdir(dataset_path):
-            return None
-
-        # Build candidate filenames
-        candidates = [
-            f"{table_name}.csv",
-            table_name.replace("_", "-") + ".csv",
-            table_name.replace("-", "_") + ".csv",
-        ]
-
-        # Try exact matches in dataset dir
-        for candidate in candidates:
-            path = os.path.join(dataset_path, candidate)
-            if os.path.exists(path):
-                return path
-
-        # Try exact matches in subdirectories
-        for entry in os.listdir(dataset_path):
-            sub_path = os.path.join(dataset_path, entry)
-            if os.path.isdir(sub_path):
-                for candidate in candidates:
-                    sub_csv = os.path.join(sub_path, candidate)
-                    if os.path.exists(sub_csv):
-                        return sub_csv
-
-        # Fuzzy fallback: find CSV files whose stem contains the table name or vice versa
-        # This handles cases where metadata defines a merged table name that doesn't
-        # directly correspond to any single CSV file (e.g., "nadcp-vaccination-progress"
-        # when the actual files are round1.csv, round2.csv, etc.)
-        normalized = table_name.lower().replace("-", "").replace("_", "")
-        for csv_file in self._find_csv_files(dataset_path):
-            stem = os.path.splitext(csv_file)[0].lower().replace("-", "").replace("_", "")
-            if normalized in stem or stem in normalized:
-                return os.path.join(dataset_path, csv_file)
-
-        return None
+        names = self._name_index(dataset_id)
+        return names.csv_path(table_name) if names is not None else None
 
 
 # Global instance
@@ -0,0 +1,98 @@
+"""
+Columnar response encoding for 4_get_data (format="columnar").
+
+The default records format repeats every column name -- often long
+dot-notation names like location.admin2.name -- on every row, and builds one
+Python dict per row. The columnar format sends each name once and one value
+array per column, built from the column's underlying array:
+
+    {
+        "columns": ["state.name", "cases"],
+        "values": [[0, 0, 1], [12, 7, 3]],
+        "dictionaries": {"state.name": ["KARNATAKA", "GOA"]}
+    }
+
+Key behaviors:
+    - Text columns whose values repeat (distinct <= DICTIONARY_MAX_RATIO of rows)
+      are dictionary-encoded: values holds indexes into dictionaries[column]
+    - Missing values are null, in value arrays and as dictionary indexes
+    - Values are the same Python scalars the records format returns
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from artpark.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+FORMATS = ("records", "columnar")
+DICTIONARY_MAX_RATIO = 0.5
+
+DECODING_NOTE = (
+    "data.values[i] holds the values of column data.columns[i]. For columns listed in "
+    "data.dictionaries, values are indexes into that column's dictionary (null = missing)."
+)
+
+
+def _is_text(series: pd.Series) -> bool:
+    dtype = series.dtype
+    return (
+        isinstance(dtype, pd.CategoricalDtype)
+        or pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+    )
+
+
+def _plain_values(series: pd.Series) -> List[Any]:
+    """Python scalars of series, with missing values as None."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_float_dtype(series.dtype):
+        return series.to_numpy().tolist()  # ints/bools cannot hold missing values
+    missing = series.isna().to_numpy()
+    values = series.to_numpy(dtype=object).tolist()
+    if missing.any():
+        for i in np.flatnonzero(missing).tolist():
+            values[i] = None
+    return values
+
+
+def encode_columnar(df: pd.DataFrame) -> Dict[str, Any]:
+    """df as {"columns", "values", "dictionaries"} (see module docstring)."""
+    values: List[List[Any]] = []
+    dictionaries: Dict[str, List[Any]] = {}
+    for col in df.columns:
+        series = df[col]
+        if _is_text(series) and len(series) > 1:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            if len(uniques) <= DICTIONARY_MAX_RATIO * len(codes):
+                encoded = codes.tolist()
+                if (codes < 0).any():
+                    encoded = [None if code < 0 else code for code in encoded]
+                values.append(encoded)
+                dictionaries[col] = uniques.astype(object).tolist()
+                continue
+        values.append(_plain_values(series))
+    return {"columns": [str(c) for c in df.columns], "values": values, "dictionaries": dictionaries}
+
+
+def encode_rows(df: pd.DataFrame, format: str = "records") -> Any:
+    """df's rows in the given response format: a list of row dicts, or a columnar payload."""
+    if format == "columnar":
+        return encode_columnar(df)
+    return df.to_dict(orient="records")
+
+
+def decode_columnar(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The records (one dict per row) a columnar payload encodes."""
+    columns = []
+    for col, column_values in zip(data["columns"], data["values"]):
+        dictionary = data["dictionaries"].get(col)
+        if dictionary is not None:
+            column_values = [None if code is None else dictionary[code] for code in column_values]
+        columns.append(column_values)
+    return [dict(zip(data["columns"], row)) for row in zip(*columns)]
@@ -0,0 +1,103 @@
+"""
+Compact in-memory dtypes for cached tables.
+
+District, state, serotype and round columns repeat a handful of strings over
+thousands of rows, and counts rarely need 64 bits. Before a table enters the
+table cache:
+
+    low-cardinality text   -> category   (distinct values <= MAX_CATEGORY_RATIO of rows)
+    int64 counts           -> smallest signed integer type that holds them
+
+Responses stay identical: category values are the original strings, integers
+box to the same Python ints, and aggregates accumulate in 64 bits as before.
+Floats are left alone -- float32 would change values. Code that needs the
+original text dtype (min/max, numeric coercion, concatenating partitions)
+calls expand_categoricals (or restore_dtypes) first.
+
+Key behaviors:
+    - A column is only converted if that makes it smaller
+    - Each conversion is recorded in a report (before/after bytes per table,
+      original dtypes) served by ARTPARKData.memory_report()
+    - ARTPARK_COMPACT_DTYPES=0 disables compaction
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from artpark.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+MAX_CATEGORY_RATIO = 0.5
+
+
+def compaction_enabled() -> bool:
+    return os.environ.get("ARTPARK_COMPACT_DTYPES", "1") != "0"
+
+
+def _column_bytes(series: pd.Series) -> int:
+    return int(series.memory_usage(index=False, deep=True))
+
+
+def compact_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """(compacted copy of df, report of what changed and the bytes saved)."""
+    converted: Dict[str, pd.Series] = {}
+    columns: Dict[str, Dict[str, Any]] = {}
+    before = after = 0
+    for col in df.columns:
+        series = df[col]
+        size = _column_bytes(series)
+        before += size
+        candidate = None
+        if pd.api.types.is_integer_dtype(series.dtype) and series.dtype.itemsize > 1:
+            candidate = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+            if series.nunique(dropna=True) <= MAX_CATEGORY_RATIO * len(series):
+                try:
+                    candidate = series.astype("category")
+                except TypeError:  # mixed values that can't be ordered as categories
+                    candidate = None
+        if candidate is not None and candidate.dtype != series.dtype:
+            new_size = _column_bytes(candidate)
+            if new_size < size:
+                converted[col] = candidate
+                columns[col] = {"from": str(series.dtype), "to": str(candidate.dtype), "before_bytes": size, "after_bytes": new_size}
+                size = new_size
+        after += size
+
+    report = {
+        "before_bytes": before,
+        "after_bytes": after,
+        "saved_pct": round(100 * (1 - after / before), 1) if before else 0.0,
+        "columns": columns,
+        "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
+    }
+    if converted:
+        df = df.assign(**converted)
+    return df, report
+
+
+def expand_categoricals(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """df with categorical columns (all, or just columns) back in their categories' dtype."""
+    names = list(df.columns) if columns is None else [c for c in columns if c in df.columns]
+    restored = {
+        col: df[col].astype(df[col].cat.categories.dtype)
+        for col in names
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**restored) if restored else df
+
+
+def restore_dtypes(df: pd.DataFrame, dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+    """df with every compacted column cast back to its dtype in dtypes (a report's "dtypes")."""
+    if not dtypes:
+        return expand_categoricals(df)
+    restored = {
+        col: df[col].astype(dtypes[col])
+        for col in df.columns
+        if col in dtypes and str(df[col].dtype) != dtypes[col]
+    }
+    return df.assign(**restored) if restored else df
@@ -0,0 +1,118 @@
+"""
+Inverted value index for case-insensitive equality filters.
+
+For each filtered column the index stores, once, the row positions grouped by
+the lowercased string form of the value -- the same key query_table has always
+compared against (df[col].astype(str).str.lower()). A filter then costs a dict
+lookup plus an array slice instead of a full-column string pass per request.
+
+Key behaviors:
+    - Columns are indexed lazily, on first filter use, and kept with the table
+    - Comma-separated values are unions of posting lists; columns intersect
+    - Keys come from the same expression the == / isin comparison used, so
+      matching (including how missing values stringify) is unchanged
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+from artpark.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+def filter_keys(value) -> List[str]:
+    """Lowercased match keys for one filter value (comma-separated -> several)."""
+    if isinstance(value, str) and "," in value:
+        return [v.strip().lower() for v in value.split(",")]
+    return [str(value).lower()]
+
+
+def filter_mask(df: pd.DataFrame, filters: Dict[str, str]) -> np.ndarray:
+    """
+    Boolean row mask for filters by direct column comparison. Used where an
+    index isn't worth building: one-off projected reads and streamed chunks.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in filters.items():
+        mask &= df[col].astype(str).str.lower().isin(filter_keys(value)).to_numpy()
+    return mask
+
+
+class _ColumnIndex:
+    __slots__ = ("codes", "order", "bounds", "nbytes")
+
+    def __init__(self, series: pd.Series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Lowercase each category once instead of every row; the trailing
+            # entry (category code -1) is whatever a missing value keys as
+            categories = pd.Categorical.from_codes(
+                list(range(len(series.cat.categories))) + [-1], dtype=series.dtype
+            )
+            key_codes, uniques = pd.factorize(pd.Series(categories).astype(str).str.lower())
+            codes = key_codes[series.cat.codes.to_numpy()]
+        else:
+            keys = series.astype(str).str.lower()
+            codes, uniques = pd.factorize(keys)
+        order = np.argsort(codes, kind="stable")
+        # Missing values get code -1 and sort first; bounds skip past them.
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        self.codes: Dict[str, int] = dict(zip(uniques.tolist(), range(len(uniques))))
+        self.order = order
+        self.bounds = bounds
+        self.nbytes = int(order.nbytes + bounds.nbytes + 100 * len(uniques))
+
+    def positions(self, key: str) -> np.ndarray:
+        code = self.codes.get(key)
+        if code is None:
+            return self.order[:0]
+        return self.order[self.bounds[code]:self.bounds[code + 1]]
+
+
+class ValueIndex:
+    """Per-table posting lists, one column at a time."""
+
+    def __init__(self, frame: pd.DataFrame, on_grow: Optional[Callable[[int], None]] = None):
+        self._frame = frame
+        self._columns: Dict[str, _ColumnIndex] = {}
+        self._lock = threading.Lock()
+        self._on_grow = on_grow
+        self.nbytes = 0
+
+    def _column(self, col: str) -> _ColumnIndex:
+        column = self._columns.get(col)
+        if column is not None:
+            return column
+        built = _ColumnIndex(self._frame[col])
+        with self._lock:
+            column = self._columns.setdefault(col, built)
+            grew = column is built
+            if grew:
+                self.nbytes += built.nbytes
+        if grew and self._on_grow is not None:
+            self._on_grow(built.nbytes)
+        return column
+
+    def lookup(self, col: str, value) -> np.ndarray:
+        """Sorted row positions where col matches value (case-insensitive)."""
+        column = self._column(col)
+        keys = filter_keys(value)
+        if len(keys) == 1:
+            return column.positions(keys[0])
+        parts = [column.positions(k) for k in dict.fromkeys(keys)]
+        return np.sort(np.concatenate(parts))
+
+    def select(self, filters: Dict[str, str]) -> np.ndarray:
+        """Row positions matching every filter, in table order."""
+        positions: Optional[np.ndarray] = None
+        for col, value in filters.items():
+            hits = self.lookup(col, value)
+            positions = hits if positions is None else np.intersect1d(positions, hits, assume_unique=True)
+            if len(positions) == 0:
+                break
+        if positions is None:
+            positions = np.arange(len(self._frame))
+        return positions
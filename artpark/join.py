@@ -0,0 +1,124 @@
+"""
+Location-key normalization for cross-dataset joins.
+
+ARTPARK tables name the same places differently: "Bengaluru Urban" in 0015,
+"BENGALURU URBAN" in 0041, "district_525" in *.ID columns. Join keys are
+normalized to one form before hashing:
+
+    1. LGD-style IDs ("district_525") are kept as-is (lowercased)
+    2. Names are casefolded, "&" -> "and", punctuation/whitespace removed
+    3. If the 0034 LGD directory knows exactly one region with that name at the
+       column's admin level, the name is replaced by its regionID -- so a
+       name column can join an ID column
+
+Key behaviors:
+    - The admin level comes from the column name (admin1/state, admin2/district, ...)
+    - Names that are ambiguous in the directory stay as normalized names
+    - Normalized key arrays are cached per table and column (see ARTPARKData)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from artpark.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+LGD_DATASET = "0034"
+LGD_TABLE = "regionids"
+LGD_ID_COLUMN = "regionID"
+LGD_NAME_COLUMN = "regionName"
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_LGD_ID = re.compile(r"^[a-z]+_\d+$")
+
+# Checked in order: "subdistrict" must win over "district"
+_LEVEL_HINTS = (
+    ("subdistrict", "subdistrict"),
+    ("admin3", "subdistrict"),
+    ("district", "district"),
+    ("admin2", "district"),
+    ("state", "state"),
+    ("admin1", "state"),
+    ("village", "village"),
+    ("ulb", "ulb"),
+)
+
+
+def normalize_name(value) -> Optional[str]:
+    """Case/punctuation-insensitive form of a location name or ID (None for missing)."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    text = str(value).strip().casefold()
+    if _LGD_ID.match(text):
+        return text
+    return _NON_ALNUM.sub("", text.replace("&", " and ")) or None
+
+
+def infer_level(column: str) -> Optional[str]:
+    """Admin level implied by a column name, e.g. location.admin2.name -> district."""
+    lowered = column.lower()
+    for hint, level in _LEVEL_HINTS:
+        if hint in lowered:
+            return level
+    return None
+
+
+class LocationDirectory:
+    """Unambiguous (level, normalized name) -> regionID lookups from the LGD table."""
+
+    def __init__(self, lgd: Optional[pd.DataFrame] = None):
+        self._by_level: Dict[Tuple[Optional[str], str], Optional[str]] = {}
+        if lgd is None or LGD_ID_COLUMN not in lgd.columns or LGD_NAME_COLUMN not in lgd.columns:
+            self.nbytes = 0
+            return
+
+        pairs = lgd[[LGD_ID_COLUMN, LGD_NAME_COLUMN]].dropna().drop_duplicates()
+        for region_id, region_name in zip(pairs[LGD_ID_COLUMN].astype(str), pairs[LGD_NAME_COLUMN]):
+            name = normalize_name(region_name)
+            if name is None:
+                continue
+            region_id = region_id.strip().casefold()
+            level = region_id.split("_", 1)[0] if "_" in region_id else None
+            for scope in (level, None):
+                key = (scope, name)
+                # A second, different ID for the same name makes it ambiguous
+                if key in self._by_level and self._by_level[key] != region_id:
+                    self._by_level[key] = None
+                else:
+                    self._by_level[key] = region_id
+        self.nbytes = 200 * len(self._by_level)
+
+    def __len__(self) -> int:
+        return len(self._by_level)
+
+    def resolve(self, name: Optional[str], level: Optional[str]) -> Optional[str]:
+        if name is None or _LGD_ID.match(name):
+            return name
+        return self._by_level.get((level, name)) or name
+
+
+def normalize_keys(series: pd.Series, directory: LocationDirectory, level: Optional[str]) -> np.ndarray:
+    """Normalized join keys for a column, computed once per distinct value."""
+    codes, uniques = pd.factorize(series)
+    mapped = np.array(
+        [directory.resolve(normalize_name(v), level) for v in uniques.tolist()] + [None],
+        dtype=object,
+    )
+    # code -1 (missing) picks the trailing None
+    return mapped[codes]
+
+
+def composite_keys(parts: List[np.ndarray]) -> pd.Series:
+    """Row-wise tuple keys for multi-column joins; rows with any missing part get None."""
+    if len(parts) == 1:
+        return pd.Series(parts[0], dtype=object)
+    keys = [
+        None if any(p is None for p in row) else "|".join(row)
+        for row in zip(*parts)
+    ]
+    return pd.Series(keys, dtype=object)
@@ -0,0 +1,62 @@
+"""
+Deferred imports for heavy dependencies (pandas, numpy, PyYAML, pyarrow).
+
+`pd = lazy_import("pandas")` binds a stand-in that imports pandas on first
+attribute access, so importing artpark_server (for `make check`, the stdio
+transport or a freshly scaled replica) doesn't pay for libraries until the
+first data touch. Modules using it start with `from __future__ import
+annotations` so `-> pd.DataFrame` annotations don't trigger the import.
+
+Key behaviors:
+    - The real import goes through importlib (thread-safe under the import lock)
+    - Attributes are cached on the stand-in after first use, so hot paths pay
+      a plain attribute lookup, not __getattr__
+"""
+
+import importlib
+import importlib.util
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Stand-in for a module that is imported the first time one of its attributes is read."""
+
+    def __init__(self, name: str):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    # Every name defined here shadows the module's own attribute, hence the _lazy prefix
+    def _lazy_load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = self.__dict__["_lazy_module"] = importlib.import_module(self.__dict__["_lazy_name"])
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._lazy_load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self) -> str:
+        state = "loaded" if is_loaded(self) else "not loaded"
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    return LazyModule(name)
+
+
+def is_loaded(module: Any) -> bool:
+    """False only for a LazyModule whose import hasn't happened yet."""
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_module"] is not None
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """Whether name can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
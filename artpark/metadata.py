@@ -0,0 +1,168 @@
+"""
+Parsed metadata.yaml registry, one entry per dataset directory.
+
+Every metadata.yaml of a dataset -- the top-level one and those in its
+subdirectories -- is parsed once (with libyaml's CSafeLoader when PyYAML was
+built with it) into a table-name -> TableMetadata map. Catalogue scans,
+2_get_tables listings and 3_get_metadata lookups read that map instead of
+re-parsing YAML.
+
+Key behaviors:
+    - Entries are keyed by the (mtime_ns, size) of the metadata files and the
+      mtimes of the directories holding them, so an edited, added or removed
+      metadata.yaml is re-parsed on the next lookup
+    - Top-level tables win; a subdirectory's table fills in a name the
+      top-level file lacks or declares without a data_dictionary
+    - Unparseable or non-mapping YAML reads as empty, as before
+"""
+
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from artpark.lazy import is_loaded, lazy_import
+
+yaml = lazy_import("yaml")
+
+
+METADATA_FILE = "metadata.yaml"
+
+
+def _safe_loader():
+    """libyaml's CSafeLoader when PyYAML was built with it, else the pure-Python SafeLoader."""
+    return getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
+
+def load_yaml(path: str) -> dict:
+    """Load a YAML file, returning empty dict on parse errors."""
+    try:
+        with open(path, "r") as f:
+            loaded = yaml.load(f, Loader=_safe_loader())
+    except yaml.YAMLError:
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+class TableMetadata(NamedTuple):
+    """One table's entry in a metadata.yaml."""
+
+    name: str
+    data_dictionary: Dict[str, Any]
+    info: Dict[str, Any]
+    source: str  # metadata.yaml the entry came from
+
+
+def _table_entries(meta_path: str) -> Tuple[List[str], List[TableMetadata]]:
+    """(every declared table name, entries that are mappings) of one metadata.yaml."""
+    tables_meta = load_yaml(meta_path).get("tables", {})
+    if not isinstance(tables_meta, dict):
+        return [], []
+    entries = []
+    for name, table_data in tables_meta.items():
+        if not isinstance(table_data, dict):
+            continue
+        dd = table_data.get("data_dictionary", {})
+        info = table_data.get("info", {})
+        entries.append(TableMetadata(
+            name=name,
+            data_dictionary=dd if isinstance(dd, dict) else {},
+            info=info if isinstance(info, dict) else {},
+            source=meta_path,
+        ))
+    return list(tables_meta), entries
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DatasetMetadata:
+    """All metadata.yaml files of one dataset directory, parsed."""
+
+    def __init__(self, dataset_path: str):
+        self.dataset_path = dataset_path
+        self.declared: List[str] = []
+        self.top_level: List[TableMetadata] = []
+        self.tables: Dict[str, TableMetadata] = {}
+        self.files: List[str] = []
+
+        # Watched for changes: the dataset dir (new subdirectories), each
+        # subdirectory (metadata.yaml added/removed) and each metadata file
+        self._watched: List[str] = [dataset_path]
+        top_meta = os.path.join(dataset_path, METADATA_FILE)
+        if os.path.isfile(top_meta):
+            self.declared, self.top_level = _table_entries(top_meta)
+            self.files.append(top_meta)
+            self.tables = {entry.name: entry for entry in self.top_level}
+
+        claimed = set()
+        entries = sorted(os.listdir(dataset_path)) if os.path.isdir(dataset_path) else []
+        for entry in entries:
+            sub_path = os.path.join(dataset_path, entry)
+            if not os.path.isdir(sub_path):
+                continue
+            self._watched.append(sub_path)
+            sub_meta = os.path.join(sub_path, METADATA_FILE)
+            if not os.path.isfile(sub_meta):
+                continue
+            self.files.append(sub_meta)
+            for table in _table_entries(sub_meta)[1]:
+                current = self.tables.get(table.name)
+                if table.name not in claimed and (current is None or not current.data_dictionary):
+                    self.tables[table.name] = table
+                    claimed.add(table.name)
+        self._watched += self.files
+        self.fingerprint = self._current_fingerprint()
+
+    def _current_fingerprint(self) -> Tuple:
+        return tuple(_stat(path) for path in self._watched)
+
+    def is_current(self) -> bool:
+        return self._current_fingerprint() == self.fingerprint
+
+    def table(self, table_name: str) -> Optional[TableMetadata]:
+        return self.tables.get(table_name)
+
+
+class MetadataRegistry:
+    """Parsed metadata per dataset directory, re-parsed only when its files change."""
+
+    def __init__(self):
+        self._datasets: Dict[str, DatasetMetadata] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.parses = 0
+
+    def get(self, dataset_path: str) -> DatasetMetadata:
+        entry = self._datasets.get(dataset_path)
+        if entry is not None and entry.is_current():
+            with self._lock:
+                self.hits += 1
+            return entry
+        # Parse outside the lock; a concurrent rebuild of the same directory is harmless
+        entry = DatasetMetadata(dataset_path)
+        with self._lock:
+            self._datasets[dataset_path] = entry
+            self.parses += len(entry.files)
+        return entry
+
+    def invalidate(self, dataset_path: Optional[str] = None) -> None:
+        with self._lock:
+            if dataset_path is None:
+                self._datasets.clear()
+            else:
+                self._datasets.pop(dataset_path, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "datasets": len(self._datasets),
+                "files": sum(len(entry.files) for entry in self._datasets.values()),
+                "hits": self.hits,
+                "parses": self.parses,
+                "libyaml": _safe_loader().__name__ == "CSafeLoader" if is_loaded(yaml) else None,
+            }
@@ -0,0 +1,107 @@
+"""
+Table-name resolution index, built with the catalogue.
+
+Maps the names callers pass to 3_get_metadata / 4_get_data / 5_aggregate_data
+onto a CSV path or a partitioned table, without touching the filesystem per
+request. Accepted names, in resolution order:
+
+    1. Partitioned virtual tables (artpark/partitions.py), hyphen or underscore form
+    2. {name}.csv in the dataset dir, then with underscores -> hyphens, then
+       hyphens -> underscores
+    3. The same variants in subdirectories (sorted by name)
+    4. Fuzzy: a dataset-dir CSV whose stem contains the name (or vice versa),
+       ignoring case, hyphens and underscores
+
+Key behaviors:
+    - Every metadata-declared name is resolved once at build time
+    - A declared name matching several CSVs fuzzily is reported in
+      `ambiguous` (and on 2_get_tables) and resolves to the first, as before
+    - Undeclared names fall back to the same rules over the in-memory file lists
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from artpark.partitions import PartitionedTable
+
+
+Resolution = Union[str, PartitionedTable]
+
+
+def name_variants(table_name: str) -> List[str]:
+    """The name, its underscore -> hyphen form and its hyphen -> underscore form."""
+    return [table_name, table_name.replace("_", "-"), table_name.replace("-", "_")]
+
+
+def _squash(name: str) -> str:
+    return name.lower().replace("-", "").replace("_", "")
+
+
+class NameIndex:
+    """Resolution of table names to files or partition sets for one dataset directory."""
+
+    def __init__(
+        self,
+        dataset_path: str,
+        declared: Iterable[str] = (),
+        partitioned: Optional[Dict[str, PartitionedTable]] = None,
+    ):
+        self.dataset_path = dataset_path
+        self.partitioned: Dict[str, PartitionedTable] = dict(partitioned or {})
+        self._top: Dict[str, str] = {}
+        self._subdirs: List[Dict[str, str]] = []
+        self._fuzzy: List[Tuple[str, str]] = []
+        self.ambiguous: Dict[str, List[str]] = {}
+
+        for entry in sorted(os.listdir(dataset_path)):
+            path = os.path.join(dataset_path, entry)
+            if entry.endswith(".csv") and os.path.isfile(path):
+                stem = os.path.splitext(entry)[0]
+                self._top[stem] = path
+                self._fuzzy.append((_squash(stem), path))
+            elif os.path.isdir(path):
+                self._subdirs.append({
+                    os.path.splitext(sub_entry)[0]: os.path.join(path, sub_entry)
+                    for sub_entry in os.listdir(path) if sub_entry.endswith(".csv")
+                })
+
+        self._declared: Dict[str, Optional[str]] = {}
+        for table_name in declared:
+            if self.partition(table_name) is not None:
+                continue
+            path = self._exact(table_name)
+            if path is None:
+                matches = self._fuzzy_matches(table_name)
+                if len(matches) > 1:
+                    self.ambiguous[table_name] = [os.path.relpath(p, dataset_path) for p in matches]
+                path = matches[0] if matches else None
+            self._declared[table_name] = path
+
+    def _exact(self, table_name: str) -> Optional[str]:
+        # All variants within one directory before the next, subdirectories in name order
+        variants = name_variants(table_name)
+        for files in [self._top] + self._subdirs:
+            for variant in variants:
+                if variant in files:
+                    return files[variant]
+        return None
+
+    def _fuzzy_matches(self, table_name: str) -> List[str]:
+        normalized = _squash(table_name)
+        return [path for stem, path in self._fuzzy if normalized in stem or stem in normalized]
+
+    def partition(self, table_name: str) -> Optional[PartitionedTable]:
+        return self.partitioned.get(table_name) or self.partitioned.get(table_name.replace("_", "-"))
+
+    def csv_path(self, table_name: str) -> Optional[str]:
+        if table_name in self._declared:
+            return self._declared[table_name]
+        path = self._exact(table_name)
+        if path is None:
+            matches = self._fuzzy_matches(table_name)
+            path = matches[0] if matches else None
+        return path
+
+    def resolve(self, table_name: str) -> Optional[Resolution]:
+        """The partitioned table, else the CSV path, a name refers to (None if neither)."""
+        return self.partition(table_name) or self.csv_path(table_name)
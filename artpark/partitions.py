@@ -0,0 +1,138 @@
+"""
+Partitioned virtual tables over per-round and per-state CSV files.
+
+Some ARTPARK tables are split across files:
+
+    0055/
+      metadata.yaml          # declares nadcp-vaccination-progress
+      round1.csv ... round6.csv
+    0041/
+      bihar/bihar-village-livestock-pop-2019.csv
+      goa/goa-village-livestock-pop-2019.csv
+      ...
+
+Each split is exposed as one virtual table whose rows are the union of its
+files plus a synthetic partition column naming the file's round/state:
+
+    nadcp-vaccination-progress      partition.round = 1..6
+    village-livestock-pop-2019      partition.state = bihar, goa, ...
+
+Key behaviors:
+    - Round splits back a metadata-declared table that has no CSV of its own
+    - State splits are same-named tables in two or more subdirectories
+    - A filter on the partition column prunes files before any is opened; it is
+      then fully answered and dropped from the filters applied to the rows
+    - The union of the partitions' columns is read once and kept until any
+      partition changes, so validating a pruned query does not touch every file
+"""
+
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from artpark.cache import file_fingerprint
+from artpark.index import filter_keys
+
+
+PARTITION_PREFIX = "partition."
+STATE_PARTITION_COLUMN = PARTITION_PREFIX + "state"
+
+_NUMBERED_STEM = re.compile(r"^([a-z]+)[-_]?(\d+)$")
+
+
+class Partition:
+    """One file of a partitioned table and the partition column value its rows get."""
+
+    __slots__ = ("value", "csv_path")
+
+    def __init__(self, value, csv_path: str):
+        self.value = value
+        self.csv_path = csv_path
+
+
+class PartitionedTable:
+    """A virtual table: the union of its partitions' rows plus the partition column."""
+
+    def __init__(self, name: str, column: str, partitions: List[Partition]):
+        self.name = name
+        self.column = column
+        self.partitions = partitions
+        self._columns: Optional[Tuple[Tuple[int, int], List[str]]] = None
+
+    @property
+    def values(self) -> list:
+        return [p.value for p in self.partitions]
+
+    def fingerprint(self) -> Tuple[int, int]:
+        """(newest mtime_ns, total size) over every partition; changes if any file does."""
+        prints = [file_fingerprint(p.csv_path) for p in self.partitions]
+        return max(m for m, _ in prints), sum(s for _, s in prints)
+
+    def columns(self, read_columns: Callable[[str], List[str]]) -> List[str]:
+        """
+        Partition column followed by the union of the partitions' columns, where
+        read_columns(csv_path) gives one file's columns. Memoized per fingerprint.
+        """
+        fingerprint = self.fingerprint()
+        cached = self._columns
+        if cached is not None and cached[0] == fingerprint:
+            return list(cached[1])
+        columns = [self.column]
+        for partition in self.partitions:
+            columns += [c for c in read_columns(partition.csv_path) if c not in columns]
+        self._columns = (fingerprint, columns)
+        return list(columns)
+
+    def prune(self, filters: Optional[Dict[str, str]]) -> Tuple[List[Partition], Dict[str, str]]:
+        """Partitions that can match filters, and the filters left to apply to their rows."""
+        filters = dict(filters or {})
+        if self.column not in filters:
+            return list(self.partitions), filters
+        wanted = set(filter_keys(filters.pop(self.column)))
+        return [p for p in self.partitions if str(p.value).lower() in wanted], filters
+
+
+def _table_stem(name: str) -> str:
+    return name.lower().replace("_", "-")
+
+
+def find_partitioned_tables(dataset_path: str, declared: Iterable[str]) -> Dict[str, PartitionedTable]:
+    """Discover the partitioned tables of one dataset directory, keyed by table name."""
+    tables: Dict[str, PartitionedTable] = {}
+    entries = sorted(os.listdir(dataset_path)) if os.path.isdir(dataset_path) else []
+    stems = {
+        _table_stem(os.path.splitext(f)[0]): os.path.join(dataset_path, f)
+        for f in entries if f.endswith(".csv")
+    }
+
+    # Round splits: round1.csv, round2.csv, ... backing a declared table with no file of its own
+    groups: Dict[str, List[Tuple[int, str]]] = {}
+    for stem, path in stems.items():
+        match = _NUMBERED_STEM.match(stem)
+        if match:
+            groups.setdefault(match.group(1), []).append((int(match.group(2)), path))
+    groups = {prefix: members for prefix, members in groups.items() if len(members) > 1}
+    unbacked = [name for name in declared if _table_stem(name) not in stems]
+    if len(groups) == 1 and len(unbacked) == 1:
+        prefix, members = next(iter(groups.items()))
+        tables[unbacked[0]] = PartitionedTable(
+            unbacked[0], PARTITION_PREFIX + prefix,
+            [Partition(n, path) for n, path in sorted(members)],
+        )
+
+    # State splits: {state}/{state}-<table>.csv in two or more subdirectories
+    by_table: Dict[str, List[Partition]] = {}
+    for entry in entries:
+        sub_path = os.path.join(dataset_path, entry)
+        if not os.path.isdir(sub_path):
+            continue
+        state = _table_stem(entry)
+        for f in sorted(os.listdir(sub_path)):
+            stem = _table_stem(os.path.splitext(f)[0])
+            if f.endswith(".csv") and stem.startswith(state + "-"):
+                by_table.setdefault(stem[len(state) + 1:], []).append(Partition(entry, os.path.join(sub_path, f)))
+    for name, partitions in by_table.items():
+        if len(partitions) > 1 and name not in stems and name not in tables:
+            tables[name] = PartitionedTable(name, STATE_PARTITION_COLUMN, partitions)
+
+    return tables
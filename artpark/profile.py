@@ -0,0 +1,74 @@
+"""
+Table profiles for 3_get_metadata.
+
+A profile is everything get_table_schema derives from the table contents:
+row/column counts, dtypes, per-column distinct counts and the filter_values
+lists (with the _omitted note). It is built once per CSV content hash and
+persisted as JSON in the table store, so schema lookups never rescan data.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from artpark.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+PROFILE_VERSION = 1
+
+MAX_CATEGORICAL_VALUES = 50
+MAX_TEMPORAL_VALUES = 100
+
+
+def _filter_cap(col: str, dtype) -> int:
+    """Max values to list for a filterable column, or 0 if the column isn't listed."""
+    if dtype == "object" or "ID" in col or "name" in col.lower():
+        return MAX_CATEGORICAL_VALUES
+    lowered = col.lower()
+    if "year" in lowered or "round" in lowered or "date" in lowered:
+        return MAX_TEMPORAL_VALUES
+    return 0
+
+
+def build_profile(df: pd.DataFrame, dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Profile a table in one vectorized pass.
+
+    Distinct counts for every column come from a single df.nunique(); value
+    lists are only materialized for columns that fall under their cap.
+    dtypes overrides the reported dtype names -- the parsed dtypes of a table
+    whose cached copy was compacted (artpark/compact.py).
+    """
+    dtypes = {col: dtypes.get(col, str(dtype)) if dtypes else str(dtype) for col, dtype in df.dtypes.items()}
+    distinct_counts = {col: int(n) for col, n in df.nunique(dropna=True).items()}
+
+    filter_values: Dict[str, Any] = {}
+    omitted_columns = []
+    for col, dtype in dtypes.items():
+        cap = _filter_cap(col, dtype)
+        if not cap:
+            continue
+        n_unique = distinct_counts[col]
+        if 1 < n_unique <= cap:
+            filter_values[col] = sorted(df[col].dropna().unique().tolist())
+        elif n_unique > cap:
+            omitted_columns.append(f"{col} ({n_unique} unique values)")
+    if omitted_columns:
+        filter_values["_omitted"] = (
+            f"These columns have too many unique values to list: {', '.join(omitted_columns)}. "
+            f"You can still filter on them -- use values from the data rows returned by 4_get_data()."
+        )
+
+    return {
+        "profile_version": PROFILE_VERSION,
+        "csv_summary": {
+            "total_rows": len(df),
+            "total_columns": len(df.columns),
+            "columns": list(df.columns),
+            "dtypes": dtypes,
+            "distinct_counts": distinct_counts,
+        },
+        "filter_values": filter_values,
+    }
@@ -0,0 +1,137 @@
+"""
+Response cache in front of 3_get_metadata and 4_get_data.
+
+Agents repeat the same calls -- spot-checking numbers, retrying after a
+_hint -- so finished responses are kept and handed back as copies.
+
+Keys are normalized by the caller (see normalize_filters): filter values are
+lowercased, comma lists sorted and deduplicated, and filter order ignored.
+Each entry remembers the fingerprint of the files it was built from.
+
+Key behaviors:
+    - LRU bounded by entry count (ARTPARK_RESPONSE_CACHE_SIZE, default 1024)
+    - Entries expire after ARTPARK_RESPONSE_CACHE_TTL seconds (default 300; 0 disables the cache)
+    - A changed data or metadata file (different fingerprint) is a miss, never stale data
+    - Error responses and very large pages are not cached
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from observability.context import record
+
+
+DEFAULT_RESPONSE_ENTRIES = 1024
+DEFAULT_RESPONSE_TTL_SECONDS = 300.0
+MAX_CACHED_ROWS = 5_000
+
+
+def _row_count(value: Dict[str, Any]) -> int:
+    """Rows in a response page: data is a list of records or a columnar payload."""
+    if "rows_returned" in value:
+        return value["rows_returned"]
+    data = value.get("data") or ()
+    if isinstance(data, dict):
+        return max((len(column) for column in data.get("values", ())), default=0)
+    return len(data)
+
+
+class _Response:
+    __slots__ = ("value", "fingerprint", "expires")
+
+    def __init__(self, value: Dict[str, Any], fingerprint: Hashable, expires: float):
+        self.value = value
+        self.fingerprint = fingerprint
+        self.expires = expires
+
+
+class ResponseCache:
+    """Bounded, expiring map of normalized call key -> finished response."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        if max_entries is None:
+            try:
+                max_entries = int(os.environ.get("ARTPARK_RESPONSE_CACHE_SIZE", DEFAULT_RESPONSE_ENTRIES))
+            except ValueError:
+                max_entries = DEFAULT_RESPONSE_ENTRIES
+        if ttl_seconds is None:
+            try:
+                ttl_seconds = float(os.environ.get("ARTPARK_RESPONSE_CACHE_TTL", DEFAULT_RESPONSE_TTL_SECONDS))
+            except ValueError:
+                ttl_seconds = DEFAULT_RESPONSE_TTL_SECONDS
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, _Response]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable, fingerprint: Hashable) -> Optional[Dict[str, Any]]:
+        """The cached response for key if it is fresh and built from the same files."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            elif entry is not None and entry.fingerprint != fingerprint:
+                del self._entries[key]
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            hit_ratio = self.hits / (self.hits + self.misses)
+        record("response_cache.hit", entry is not None)
+        record("response_cache.hit_ratio", round(hit_ratio, 4))
+        return entry.value if entry is not None else None
+
+    def put(self, key: Hashable, fingerprint: Hashable, value: Dict[str, Any]) -> None:
+        if not self.enabled or "error" in value or _row_count(value) > MAX_CACHED_ROWS:
+            return
+        with self._lock:
+            self._entries[key] = _Response(value, fingerprint, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, dataset_ids: Optional[Iterable[str]] = None) -> None:
+        """Drop responses for these datasets (keys are (kind, dataset_id, ...)), or all of them."""
+        with self._lock:
+            if dataset_ids is None:
+                self._entries.clear()
+                return
+            dataset_ids = set(dataset_ids)
+            for key in [k for k in self._entries if k[1] in dataset_ids]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,125 @@
+"""
+Cached result sets and opaque cursors for paginated 4_get_data calls.
+
+The first call for a (table, normalized filters) pair records the matching row
+positions; follow-up pages decode a cursor and slice those positions, so each
+page costs O(page_size) instead of a re-read and re-filter.
+
+Key behaviors:
+    - Result sets live in a bounded LRU (ARTPARK_RESULT_SETS, default 256)
+    - Keys include the data file's (mtime, size), so a changed file never hits
+    - Cursors carry the same fingerprint and are rejected once the file changes
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from artpark.index import filter_keys
+from artpark.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+DEFAULT_RESULT_SETS = 256
+
+
+class CursorError(ValueError):
+    """Raised for cursors that are malformed, for another table, or expired."""
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Order-independent filter key: lowercased values, comma lists sorted and deduplicated."""
+    if not filters:
+        return ()
+    return tuple(sorted((col, tuple(sorted(set(filter_keys(value))))) for col, value in filters.items()))
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise CursorError(f"Invalid cursor: {e}") from None
+    if not isinstance(state, dict) or "offset" not in state or "fingerprint" not in state:
+        raise CursorError("Invalid cursor: missing fields")
+    return state
+
+
+class ResultSet:
+    """Matching row positions (None = every row) plus per-projection summary stats."""
+
+    __slots__ = ("positions", "total", "summary_stats")
+
+    def __init__(self, positions: Optional[np.ndarray], total: int):
+        self.positions = positions
+        self.total = total
+        self.summary_stats: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self.total if self.positions is None else len(self.positions)
+
+    def page(self, offset: int, size: int) -> np.ndarray:
+        if self.positions is None:
+            return np.arange(offset, min(offset + size, self.total))
+        return self.positions[offset:offset + size]
+
+
+class ResultSetCache:
+    """Bounded LRU of ResultSets keyed by (path, fingerprint, normalized filters)."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            try:
+                max_entries = int(os.environ.get("ARTPARK_RESULT_SETS", DEFAULT_RESULT_SETS))
+            except ValueError:
+                max_entries = DEFAULT_RESULT_SETS
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, ResultSet]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[ResultSet]:
+        with self._lock:
+            result_set = self._entries.get(key)
+            if result_set is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result_set
+
+    def put(self, key: Tuple, result_set: ResultSet) -> ResultSet:
+        with self._lock:
+            self._entries[key] = result_set
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result_set
+
+    def invalidate_dir(self, directory: str) -> None:
+        """Drop result sets for tables under directory (a reloaded dataset)."""
+        prefix = os.path.join(os.path.realpath(directory), "")
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
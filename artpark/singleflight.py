@@ -0,0 +1,97 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When several agents fire the same 3_get_metadata / 4_get_data call at once,
+the first caller (the leader) computes and the rest wait for its result
+instead of repeating the work. Table parses are coalesced the same way, so a
+burst costs at most one parse per distinct table.
+
+Keys are tuples whose first element names the kind of call ("query",
+"schema", "parse"); the kind labels the telemetry:
+
+    singleflight.{kind}.coalesced    on a waiter's span: it shared a result
+    singleflight.{kind}.shared_with  on the leader's span: how many waited
+
+Key behaviors:
+    - Only calls that overlap in time are coalesced; nothing is cached here
+    - A leader's exception is re-raised in every waiter
+    - Callers must not mutate a shared result (ARTPARKData hands out copies)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from observability.context import increment, record
+
+
+MAX_TRACKED_KEYS = 256
+TOP_KEYS = 10
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """In-flight calls by key, plus per-key coalescing counts for the busiest keys."""
+
+    def __init__(self, max_tracked_keys: int = MAX_TRACKED_KEYS):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._per_key: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._max_tracked_keys = max_tracked_keys
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return fn(), or the result of an identical call already in flight."""
+        kind = key[0] if isinstance(key, tuple) and key else "call"
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                self._per_key[key] = self._per_key.pop(key, 0) + 1
+                while len(self._per_key) > self._max_tracked_keys:
+                    self._per_key.popitem(last=False)
+
+        if not leader:
+            increment(f"singleflight.{kind}.coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        if call.waiters:
+            record(f"singleflight.{kind}.shared_with", call.waiters)
+        return call.result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            top = sorted(self._per_key.items(), key=lambda kv: kv[1], reverse=True)[:TOP_KEYS]
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "top_keys": [{"key": repr(key), "coalesced": n} for key, n in top],
+            }
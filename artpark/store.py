@@ -0,0 +1,284 @@
+"""
+Compiled columnar table store for ARTPARKData.
+
+Each CSV under publicdata/data/{dataset_id}/ (and its subdirectories) is compiled
+once into an uncompressed Arrow IPC (Feather v2) file named after the SHA-256 of
+the CSV bytes. Loading an artifact is a memory-mapped read -- numeric columns are
+zero-copy -- so restarts and fresh containers skip CSV parsing entirely.
+
+Layout:
+    .artpark_store/            # ARTPARK_STORE_DIR overrides the location
+      {sha256}.arrow           # Columnar table (needs pyarrow)
+      {sha256}.profile.json    # Table profile for 3_get_metadata (artpark/profile.py)
+
+Key behaviors:
+    - pyarrow is optional; without it every load falls back to pd.read_csv
+    - An artifact is only written if it round-trips to the exact CSV frame
+    - Editing a CSV changes its hash, so stale artifacts are simply never hit
+
+Usage:
+    python -m artpark.store [--data-dir DIR] [--store-dir DIR] [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from artpark.cache import file_fingerprint
+from artpark.lazy import lazy_import, module_available
+from artpark.profile import PROFILE_VERSION, build_profile
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+# Optional: without pyarrow every load falls back to pd.read_csv
+pa = lazy_import("pyarrow")
+feather = lazy_import("pyarrow.feather")
+
+
+ARTIFACT_SUFFIX = ".arrow"
+PROFILE_SUFFIX = ".profile.json"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def default_store_dir() -> str:
+    """ARTPARK_STORE_DIR, or .artpark_store/ at the repo root."""
+    env_dir = os.environ.get("ARTPARK_STORE_DIR")
+    if env_dir:
+        return env_dir
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".artpark_store")
+
+
+def read_csv(csv_path: str) -> pd.DataFrame:
+    """The canonical CSV parse every artifact must reproduce."""
+    return pd.read_csv(csv_path, low_memory=False)
+
+
+def find_csv_files_recursive(data_dir: str) -> List[str]:
+    """All CSV paths under data_dir/{dataset_id}/, including subdirectories."""
+    paths = []
+    if not os.path.isdir(data_dir):
+        return paths
+    for root, dirs, files in os.walk(data_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for f in sorted(files):
+            if f.endswith(".csv"):
+                paths.append(os.path.join(root, f))
+    return paths
+
+
+class TableStore:
+    """Content-addressed Arrow artifacts for CSV tables."""
+
+    def __init__(self, store_dir: Optional[str] = None):
+        self.store_dir = store_dir or default_store_dir()
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return module_available("pyarrow")
+
+    # =========================================================================
+    # Addressing
+    # =========================================================================
+
+    def content_hash(self, csv_path: str) -> str:
+        """SHA-256 of the CSV bytes, memoized per (mtime, size)."""
+        key = os.path.realpath(csv_path)
+        fingerprint = file_fingerprint(key)
+        with self._lock:
+            cached = self._hashes.get(key)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(key, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        with self._lock:
+            self._hashes[key] = (fingerprint, content_hash)
+        return content_hash
+
+    def artifact_path(self, csv_path: str) -> str:
+        return os.path.join(self.store_dir, self.content_hash(csv_path) + ARTIFACT_SUFFIX)
+
+    def has_artifact(self, csv_path: str) -> bool:
+        return self.available and os.path.exists(self.artifact_path(csv_path))
+
+    def profile_path(self, csv_path: str) -> str:
+        return os.path.join(self.store_dir, self.content_hash(csv_path) + PROFILE_SUFFIX)
+
+    # =========================================================================
+    # Profiles
+    # =========================================================================
+
+    def load_profile(self, csv_path: str) -> Optional[Dict[str, Any]]:
+        """Read the persisted profile for csv_path, or None if absent or outdated."""
+        path = self.profile_path(csv_path)
+        try:
+            with open(path, "r") as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if profile.get("profile_version") != PROFILE_VERSION:
+            return None
+        return profile
+
+    def save_profile(self, csv_path: str, profile: Dict[str, Any]) -> None:
+        """Persist a profile atomically; failures (read-only store) are ignored."""
+        path = self.profile_path(csv_path)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(profile, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # =========================================================================
+    # Load
+    # =========================================================================
+
+    def load(self, csv_path: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """Memory-map the compiled artifact for csv_path, or None if there is none."""
+        if not self.available:
+            return None
+        path = self.artifact_path(csv_path)
+        if not os.path.exists(path):
+            return None
+        table = feather.read_table(path, columns=columns, memory_map=True)
+        return _restore_missing(table.to_pandas(split_blocks=True))
+
+    def iter_batches(self, csv_path: str, columns: Optional[List[str]] = None) -> Optional[Iterator[pd.DataFrame]]:
+        """Record batches of the artifact in row order (lazily), or None if there is none."""
+        if not self.available:
+            return None
+        path = self.artifact_path(csv_path)
+        if not os.path.exists(path):
+            return None
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+
+        def batches() -> Iterator[pd.DataFrame]:
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if columns is not None:
+                    batch = batch.select(columns)
+                yield _restore_missing(batch.to_pandas())
+
+        return batches()
+
+    # =========================================================================
+    # Compile
+    # =========================================================================
+
+    def compile(self, csv_path: str, force: bool = False) -> Dict[str, Any]:
+        """Compile one CSV (profile + artifact). Returns a status record for logging."""
+        record: Dict[str, Any] = {"csv": csv_path}
+        start = time.perf_counter()
+        df: Optional[pd.DataFrame] = None
+
+        if force or self.load_profile(csv_path) is None:
+            try:
+                df = read_csv(csv_path)
+                self.save_profile(csv_path, build_profile(df))
+            except Exception as e:
+                record["profile_error"] = str(e)
+
+        if not self.available:
+            record["status"] = "skipped"
+            record["reason"] = "pyarrow not installed"
+            return record
+
+        path = self.artifact_path(csv_path)
+        record["artifact"] = path
+        if os.path.exists(path) and not force:
+            record["status"] = "cached"
+            return record
+
+        try:
+            if df is None:
+                df = read_csv(csv_path)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except Exception as e:
+            record["status"] = "skipped"
+            record["reason"] = f"not representable in Arrow: {e}"
+            return record
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+            roundtrip = _restore_missing(feather.read_table(tmp_path, memory_map=True).to_pandas())
+            pd.testing.assert_frame_equal(roundtrip, df, check_exact=True)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            record["status"] = "skipped"
+            record["reason"] = f"round-trip mismatch: {e}".splitlines()[0]
+            return record
+
+        os.replace(tmp_path, path)
+        record["status"] = "compiled"
+        record["rows"] = len(df)
+        record["seconds"] = round(time.perf_counter() - start, 3)
+        return record
+
+    def compile_dir(self, data_dir: str, force: bool = False) -> List[Dict[str, Any]]:
+        """Compile every CSV under data_dir."""
+        return [self.compile(p, force=force) for p in find_csv_files_recursive(data_dir)]
+
+
+def _restore_missing(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow hands back None for missing strings; pd.read_csv uses NaN."""
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object and series.isna().any():
+            df[col] = series.where(series.notna(), np.nan)
+    return df
+
+
+# =========================================================================
+# CLI
+# =========================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    default_data_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "publicdata", "data"
+    )
+    parser = argparse.ArgumentParser(description="Compile ARTPARK CSV tables into Arrow artifacts.")
+    parser.add_argument("--data-dir", default=default_data_dir, help="publicdata/data directory")
+    parser.add_argument("--store-dir", default=None, help="artifact directory (default: ARTPARK_STORE_DIR or .artpark_store/)")
+    parser.add_argument("--force", action="store_true", help="recompile even if an artifact exists")
+    args = parser.parse_args(argv)
+
+    store = TableStore(args.store_dir)
+    if not store.available:
+        print("pyarrow is not installed; nothing to compile.", file=sys.stderr)
+        return 1
+
+    records = store.compile_dir(args.data_dir, force=args.force)
+    for r in records:
+        rel = os.path.relpath(r["csv"], args.data_dir)
+        detail = r.get("reason") or (f"{r['rows']} rows in {r['seconds']}s" if "rows" in r else "")
+        print(f"  {r['status']:<9} {rel} {detail}".rstrip(), file=sys.stderr)
+
+    counts: Dict[str, int] = {}
+    for r in records:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"{len(records)} tables: {summary or 'none found'} -> {store.store_dir}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
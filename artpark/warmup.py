@@ -0,0 +1,150 @@
+"""
+Startup warm-up: compile, profile and load every table before taking traffic.
+
+Without it the first 3_get_metadata / 4_get_data call on each table pays the
+CSV parse and profile scan. Warm-up runs in two phases:
+
+    1. prepare   each CSV is compiled to an Arrow artifact and profiled, in
+                 parallel across a process pool; results persist in the store
+    2. load      the server process loads every table into its table cache and
+                 reads its profile -- now memory-mapped reads, on threads
+
+Readiness tracks progress for the /ready route: "warming" until warm-up has
+finished, then "ready". /health stays a cheap liveness check.
+
+Configuration:
+    ARTPARK_WARMUP           1 to warm up at startup (default 0)
+    ARTPARK_WARMUP_WORKERS   Prepare processes (default: CPU count)
+
+Key behaviors:
+    - A table that fails to prepare or load is logged and skipped; the server
+      still becomes ready
+    - Per-table timings are returned (and logged by artpark_server.py)
+    - Prepare processes are spawned: warm-up runs on a thread of the live
+      server, and forking a multi-threaded process can deadlock
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from artpark.store import TableStore, find_csv_files_recursive
+
+
+LOAD_THREADS = 4
+
+
+def _prepare(store_dir: str, csv_path: str) -> Dict[str, Any]:
+    """Runs in a worker process: compile + profile one CSV into the store."""
+    start = time.perf_counter()
+    record = TableStore(store_dir).compile(csv_path)
+    record["prepare_seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+class Readiness:
+    """Warm-up state shared with the /ready route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.status = "starting"
+        self.tables_total = 0
+        self.tables_done = 0
+        self.started: Optional[float] = None
+        self.seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def begin(self, tables_total: int) -> None:
+        with self._lock:
+            self.status = "warming"
+            self.tables_total = tables_total
+            self.tables_done = 0
+            self.started = time.perf_counter()
+
+    def table_done(self) -> None:
+        with self._lock:
+            self.tables_done += 1
+
+    def mark_ready(self) -> None:
+        with self._lock:
+            if self.started is not None:
+                self.seconds = round(time.perf_counter() - self.started, 3)
+            self.status = "ready"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": self.status,
+                "tables_total": self.tables_total,
+                "tables_done": self.tables_done,
+                "warmup_seconds": self.seconds,
+            }
+
+
+def warm_up(
+    client,
+    readiness: Optional[Readiness] = None,
+    workers: Optional[int] = None,
+    on_table: Optional[Callable[[Dict[str, Any]], None]] = None,
+    use_processes: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Prepare every CSV under client.data_dir in parallel, then load each into
+    client's caches. Returns one timing record per table; on_table is called
+    with each as it finishes. readiness (if given) is marked ready at the end.
+    """
+    readiness = readiness or Readiness()
+    if workers is None:
+        try:
+            workers = int(os.environ.get("ARTPARK_WARMUP_WORKERS", 0)) or os.cpu_count() or 1
+        except ValueError:
+            workers = os.cpu_count() or 1
+
+    client.get_catalogue()
+    csv_paths = find_csv_files_recursive(client.data_dir)
+    readiness.begin(len(csv_paths))
+    records: Dict[str, Dict[str, Any]] = {p: {"csv": p} for p in csv_paths}
+
+    # Phase 1: compile + profile into the store, off the server process
+    store_dir = client.store_dir
+    try:
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max(1, workers), mp_context=multiprocessing.get_context("spawn"))
+        else:
+            executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        with executor:
+            futures = {p: executor.submit(_prepare, store_dir, p) for p in csv_paths}
+            for path, future in futures.items():
+                try:
+                    prepared = future.result()
+                    records[path]["status"] = prepared.get("status")
+                    records[path]["prepare_seconds"] = prepared["prepare_seconds"]
+                except Exception as e:
+                    records[path]["prepare_error"] = str(e)
+    except Exception as e:
+        # No process pool (restricted sandbox, broken pool): phase 2 still warms everything
+        for record in records.values():
+            record.setdefault("prepare_error", str(e))
+
+    # Phase 2: load tables and profiles into this process's caches
+    def load(path: str) -> None:
+        record = records[path]
+        try:
+            record.update(client.warm_table(path))
+        except Exception as e:
+            record["load_error"] = str(e)
+        readiness.table_done()
+        if on_table is not None:
+            on_table(record)
+
+    with ThreadPoolExecutor(max_workers=LOAD_THREADS, thread_name_prefix="artpark-warmup") as executor:
+        list(executor.map(load, csv_paths))
+
+    readiness.mark_ready()
+    return [records[p] for p in csv_paths]
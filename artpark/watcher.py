@@ -0,0 +1,142 @@
+"""
+File-system watcher that hot-reloads changed datasets.
+
+Watches publicdata/data and reports which dataset directories changed, so
+ARTPARKData can re-scan only those and drop their cached tables, profiles
+and responses. A `git submodule update` takes effect without a restart.
+
+Modes:
+    inotify   watchfiles (Rust notify -> inotify on Linux), when installed
+    polling   stat() snapshot of every file, compared every
+              ARTPARK_WATCH_POLL_SECONDS (default 2)
+
+Key behaviors:
+    - Changes are batched: one callback per burst with the set of dataset IDs
+    - Datasets that appear or disappear are reported like any other change
+    - Callback errors are logged and never stop the watcher
+"""
+
+import os
+import sys
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+try:
+    from watchfiles import watch as _watch_changes
+except ImportError:  # pragma: no cover - exercised only without watchfiles
+    _watch_changes = None
+
+
+DEFAULT_POLL_SECONDS = 2.0
+
+Snapshot = Dict[str, Dict[str, Tuple[int, int]]]
+
+
+def snapshot(data_dir: str) -> Snapshot:
+    """{dataset_id: {relative file path: (mtime_ns, size)}} for every dataset directory."""
+    result: Snapshot = {}
+    if not os.path.isdir(data_dir):
+        return result
+    for entry in sorted(os.listdir(data_dir)):
+        dataset_path = os.path.join(data_dir, entry)
+        if entry.startswith(".") or not os.path.isdir(dataset_path):
+            continue
+        files = {}
+        for root, dirs, names in os.walk(dataset_path):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files[os.path.relpath(path, dataset_path)] = (st.st_mtime_ns, st.st_size)
+        result[entry] = files
+    return result
+
+
+def changed_datasets(before: Snapshot, after: Snapshot) -> Set[str]:
+    return {d for d in set(before) | set(after) if before.get(d) != after.get(d)}
+
+
+class CatalogueWatcher:
+    """Background thread calling on_change(dataset_ids) whenever dataset directories change."""
+
+    def __init__(
+        self,
+        data_dir: str,
+        on_change: Callable[[Set[str]], None],
+        poll_seconds: Optional[float] = None,
+        use_inotify: Optional[bool] = None,
+    ):
+        if poll_seconds is None:
+            try:
+                poll_seconds = float(os.environ.get("ARTPARK_WATCH_POLL_SECONDS", DEFAULT_POLL_SECONDS))
+            except ValueError:
+                poll_seconds = DEFAULT_POLL_SECONDS
+        if use_inotify is None:
+            use_inotify = _watch_changes is not None
+        self.data_dir = os.path.realpath(data_dir)
+        self.on_change = on_change
+        self.poll_seconds = poll_seconds
+        self.mode = "inotify" if use_inotify and _watch_changes is not None else "polling"
+        self.reloads = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: Optional[Snapshot] = None
+
+    def start(self) -> "CatalogueWatcher":
+        if self._thread is None:
+            if self.mode == "polling":
+                self._snapshot = snapshot(self.data_dir)
+            self._thread = threading.Thread(target=self._run, name="artpark-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def poll_once(self) -> Set[str]:
+        """Compare against the previous snapshot and report changed datasets (polling mode)."""
+        current = snapshot(self.data_dir)
+        changed = changed_datasets(self._snapshot or {}, current) if self._snapshot is not None else set()
+        self._snapshot = current
+        if changed:
+            self._notify(changed)
+        return changed
+
+    def _dataset_ids(self, paths: Iterable[str]) -> Set[str]:
+        ids = set()
+        for path in paths:
+            rel = os.path.relpath(os.path.realpath(path), self.data_dir)
+            first = rel.split(os.sep, 1)[0]
+            if first not in (".", "..") and not first.startswith("."):
+                ids.add(first)
+        return ids
+
+    def _notify(self, dataset_ids: Set[str]) -> None:
+        try:
+            self.on_change(dataset_ids)
+            self.reloads += 1
+        except Exception as e:
+            print(f"[WATCHER] reload of {sorted(dataset_ids)} failed: {e}", file=sys.stderr)
+
+    def _run(self) -> None:
+        if self.mode == "inotify":
+            try:
+                for changes in _watch_changes(self.data_dir, stop_event=self._stop, recursive=True):
+                    dataset_ids = self._dataset_ids(path for _, path in changes)
+                    if dataset_ids:
+                        self._notify(dataset_ids)
+                return
+            except Exception as e:
+                if self._stop.is_set():
+                    return
+                print(f"[WATCHER] inotify unavailable ({e}); falling back to polling", file=sys.stderr)
+                self.mode = "polling"
+                self._snapshot = snapshot(self.data_dir)
+        while not self._stop.wait(self.poll_seconds):
+            self.poll_once()
@@ -0,0 +1,185 @@
+"""
+Bounded worker pool for MCP tool bodies.
+
+Tool functions do blocking pandas I/O and compute. Running them on this pool
+keeps the event loop -- and with it /health -- responsive, caps how many run
+at once, and bounds how many may wait: beyond max_workers + max_queue calls
+in flight, new calls are refused immediately instead of piling up.
+
+Configuration:
+    ARTPARK_WORKERS        Concurrent tool calls (default 4)
+    ARTPARK_WORKER_QUEUE   Calls allowed to wait for a worker (default 32)
+    ARTPARK_WORKER_KIND    "thread" (default) or "process"
+
+Key behaviors:
+    - Thread workers share ARTPARKData's caches; process workers each hold
+      their own (more parallel compute, more memory, colder caches)
+    - Process workers are spawned, never forked from the threaded server; they
+      look module-level functions up by module and name, importing the module
+      from its file when its name is not importable (`fastmcp run` loads
+      artpark_server.py as "server_module")
+    - Each call records pool.queue_depth (calls waiting ahead of it) and
+      pool.wait_ms (time until a worker picked it up) on the tool span
+"""
+
+import asyncio
+import contextvars
+import functools
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from observability.context import record
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE = 32
+WORKER_KINDS = ("thread", "process")
+
+
+class PoolSaturated(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _timed_call(fn: Callable[..., Any], args: tuple, kwargs: dict) -> Tuple[float, Any]:
+    """Runs in the worker: (wall-clock start time, result)."""
+    return time.time(), fn(*args, **kwargs)
+
+
+class _FunctionRef:
+    """Picklable stand-in for a module-level function, resolved again in the worker process."""
+
+    __slots__ = ("module", "path", "qualname")
+
+    def __init__(self, module: str, path: Optional[str], qualname: str):
+        self.module = module
+        self.path = path
+        self.qualname = qualname
+
+    @classmethod
+    def of(cls, fn: Callable[..., Any]) -> Any:
+        """A reference to fn if it is a module-level function of a loaded module, else fn itself."""
+        module = sys.modules.get(getattr(fn, "__module__", None) or "")
+        qualname = getattr(fn, "__qualname__", "")
+        if module is None or getattr(module, qualname, None) is not fn:
+            return fn
+        return cls(module.__name__, getattr(module, "__file__", None), qualname)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        module = sys.modules.get(self.module)
+        if module is None:
+            try:
+                module = importlib.import_module(self.module)
+            except ImportError:
+                if self.path is None:
+                    raise
+                spec = importlib.util.spec_from_file_location(self.module, self.path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[self.module] = module
+                spec.loader.exec_module(module)
+        return getattr(module, self.qualname)(*args, **kwargs)
+
+
+class WorkerPool:
+    """Thread or process executor with a concurrency limit and a bounded queue."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        kind: Optional[str] = None,
+    ):
+        self.max_workers = max(1, max_workers or _env_int("ARTPARK_WORKERS", DEFAULT_WORKERS))
+        self.max_queue = max(0, max_queue if max_queue is not None else _env_int("ARTPARK_WORKER_QUEUE", DEFAULT_QUEUE))
+        self.kind = kind or os.environ.get("ARTPARK_WORKER_KIND", "thread")
+        if self.kind not in WORKER_KINDS:
+            raise ValueError(f"Unknown worker kind '{self.kind}'; expected one of {WORKER_KINDS}")
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="artpark-tool")
+            return self._executor
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on a worker; raises PoolSaturated if the queue is full."""
+        executor = self._get_executor()
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PoolSaturated(
+                    f"Server busy: {self._in_flight} tool calls in flight "
+                    f"({self.max_workers} workers, queue of {self.max_queue})."
+                )
+            queue_depth = max(0, self._in_flight - self.max_workers)
+            self._in_flight += 1
+        record("pool.queue_depth", queue_depth)
+
+        submitted = time.time()
+        if self.kind == "process":
+            fn = _FunctionRef.of(fn)
+        call = functools.partial(_timed_call, fn, args, kwargs)
+        if self.kind == "thread":
+            # Carry the caller's context (span attributes) into the worker thread
+            call = functools.partial(contextvars.copy_context().run, call)
+        future = executor.submit(call)
+        # Released when the work finishes, even if the awaiting call is cancelled
+        future.add_done_callback(self._release)
+        started, result = await asyncio.wrap_future(future)
+
+        wait = max(0.0, started - submitted)
+        with self._lock:
+            self.completed += 1
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        record("pool.wait_ms", round(wait * 1000, 2))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.max_workers),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(1000 * self.total_wait_seconds / self.completed, 2) if self.completed else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait_seconds, 2),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -8,10 +8,17 @@ Source: https://github.com/dsih-artpark/publicdata
 Docs: https://publicdata.readthedocs.io
 """
 
+import functools
+import os
 import sys
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 from fastmcp import FastMCP
+from fastmcp.server.lifespan import lifespan
 from artpark.client import artpark_data
+from artpark.warmup import Readiness, warm_up
+from artpark.workers import PoolSaturated, WorkerPool
+from observability.metrics import CONTENT_TYPE, REGISTRY
 from observability.telemetry import TelemetryMiddleware
 
 
@@ -20,10 +27,79 @@ def log(msg: str):
     print(msg, file=sys.stderr)
 
 
+# =========================================================================
+# Warm-up (ARTPARK_WARMUP=1): /ready returns 503 until every table is loaded
+# =========================================================================
+
+WARMUP_ENABLED = os.environ.get("ARTPARK_WARMUP", "0") == "1"
+WATCH_ENABLED = os.environ.get("ARTPARK_WATCH", "1") != "0"
+readiness = Readiness()
+
+
+def _log_warm_table(record: Dict[str, Any]) -> None:
+    rel = os.path.relpath(record["csv"], artpark_data.data_dir)
+    error = record.get("prepare_error") or record.get("load_error")
+    detail = f"error: {error}" if error else (
+        f"{record.get('rows', '?')} rows, prepare {record.get('prepare_seconds', '-')}s, "
+        f"load {record.get('load_seconds', '-')}s, profile {record.get('profile_seconds', '-')}s"
+    )
+    log(f"[WARMUP] {rel}: {detail}")
+
+
+def _run_warm_up() -> None:
+    records = warm_up(artpark_data, readiness, on_table=_log_warm_table)
+    log(f"[WARMUP] {len(records)} tables ready in {readiness.seconds}s")
+
+
+@lifespan
+async def warm_up_lifespan(server):
+    """
+    Whenever the server starts (script or `fastmcp run`): start warm-up in the
+    background (or report ready at once) and hot-reload datasets while it runs.
+    """
+    if readiness.status == "starting":
+        if WARMUP_ENABLED:
+            readiness.begin(0)
+            threading.Thread(target=_run_warm_up, name="artpark-warmup", daemon=True).start()
+        else:
+            artpark_data.get_catalogue()
+            readiness.mark_ready()
+    # Hot-reload datasets when publicdata/data changes (e.g. a submodule update)
+    watching = WATCH_ENABLED and artpark_data.watcher_stats() is None
+    if watching:
+        log(f"[WATCHER] watching {artpark_data.data_dir} ({artpark_data.start_watching().mode})")
+    try:
+        yield {}
+    finally:
+        if watching:
+            artpark_data.stop_watching()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("ARTPARK Public Data Server")
+mcp = FastMCP("ARTPARK Public Data Server", lifespan=warm_up_lifespan)
 mcp.add_middleware(TelemetryMiddleware())
 
+# Tool bodies run here, off the event loop (ARTPARK_WORKERS / _WORKER_QUEUE / _WORKER_KIND)
+worker_pool = WorkerPool()
+
+
+def tool(name: str):
+    """
+    Register fn as MCP tool `name`, executed on worker_pool so slow table reads
+    never block the event loop or /health. fn itself stays a plain sync function.
+    """
+    def register(fn):
+        @functools.wraps(fn)
+        async def run(*args, **kwargs):
+            try:
+                return await worker_pool.run(fn, *args, **kwargs)
+            except PoolSaturated as e:
+                return {"error": str(e), "hint": "The server is busy. Retry this call in a few seconds."}
+
+        mcp.tool(name=name)(run)
+        return fn
+    return register
+
 
 VALID_DATASETS = [
     "0015", "0034", "0041", "0055", "0059", "0086", "0087", "0089",
@@ -94,7 +170,7 @@ DATASET_INFO = {
 # Tool 1: Discover datasets
 # =========================================================================
 
-@mcp.tool(name="1_know_about_artpark_data")
+@tool("1_know_about_artpark_data")
 def know_about_artpark_data() -> Dict[str, Any]:
     """
     ============================================================
@@ -136,6 +212,8 @@ def know_about_artpark_data() -> Dict[str, Any]:
             "2. 2_get_tables(dataset_id) -> list tables",
             "3. 3_get_metadata(dataset_id, table_name) -> get schema + filter values (MANDATORY before step 4)",
             "4. 4_get_data(dataset_id, table_name, filters) -> fetch data (MUST use values from step 3)",
+            "   or 5_aggregate_data(dataset_id, table_name, aggregations, group_by, filters) -> totals/averages by group",
+            "   or 6_join_tables(left..., right..., left_on, right_on) -> combine two tables by location",
         ],
         "rules": [
             "MUST NOT skip 3_get_metadata() -- column names and filter values differ per table",
@@ -151,7 +229,7 @@ def know_about_artpark_data() -> Dict[str, Any]:
 # Tool 2: List tables in a dataset
 # =========================================================================
 
-@mcp.tool(name="2_get_tables")
+@tool("2_get_tables")
 def get_tables(
     dataset_id: str,
     user_query: Optional[str] = None,
@@ -170,6 +248,10 @@ def get_tables(
     Each dataset may have multiple tables. For example, dataset 0041 (Livestock Census)
     has 4 tables: ka-district, ka-village, mh-district, and all-india data.
 
+    Tables split across files (0055 rounds, 0041 state subdirectories) are also listed under
+    partitioned_tables and can be queried whole; filter on their partition column
+    (partition.round / partition.state) to read only the files you need.
+
     After this, pick the matching table and call 3_get_metadata().
 
     Args:
@@ -200,7 +282,7 @@ def get_tables(
 # Tool 3: Get table metadata (schema + filter values)
 # =========================================================================
 
-@mcp.tool(name="3_get_metadata")
+@tool("3_get_metadata")
 def get_metadata(
     dataset_id: str,
     table_name: str,
@@ -241,12 +323,17 @@ def get_metadata(
 # Tool 4: Fetch data
 # =========================================================================
 
-@mcp.tool(name="4_get_data")
+@tool("4_get_data")
 def get_data(
     dataset_id: str,
     table_name: str,
     filters: Optional[Dict[str, str]] = None,
     limit: int = 50,
+    columns: Optional[List[str]] = None,
+    stream: bool = False,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    format: str = "records",
 ) -> Dict[str, Any]:
     """
     ============================================================
@@ -270,11 +357,27 @@ def get_data(
                  Comma-separated values filter for multiple matches.
                  Example: {"location.admin2.name": "Bengaluru Urban", "metadata.ISOWeek": "2023-W01"}
         limit: Max rows to return (default 50). Use higher values for complete data.
+        columns: Optional list of column names (from 3_get_metadata()) to return.
+                 Omit to return every column. Use this for wide tables to keep responses small;
+                 summary_stats then covers only these columns.
+        stream: If true, stop reading as soon as `limit` matching rows are found (fast first look).
+                Totals are then lower bounds and summary_stats are estimates (see totals_are_lower_bounds).
+                Leave false when you need exact counts or statistics.
+        cursor: To get the next page, pass the `next_cursor` value from the previous response
+                (with the same dataset_id and table_name). Filters and columns are taken from the cursor.
+        page_size: Rows per page when paginating (default: limit).
+        format: "records" (default) returns data as one object per row. "columnar" returns
+                data as {"columns": [...], "values": [one array per column], "dictionaries": {...}};
+                columns listed in dictionaries hold indexes into that list. Much smaller for
+                many rows or wide tables -- use it when fetching hundreds of rows or more.
     """
     if dataset_id not in VALID_DATASETS:
         return {"error": f"Unknown dataset: {dataset_id}", "valid_datasets": VALID_DATASETS}
 
-    result = artpark_data.query_table(dataset_id, table_name, filters=filters, limit=limit)
+    result = artpark_data.query_table(
+        dataset_id, table_name, filters=filters, limit=limit, columns=columns, stream=stream,
+        cursor=cursor, page_size=page_size, format=format,
+    )
 
     # If no data found, hint to retry
     if isinstance(result, dict) and result.get("total_rows_after_filter", 1) == 0:
@@ -284,10 +387,133 @@ def get_data(
             "2) Remove optional filters one at a time. "
             "3) The breakdown you need may already appear in the response without that filter."
         )
+    elif isinstance(result, dict) and result.get("next_cursor"):
+        result["_next_page"] = (
+            "More rows match. Call 4_get_data(dataset_id, table_name, cursor=next_cursor) for the next page "
+            "instead of raising limit."
+        )
 
     return result
 
 
+# =========================================================================
+# Tool 5: Aggregate data server-side
+# =========================================================================
+
+@tool("5_aggregate_data")
+def aggregate_data(
+    dataset_id: str,
+    table_name: str,
+    aggregations: Dict[str, Any],
+    group_by: Optional[List[str]] = None,
+    filters: Optional[Dict[str, str]] = None,
+    limit: int = 1000,
+) -> Dict[str, Any]:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata() before this. No exceptions.
+    - You MUST use ONLY column names and filter values from 3_get_metadata().
+    - PREFER this over 4_get_data() with a huge limit whenever you need totals, averages,
+      counts or rankings -- the server does the math and returns only the grouped result.
+    ============================================================
+
+    Step 4 (alternative): Group and aggregate a table on the server.
+
+    Args:
+        dataset_id: Dataset ID (e.g., "0015", "0041")
+        table_name: Table name (e.g., "ka-dengue-daily-summary")
+        aggregations: Column -> function or list of functions.
+                      Functions: sum, mean, min, max, count, nunique.
+                      Example: {"daily.positive.total": ["sum", "mean"], "metadata.date": "nunique"}
+        group_by: Columns to group by (omit for whole-table totals).
+                  Example: ["location.admin2.name", "metadata.year"]
+        filters: Same syntax as 4_get_data(). Comma-separated values filter for multiple matches.
+        limit: Max groups to return (default 1000).
+
+    Returns rows with the group_by columns, row_count, and one "{column}.{function}" value per aggregation.
+    """
+    if dataset_id not in VALID_DATASETS:
+        return {"error": f"Unknown dataset: {dataset_id}", "valid_datasets": VALID_DATASETS}
+
+    result = artpark_data.aggregate_table(
+        dataset_id, table_name, aggregations, group_by=group_by, filters=filters, limit=limit,
+    )
+
+    if isinstance(result, dict) and result.get("total_rows_after_filter", 1) == 0:
+        result["_hint"] = (
+            "No rows matched the filters, so there is nothing to aggregate. "
+            "Check filter values against 3_get_metadata() output."
+        )
+    return result
+
+
+# =========================================================================
+# Tool 6: Join two tables on location keys
+# =========================================================================
+
+@tool("6_join_tables")
+def join_tables(
+    left_dataset_id: str,
+    left_table_name: str,
+    right_dataset_id: str,
+    right_table_name: str,
+    left_on: List[str],
+    right_on: List[str],
+    left_filters: Optional[Dict[str, str]] = None,
+    right_filters: Optional[Dict[str, str]] = None,
+    left_columns: Optional[List[str]] = None,
+    right_columns: Optional[List[str]] = None,
+    how: str = "inner",
+    limit: int = 500,
+) -> Dict[str, Any]:
+    """
+    ============================================================
+    RULES (MUST follow exactly):
+    - You MUST have called 3_get_metadata() for BOTH tables before this.
+    - You MUST use ONLY column names and filter values from 3_get_metadata().
+    - PREFER this over fetching two tables with 4_get_data() and matching rows yourself.
+    ============================================================
+
+    Step 4 (alternative): Join two tables on administrative location columns.
+
+    Location keys are normalized before matching: case, spaces and punctuation are
+    ignored, and names are mapped to LGD region IDs (dataset 0034), so a name column
+    (location.admin2.name) can join an ID column (location.admin2.ID).
+
+    Args:
+        left_dataset_id / right_dataset_id: Dataset IDs (e.g., "0015", "0041")
+        left_table_name / right_table_name: Table names from 2_get_tables()
+        left_on / right_on: Key columns, paired in order.
+                            Example: left_on=["location.admin2.name"], right_on=["location.admin2.name"]
+        left_filters / right_filters: Same syntax as 4_get_data(), applied before joining.
+        left_columns / right_columns: Columns to return from each side (default: all).
+        how: "inner" (only matching rows) or "left" (every left row). Default "inner".
+        limit: Max joined rows to return (default 500).
+
+    Returns the joined rows, total_rows, and unmatched_left_keys (left key values with no match).
+    Overlapping column names get ".left" / ".right" suffixes.
+    """
+    for dataset_id in (left_dataset_id, right_dataset_id):
+        if dataset_id not in VALID_DATASETS:
+            return {"error": f"Unknown dataset: {dataset_id}", "valid_datasets": VALID_DATASETS}
+
+    result = artpark_data.join_tables(
+        left_dataset_id, left_table_name, right_dataset_id, right_table_name,
+        left_on, right_on,
+        left_filters=left_filters, right_filters=right_filters,
+        left_columns=left_columns, right_columns=right_columns,
+        how=how, limit=limit,
+    )
+
+    if isinstance(result, dict) and result.get("total_rows") == 0:
+        result["_hint"] = (
+            "No rows matched. Check unmatched_left_keys against the right table's values "
+            "(3_get_metadata()), and that both key columns are at the same admin level."
+        )
+    return result
+
+
 # =========================================================================
 # Health check (useful for Docker, load balancers, uptime monitoring)
 # =========================================================================
@@ -297,14 +523,75 @@ async def health_check(request):
     """Health check endpoint for Docker/orchestration health probes."""
     from starlette.responses import JSONResponse
     catalogue = artpark_data.get_catalogue()
+    cache = artpark_data.cache_stats()
     return JSONResponse({
         "status": "healthy",
         "server": "ARTPARK Public Data MCP Server",
         "datasets": len(catalogue),
-        "tools": 4,
+        "tools": 6,
+        "table_cache": {k: v for k, v in cache.items() if k != "tables"},
+        "worker_pool": worker_pool.stats(),
+        "single_flight": artpark_data.single_flight_stats(),
+        "response_cache": artpark_data.response_cache_stats(),
+        "metadata": artpark_data.metadata_stats(),
+        "memory": {k: v for k, v in artpark_data.memory_report().items() if k != "tables"},
+        "watcher": artpark_data.watcher_stats(),
+        "readiness": readiness.stats(),
     })
 
 
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready_check(request):
+    """Readiness probe: 200 once warm-up has finished, 503 while tables are still loading."""
+    from starlette.responses import JSONResponse
+    return JSONResponse(readiness.stats(), status_code=200 if readiness.ready else 503)
+
+
+# =========================================================================
+# Metrics (Prometheus text format; tool counters/histograms in observability/metrics.py)
+# =========================================================================
+
+def _server_metrics():
+    """Cache, worker pool and table memory figures, read from their owners at scrape time."""
+    table = artpark_data.cache_stats()
+    responses = artpark_data.response_cache_stats()
+    metadata = artpark_data.metadata_stats()
+    pool = worker_pool.stats()
+    memory = artpark_data.memory_report()
+    caches = {
+        "table": (table["hits"], table["misses"]),
+        "response": (responses["hits"], responses["misses"]),
+        "metadata": (metadata["hits"], metadata["parses"]),
+    }
+    return [
+        ("artpark_cache_hits_total", "counter", "Cache hits by cache.",
+         [({"cache": name}, hits) for name, (hits, _) in caches.items()]),
+        ("artpark_cache_misses_total", "counter", "Cache misses by cache (metadata: files parsed).",
+         [({"cache": name}, misses) for name, (_, misses) in caches.items()]),
+        ("artpark_cache_hit_ratio", "gauge", "Hits / (hits + misses) since start, by cache.",
+         [({"cache": name}, hits / (hits + misses) if hits + misses else 0.0) for name, (hits, misses) in caches.items()]),
+        ("artpark_table_cache_bytes", "gauge", "Bytes held by the table cache.", [({}, table["used_bytes"])]),
+        ("artpark_table_cache_entries", "gauge", "Tables held by the table cache.", [({}, table["entries"])]),
+        ("artpark_table_cache_evictions_total", "counter", "Tables evicted from the table cache.", [({}, table["evictions"])]),
+        ("artpark_loaded_table_bytes", "gauge", "Bytes of loaded tables as parsed and as held after dtype compaction.",
+         [({"state": "parsed"}, memory["before_bytes"]), ({"state": "compact"}, memory["after_bytes"])]),
+        ("artpark_worker_pool_in_flight", "gauge", "Tool bodies running on the worker pool.", [({}, pool["in_flight"])]),
+        ("artpark_worker_pool_queued", "gauge", "Tool bodies waiting for a worker.", [({}, pool["queued"])]),
+        ("artpark_worker_pool_rejected_total", "counter", "Calls turned away because the pool queue was full.",
+         [({}, pool["rejected"])]),
+    ]
+
+
+REGISTRY.add_collector(_server_metrics)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request):
+    """Prometheus scrape endpoint: per-tool requests/latency/output size, loads, caches, memory."""
+    from starlette.responses import Response
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 # =========================================================================
 # Entrypoint
 # =========================================================================
@@ -315,16 +602,34 @@ if __name__ == "__main__":
     n_datasets = len(catalogue)
     n_tables = sum(len(info["tables"]) for info in catalogue.values())
 
+    # Compile CSVs into the columnar store (no-op for tables already compiled);
+    # with warm-up enabled the lifespan does this in parallel instead
+    store_status = "disabled (ARTPARK_COMPILE_ON_STARTUP=0)"
+    if WARMUP_ENABLED:
+        store_status = "compiled during warm-up"
+    elif os.environ.get("ARTPARK_COMPILE_ON_STARTUP", "1") != "0":
+        records = artpark_data.compile_tables()
+        n_ready = sum(1 for r in records if r["status"] in ("compiled", "cached"))
+        store_status = f"{n_ready}/{len(records)} CSVs compiled"
+
+    watch_status = "started with the server" if WATCH_ENABLED else "disabled (ARTPARK_WATCH=0)"
+
     log("\n" + "=" * 70)
     log("ARTPARK Public Data MCP Server")
     log("=" * 70)
     log(f"Datasets:   {n_datasets} ({n_tables} tables)")
-    log(f"Tools:      4 (1_know → 2_tables → 3_metadata → 4_data)")
+    log(f"Store:      {store_status}")
+    log(f"Watcher:    {watch_status}")
+    log(f"Warm-up:    {'background (ARTPARK_WARMUP=1)' if WARMUP_ENABLED else 'disabled'}")
+    log(f"Workers:    {worker_pool.max_workers} {worker_pool.kind}s, queue {worker_pool.max_queue}")
+    log(f"Tools:      6 (1_know → 2_tables → 3_metadata → 4_data | 5_aggregate | 6_join)")
     log(f"Framework:  FastMCP 3.0 + OpenTelemetry")
     log(f"Data:       https://github.com/dsih-artpark/publicdata")
     log("-" * 70)
     log(f"MCP:        http://localhost:8000/mcp")
     log(f"Health:     http://localhost:8000/health")
+    log(f"Ready:      http://localhost:8000/ready")
+    log(f"Metrics:    http://localhost:8000/metrics")
     log("=" * 70 + "\n")
 
     mcp.run(transport="http", port=8000)
@@ -0,0 +1,138 @@
+"""
+Synthetic scaled copies of ARTPARK datasets for benchmarking.
+
+Mirrors publicdata/data/{id}/ -- every CSV, metadata.yaml and subdirectory --
+into <out>/scale-<N>/data/{id}/ with each CSV holding N times the source rows.
+The first pass is the source rows in order; every further pass is the same rows
+reshuffled, so value distributions (district names, dates, counts) and column
+cardinalities match the original at every scale. Generation is deterministic
+(seeded per file) and skipped when an up-to-date copy already exists.
+
+Usage:
+    python benchmarks/datagen.py [--scales 1,10,100] [--datasets 0015,0034] [--out .bench_data]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import zlib
+from typing import Any, Dict, Iterable, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(REPO_ROOT, "publicdata", "data")
+DEFAULT_OUT = os.path.join(REPO_ROOT, ".bench_data")
+DEFAULT_DATASETS = ("0015", "0034")
+DEFAULT_SCALES = (1, 10, 100)
+STAMP_FILE = ".datagen.json"
+
+
+def _records(path: str) -> List[str]:
+    """(header, then one CSV-encoded line per record) -- quoted newlines stay inside their record."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    lines = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            writer.writerow(row)
+            lines.append(out.getvalue())
+            out.seek(0)
+            out.truncate()
+    return lines
+
+
+def scale_csv(src: str, dst: str, scale: int) -> int:
+    """Write src with its rows repeated scale times to dst; returns the data row count."""
+    lines = _records(src)
+    header, rows = lines[:1], lines[1:]
+    rng = random.Random(zlib.crc32(os.path.basename(src).encode()))
+    with open(dst, "w", encoding="utf-8", newline="") as out:
+        out.writelines(header)
+        out.writelines(rows)
+        order = list(range(len(rows)))
+        for _ in range(scale - 1):
+            rng.shuffle(order)
+            out.writelines(rows[i] for i in order)
+    return len(rows) * scale
+
+
+def _source_fingerprint(dataset_dirs: Iterable[str]) -> List[List[Any]]:
+    fingerprint = []
+    for dataset_dir in dataset_dirs:
+        for root, dirs, files in os.walk(dataset_dir):
+            dirs.sort()
+            for name in sorted(files):
+                st = os.stat(os.path.join(root, name))
+                fingerprint.append([os.path.relpath(os.path.join(root, name), os.path.dirname(dataset_dir)), st.st_size, st.st_mtime_ns])
+    return fingerprint
+
+
+def generate(
+    scale: int,
+    out_dir: str = DEFAULT_OUT,
+    datasets: Iterable[str] = DEFAULT_DATASETS,
+    source_dir: str = SOURCE_DIR,
+    force: bool = False,
+) -> str:
+    """
+    Build (or reuse) the scale-N copy of datasets; returns its data directory,
+    usable as ARTPARKData(data_dir=...) or ARTPARK_DATA_DIR.
+    """
+    datasets = list(datasets)
+    dataset_dirs = [os.path.join(source_dir, ds) for ds in datasets]
+    missing = [d for d in dataset_dirs if not os.path.isdir(d)]
+    if missing:
+        raise FileNotFoundError(f"Source dataset(s) not found: {', '.join(missing)} (is the publicdata submodule checked out?)")
+
+    root = os.path.join(out_dir, f"scale-{scale}")
+    data_dir = os.path.join(root, "data")
+    stamp_path = os.path.join(root, STAMP_FILE)
+    expected = {"scale": scale, "datasets": datasets, "source": _source_fingerprint(dataset_dirs)}
+    if not force and os.path.isfile(stamp_path):
+        with open(stamp_path) as f:
+            stamp = json.load(f)
+        if {k: stamp.get(k) for k in expected} == expected:
+            return data_dir
+
+    if os.path.isdir(root):
+        shutil.rmtree(root)
+    rows: Dict[str, int] = {}
+    for ds, dataset_dir in zip(datasets, dataset_dirs):
+        for src_root, dirs, files in os.walk(dataset_dir):
+            dirs.sort()
+            dst_root = os.path.join(data_dir, ds, os.path.relpath(src_root, dataset_dir))
+            os.makedirs(dst_root, exist_ok=True)
+            for name in sorted(files):
+                src, dst = os.path.join(src_root, name), os.path.join(dst_root, name)
+                if name.endswith(".csv"):
+                    rows[os.path.relpath(dst, data_dir)] = scale_csv(src, dst, scale)
+                else:
+                    shutil.copy2(src, dst)
+    with open(stamp_path, "w") as f:
+        json.dump(dict(expected, rows=rows), f, indent=2)
+    return data_dir
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate scaled synthetic copies of ARTPARK datasets.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="comma-separated row multipliers")
+    parser.add_argument("--datasets", default=",".join(DEFAULT_DATASETS), help="comma-separated dataset ids")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output root (default .bench_data/)")
+    parser.add_argument("--force", action="store_true", help="regenerate even if an up-to-date copy exists")
+    args = parser.parse_args(argv)
+
+    for scale in (int(s) for s in args.scales.split(",")):
+        data_dir = generate(scale, args.out, args.datasets.split(","), force=args.force)
+        with open(os.path.join(os.path.dirname(data_dir), STAMP_FILE)) as f:
+            rows = json.load(f)["rows"]
+        for path, count in sorted(rows.items()):
+            print(f"scale {scale:>4}  {path:<48} {count:>12,} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
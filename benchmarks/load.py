@@ -0,0 +1,357 @@
+"""
+Multi-session load test of the /mcp endpoint of a local server replica.
+
+Starts artpark_server.mcp over the HTTP transport on a free localhost port (or
+targets --url) and drives N concurrent simulated agent sessions, each with its
+own MCP session, through the enforced workflow until --duration runs out:
+
+    1_know_about_artpark_data -> 2_get_tables -> 3_get_metadata -> 4_get_data
+
+Each workflow picks a dataset and table at random and builds 4_get_data
+filters from that call's 3_get_metadata filter_values, at a selectivity drawn
+from SELECTIVITY_MIX:
+
+    none     no filter (scan, first --limit rows)
+    broad    one value of the lowest-cardinality column (e.g. a state)
+    narrow   one value of the highest-cardinality column (e.g. a district)
+    multi    MULTI_VALUES comma-separated values of one column
+
+Reports throughput (calls/s, workflows/s), p50/p95/p99 latency and error rate
+per tool, the most frequent errors, and the server's RSS sampled over time.
+Passing several session counts (--sessions 1,4,16,64) runs one level after
+another against the same server and marks the saturation point: the first
+level whose throughput gains less than SATURATION_GAIN over the best so far.
+Everything runs on localhost; no network access is needed.
+
+Usage:
+    python benchmarks/load.py [--sessions 1,4,16,64] [--duration 30] [--json]
+    python benchmarks/load.py --url http://localhost:8000/mcp --server-pid 1234
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TOOLS = ("1_know_about_artpark_data", "2_get_tables", "3_get_metadata", "4_get_data")
+SELECTIVITY_MIX = {"none": 1, "broad": 2, "narrow": 4, "multi": 2}
+MULTI_VALUES = 3
+SATURATION_GAIN = 0.05
+SERVER_START_TIMEOUT = 120
+
+_SERVER = (
+    "import artpark_server; "
+    "artpark_server.mcp.run(transport='http', host='127.0.0.1', port={port}, show_banner=False)"
+)
+
+
+# =========================================================================
+# Workflow
+# =========================================================================
+
+def choose_filters(filter_values: Dict[str, Any], selectivity: str, rng: random.Random) -> Optional[Dict[str, str]]:
+    """4_get_data filters of the given selectivity, from a 3_get_metadata filter_values map."""
+    columns = {col: values for col, values in filter_values.items() if col != "_omitted" and values}
+    if selectivity == "none" or not columns:
+        return None
+    by_cardinality = sorted(columns, key=lambda col: len(columns[col]))
+    if selectivity == "broad":
+        col = by_cardinality[0]
+        return {col: str(rng.choice(columns[col]))}
+    if selectivity == "narrow":
+        col = by_cardinality[-1]
+        return {col: str(rng.choice(columns[col]))}
+    col = rng.choice(by_cardinality)
+    values = rng.sample(columns[col], min(MULTI_VALUES, len(columns[col])))
+    return {col: ",".join(str(v) for v in values)}
+
+
+class Recorder:
+    """Per-tool latencies and errors of one load level."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {name: [] for name in TOOLS}
+        self.errors: Dict[str, int] = {name: 0 for name in TOOLS}
+        self.messages: Dict[str, int] = {}
+        self.workflows = 0
+
+    def record(self, tool: str, seconds: float, error: Optional[str]) -> None:
+        self.latencies[tool].append(seconds * 1000)
+        if error:
+            self.errors[tool] += 1
+            key = f"{tool}: {error[:80]}"
+            self.messages[key] = self.messages.get(key, 0) + 1
+
+
+async def _call(client, recorder: Recorder, tool: str, arguments: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+    """One tool call; returns its structured result, or None when it failed."""
+    start = time.perf_counter()
+    try:
+        result = await client.call_tool(tool, arguments, timeout=timeout, raise_on_error=False)
+    except Exception as e:  # transport errors, timeouts
+        recorder.record(tool, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+        return None
+    content = result.structured_content if isinstance(result.structured_content, dict) else {}
+    error = None
+    if result.is_error:
+        error = str(result.content[0].text if result.content else "tool error")
+    elif "error" in content:
+        error = str(content["error"])
+    recorder.record(tool, time.perf_counter() - start, error)
+    return None if error else content
+
+
+async def run_session(client, recorder: Recorder, deadline: float, rng: random.Random,
+                      limit: int = 50, timeout: float = 60.0, datasets: Optional[List[str]] = None) -> None:
+    """Run workflows on one connected client until deadline (time.monotonic())."""
+    selectivities = list(SELECTIVITY_MIX)
+    weights = list(SELECTIVITY_MIX.values())
+    while time.monotonic() < deadline:
+        know = await _call(client, recorder, "1_know_about_artpark_data", {}, timeout)
+        if know is None:
+            continue
+        dataset_id = rng.choice(datasets or sorted(know["datasets"]))
+        tables = await _call(client, recorder, "2_get_tables", {"dataset_id": dataset_id, "user_query": "load test"}, timeout)
+        if not tables or not tables.get("tables"):
+            continue
+        names = [t["name"] for t in tables["tables"]] + [t["name"] for t in tables.get("partitioned_tables", [])]
+        table_name = rng.choice(names)
+        schema = await _call(client, recorder, "3_get_metadata", {"dataset_id": dataset_id, "table_name": table_name}, timeout)
+        if schema is None:
+            continue
+        selectivity = rng.choices(selectivities, weights)[0]
+        arguments = {"dataset_id": dataset_id, "table_name": table_name, "limit": limit}
+        filters = choose_filters(schema.get("filter_values") or {}, selectivity, rng)
+        if filters:
+            arguments["filters"] = filters
+        if await _call(client, recorder, "4_get_data", arguments, timeout) is not None:
+            recorder.workflows += 1
+
+
+# =========================================================================
+# Server process and RSS sampling
+# =========================================================================
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of pid in MB (Linux /proc, else ps), None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True, check=True)
+        return int(out.stdout.strip()) / 1024
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+class RssSampler(threading.Thread):
+    """Samples a process's RSS every interval seconds: [(seconds since start, MB)]."""
+
+    def __init__(self, pid: int, interval: float):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples: List[List[float]] = []
+        self._halt = threading.Event()
+        self._start_time = time.monotonic()
+
+    def run(self) -> None:
+        while not self._halt.is_set():
+            rss = process_rss_mb(self.pid)
+            if rss is not None:
+                self.samples.append([round(time.monotonic() - self._start_time, 1), round(rss, 1)])
+            self._halt.wait(self.interval)
+
+    def stop(self) -> List[List[float]]:
+        self._halt.set()
+        self.join()
+        return self.samples
+
+
+def start_server(log_path: str) -> Tuple[subprocess.Popen, str]:
+    """Launch artpark_server.mcp on a free port; returns (process, /mcp url) once /health answers."""
+    port = _free_port()
+    env = dict(os.environ, ARTPARK_WATCH="0")
+    log = open(log_path, "w")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _SERVER.format(port=port)],
+        cwd=REPO_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}; see {log_path}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=2):
+                return proc, f"http://127.0.0.1:{port}/mcp"
+        except OSError:
+            time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError(f"Server did not answer /health within {SERVER_START_TIMEOUT}s; see {log_path}")
+
+
+# =========================================================================
+# Load levels and report
+# =========================================================================
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))], 1)
+
+
+def summarize(recorder: Recorder, sessions: int, elapsed: float, rss: List[List[float]]) -> Dict[str, Any]:
+    tools = {}
+    for name in TOOLS:
+        samples = recorder.latencies[name]
+        tools[name] = {
+            "calls": len(samples),
+            "errors": recorder.errors[name],
+            "error_rate": round(recorder.errors[name] / len(samples), 4) if samples else 0.0,
+            "p50_ms": percentile(samples, 50),
+            "p95_ms": percentile(samples, 95),
+            "p99_ms": percentile(samples, 99),
+        }
+    calls = sum(t["calls"] for t in tools.values())
+    errors = sum(t["errors"] for t in tools.values())
+    return {
+        "sessions": sessions,
+        "seconds": round(elapsed, 1),
+        "calls": calls,
+        "workflows": recorder.workflows,
+        "calls_per_second": round(calls / elapsed, 1) if elapsed else 0.0,
+        "workflows_per_second": round(recorder.workflows / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+        "tools": tools,
+        "top_errors": dict(sorted(recorder.messages.items(), key=lambda kv: -kv[1])[:5]),
+        "peak_rss_mb": max((mb for _, mb in rss), default=None),
+        "rss_mb": rss,
+    }
+
+
+def saturation_level(levels: List[Dict[str, Any]]) -> Optional[int]:
+    """Session count of the first level whose throughput gains < SATURATION_GAIN over the best before it."""
+    best = None
+    for level in levels:
+        throughput = level["calls_per_second"]
+        if best is not None and throughput < best * (1 + SATURATION_GAIN):
+            return level["sessions"]
+        best = throughput if best is None else max(best, throughput)
+    return None
+
+
+async def run_level(url: str, sessions: int, duration: float, seed: int, limit: int,
+                    timeout: float, datasets: Optional[List[str]]) -> Recorder:
+    from fastmcp import Client
+
+    recorder = Recorder()
+    deadline = time.monotonic() + duration
+
+    async def session(i: int) -> None:
+        async with Client(url, timeout=timeout) as client:
+            await run_session(client, recorder, deadline, random.Random(seed + i), limit, timeout, datasets)
+
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    return recorder
+
+
+def run(url: str, session_levels: List[int], duration: float, server_pid: Optional[int] = None,
+        sample_seconds: float = 1.0, seed: int = 0, limit: int = 50, timeout: float = 60.0,
+        datasets: Optional[List[str]] = None) -> Dict[str, Any]:
+    levels = []
+    for sessions in session_levels:
+        sampler = RssSampler(server_pid, sample_seconds) if server_pid else None
+        if sampler:
+            sampler.start()
+        start = time.monotonic()
+        recorder = asyncio.run(run_level(url, sessions, duration, seed, limit, timeout, datasets))
+        elapsed = time.monotonic() - start
+        levels.append(summarize(recorder, sessions, elapsed, sampler.stop() if sampler else []))
+    return {"url": url, "duration": duration, "levels": levels, "saturation_sessions": saturation_level(levels)}
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    for level in report["levels"]:
+        rss = f"{level['peak_rss_mb']:.0f} MB peak" if level["peak_rss_mb"] is not None else "RSS n/a"
+        print(f"\n{level['sessions']} sessions, {level['seconds']}s: {level['calls_per_second']} calls/s, "
+              f"{level['workflows_per_second']} workflows/s, errors {100 * level['error_rate']:.2f}%, {rss}")
+        print(f"  {'tool':<28} {'calls':>7} {'err %':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+        for name, t in level["tools"].items():
+            print(f"  {name:<28} {t['calls']:>7} {100 * t['error_rate']:>7.2f} "
+                  f"{t['p50_ms'] if t['p50_ms'] is not None else '-':>8} "
+                  f"{t['p95_ms'] if t['p95_ms'] is not None else '-':>8} "
+                  f"{t['p99_ms'] if t['p99_ms'] is not None else '-':>8}")
+        for message, count in level["top_errors"].items():
+            print(f"  {count:>5} x {message}")
+        if level["rss_mb"]:
+            print("  rss MB over time: " + " ".join(f"{t:g}s={mb:.0f}" for t, mb in level["rss_mb"]))
+    print()
+    rows = [(lvl["sessions"], lvl["calls_per_second"], lvl["tools"]["4_get_data"]["p95_ms"]) for lvl in report["levels"]]
+    if len(rows) > 1:
+        print("sessions  calls/s  4_get_data p95")
+        for sessions, throughput, p95 in rows:
+            marker = "  <- saturation" if sessions == report["saturation_sessions"] else ""
+            print(f"{sessions:>8} {throughput:>8} {p95 if p95 is not None else '-':>15}{marker}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent agent-session load test of the /mcp endpoint.")
+    parser.add_argument("--sessions", default="1,4,16", help="comma-separated concurrent session counts (default 1,4,16)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per session count (default 30)")
+    parser.add_argument("--datasets", default=None, help="comma-separated dataset ids (default: all from step 1)")
+    parser.add_argument("--limit", type=int, default=50, help="4_get_data limit (default 50)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-call timeout in seconds (default 60)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for dataset/table/filter choices")
+    parser.add_argument("--sample-seconds", type=float, default=1.0, help="server RSS sampling interval (default 1)")
+    parser.add_argument("--url", default=None, help="target an already running server instead of starting one")
+    parser.add_argument("--server-pid", type=int, default=None, help="pid of the --url server, for RSS sampling")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    proc = None
+    url, pid = args.url, args.server_pid
+    if url is None:
+        log_path = os.path.join(tempfile.gettempdir(), "artpark-load-server.log")
+        proc, url = start_server(log_path)
+        pid = proc.pid
+        print(f"Server started at {url} (pid {pid}, log {log_path})", file=sys.stderr)
+    try:
+        report = run(
+            url, [int(s) for s in args.sessions.split(",")], args.duration, pid, args.sample_seconds,
+            args.seed, args.limit, args.timeout, args.datasets.split(",") if args.datasets else None,
+        )
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
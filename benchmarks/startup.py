@@ -0,0 +1,134 @@
+"""
+Cold-start benchmark: import time and time-to-first-response per tool.
+
+Every measurement runs in a fresh interpreter, the way a newly scaled replica
+starts: `import artpark_server`, then one call of a single tool. Reports the
+median over --runs and fails (exit 1) when a median exceeds its budget.
+
+Budgets (milliseconds, medians):
+    import            IMPORT_BUDGET_MS; also checks pandas/numpy/pyarrow
+                      were NOT imported by `import artpark_server`
+    first response    FIRST_RESPONSE_BUDGET_MS[tool] -- import excluded
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--json] [--budget-scale 1.5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = 4000
+FIRST_RESPONSE_BUDGET_MS = {
+    "1_know_about_artpark_data": 250,
+    "2_get_tables": 1000,
+    "3_get_metadata": 3000,
+    "4_get_data": 3000,
+    "5_aggregate_data": 3000,
+    "6_join_tables": 3000,
+}
+# Must stay out of `import artpark_server` (deferred until the first data touch)
+DEFERRED_MODULES = ("pandas", "numpy", "pyarrow")
+
+# One representative call per tool, against the smallest dataset
+TOOL_CALLS = {
+    "1_know_about_artpark_data": "know_about_artpark_data()",
+    "2_get_tables": "get_tables('0087')",
+    "3_get_metadata": "get_metadata('0087', 'seromonitoring')",
+    "4_get_data": "get_data('0087', 'seromonitoring', filters={'state.name': 'KARNATAKA'}, limit=10)",
+    "5_aggregate_data": "aggregate_data('0087', 'seromonitoring', aggregations={'state.name': 'count'}, group_by=['state.name'])",
+    "6_join_tables": (
+        "join_tables('0087', 'seromonitoring', '0089', 'serosurveillance', "
+        "left_on=['state.name'], right_on=['state.name'], limit=5)"
+    ),
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import artpark_server
+imported = time.perf_counter()
+deferred = [m for m in {deferred!r} if m in sys.modules]
+result = {call}
+done = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_response_ms": (done - imported) * 1000,
+    "eager_modules": deferred,
+    "error": result.get("error") if isinstance(result, dict) else None,
+}}))
+"""
+
+
+def probe(tool: str) -> Dict[str, Any]:
+    """Run one cold import + tool call in a fresh interpreter."""
+    code = _PROBE.format(deferred=DEFERRED_MODULES, call="artpark_server." + TOOL_CALLS[tool])
+    env = dict(os.environ, ARTPARK_WATCH="0", ARTPARK_WARMUP="0", PYTHONDONTWRITEBYTECODE="1")
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(runs: int, budget_scale: float = 1.0) -> Dict[str, Any]:
+    import_ms: List[float] = []
+    tools: Dict[str, Dict[str, Any]] = {}
+    eager = set()
+    for tool in TOOL_CALLS:
+        samples = [probe(tool) for _ in range(runs)]
+        import_ms += [s["import_ms"] for s in samples]
+        eager.update(m for s in samples for m in s["eager_modules"])
+        median = statistics.median(s["first_response_ms"] for s in samples)
+        budget = FIRST_RESPONSE_BUDGET_MS[tool] * budget_scale
+        tools[tool] = {
+            "first_response_ms": round(median, 1),
+            "budget_ms": round(budget, 1),
+            "ok": median <= budget and not samples[-1]["error"],
+            "error": samples[-1]["error"],
+        }
+    import_median = statistics.median(import_ms)
+    import_budget = IMPORT_BUDGET_MS * budget_scale
+    return {
+        "runs": runs,
+        "import": {
+            "import_ms": round(import_median, 1),
+            "budget_ms": round(import_budget, 1),
+            "eager_modules": sorted(eager),
+            "ok": import_median <= import_budget and not eager,
+        },
+        "tools": tools,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import and first-response benchmark.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per tool (default 5)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="multiply every budget (slow CI machines)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.budget_scale)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        imp = report["import"]
+        print(f"{'import artpark_server':<28} {imp['import_ms']:>9.1f} ms  (budget {imp['budget_ms']:.0f})"
+              f"  {'ok' if imp['ok'] else 'OVER'}")
+        if imp["eager_modules"]:
+            print(f"  imported eagerly: {', '.join(imp['eager_modules'])}")
+        for tool, r in report["tools"].items():
+            status = "ok" if r["ok"] else ("ERROR " + str(r["error"]) if r["error"] else "OVER")
+            print(f"{tool:<28} {r['first_response_ms']:>9.1f} ms  (budget {r['budget_ms']:.0f})  {status}")
+    ok = report["import"]["ok"] and all(r["ok"] for r in report["tools"].values())
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
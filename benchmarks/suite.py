@@ -0,0 +1,260 @@
+"""
+Scaled benchmark suite: latency, peak RSS and bytes out for the data tools.
+
+For every scale (1x/10x/100x rows of 0015 and 0034, generated by
+benchmarks/datagen.py) a fresh interpreter imports artpark_server against the
+synthetic data directory and times each case:
+
+    tool:1_know_about_artpark_data
+    tool:2_get_tables[id]      client:get_dataset_tables[id]
+    tool:3_get_metadata[id]    client:get_table_schema[id]
+    tool:4_get_data[id]        client:query_table[id]
+
+4_get_data filters on the first filter value 3_get_metadata offers for the
+dataset's first table. The first call of a case is reported as first_ms (the
+first case to touch a table pays its load); p50/p95 cover the --runs calls
+after it. The response cache is disabled so repeated calls measure the work,
+not a cache hit.
+
+Results are compared with benchmarks/baselines.json; a case whose p50 or p95
+exceeds its baseline by more than LATENCY_TOLERANCE (and LATENCY_FLOOR_MS), a
+scale whose peak RSS exceeds its baseline by more than RSS_TOLERANCE, or a
+response that grew by more than BYTES_TOLERANCE fails the run (exit 1). So
+does a scale or case with no baseline (listed as NOT CHECKED): an unchecked
+run is not a pass. Record baselines on the reference machine with
+--update-baselines (`make bench-baselines`), which always exits 0.
+
+Usage:
+    python benchmarks/suite.py [--scales 1,10,100] [--runs 20] [--json] [--update-baselines]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.datagen import DEFAULT_DATASETS, DEFAULT_OUT, DEFAULT_SCALES, generate  # noqa: E402
+
+BASELINES_PATH = os.path.join(REPO_ROOT, "benchmarks", "baselines.json")
+LATENCY_TOLERANCE = 0.5   # p50/p95 may be up to 50% slower than baseline
+LATENCY_FLOOR_MS = 2.0    # ... or this much slower, whichever is larger (sub-ms cases are noise)
+RSS_TOLERANCE = 0.25
+BYTES_TOLERANCE = 0.10
+GET_DATA_LIMIT = 100
+
+
+# =========================================================================
+# Child: runs inside a fresh interpreter pointed at one scale's data
+# =========================================================================
+
+def _bytes_out(result: Any) -> int:
+    return len(json.dumps(result, default=str).encode())
+
+
+def _peak_rss_bytes() -> int:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def _time_case(fn: Callable[[], Any], runs: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = fn()
+    first_ms = (time.perf_counter() - start) * 1000
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "first_ms": round(first_ms, 2),
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[min(len(samples) - 1, int(0.95 * len(samples)))], 2),
+        "bytes_out": _bytes_out(result),
+        "error": result.get("error") if isinstance(result, dict) else None,
+        "_result": result,
+    }
+
+
+def _first_filter(schema: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    for col, values in (schema.get("filter_values") or {}).items():
+        if col != "_omitted" and values:
+            return {col: str(values[0])}
+    return None
+
+
+def run_child(datasets: List[str], runs: int) -> Dict[str, Any]:
+    """Time every case against ARTPARK_DATA_DIR; called in the benchmark's child process."""
+    import artpark_server
+    client = artpark_server.artpark_data
+
+    cases: Dict[str, Dict[str, Any]] = {}
+
+    def case(name: str, fn: Callable[[], Any]) -> Any:
+        cases[name] = _time_case(fn, runs)
+        return cases[name].pop("_result")
+
+    case("tool:1_know_about_artpark_data", artpark_server.know_about_artpark_data)
+    for ds in datasets:
+        tables = case(f"tool:2_get_tables[{ds}]", lambda: artpark_server.get_tables(ds, user_query="benchmark"))
+        case(f"client:get_dataset_tables[{ds}]", lambda: client.get_dataset_tables(ds))
+        table = tables["tables"][0]["name"]
+        schema = case(f"tool:3_get_metadata[{ds}]", lambda: artpark_server.get_metadata(ds, table))
+        case(f"client:get_table_schema[{ds}]", lambda: client.get_table_schema(ds, table))
+        filters = _first_filter(schema)
+        case(f"tool:4_get_data[{ds}]", lambda: artpark_server.get_data(ds, table, filters=filters, limit=GET_DATA_LIMIT))
+        case(f"client:query_table[{ds}]", lambda: client.query_table(ds, table, filters=filters, limit=GET_DATA_LIMIT))
+    return {"peak_rss_mb": round(_peak_rss_bytes() / (1024 * 1024), 1), "cases": cases}
+
+
+# =========================================================================
+# Parent: generate data, run one child per scale, compare with baselines
+# =========================================================================
+
+def measure_scale(scale: int, datasets: List[str], runs: int, out_dir: str) -> Dict[str, Any]:
+    data_dir = generate(scale, out_dir, datasets)
+    with tempfile.TemporaryDirectory(prefix="artpark-bench-store-") as store_dir:
+        env = dict(
+            os.environ,
+            ARTPARK_DATA_DIR=data_dir,
+            ARTPARK_STORE_DIR=store_dir,
+            ARTPARK_RESPONSE_CACHE_TTL="0",
+            ARTPARK_WATCH="0",
+            ARTPARK_WARMUP="0",
+        )
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", "--runs", str(runs), "--datasets", ",".join(datasets)],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _slower(value: float, baseline: float) -> bool:
+    return value > baseline * (1 + LATENCY_TOLERANCE) and value > baseline + LATENCY_FLOOR_MS
+
+
+def compare(results: Dict[str, Any], baselines: Dict[str, Any]) -> List[str]:
+    """Regressions of results against baselines (both keyed by scale), as messages."""
+    regressions = []
+    for scale, measured in results.items():
+        base = baselines.get(scale)
+        if not base:
+            continue
+        if measured["peak_rss_mb"] > base["peak_rss_mb"] * (1 + RSS_TOLERANCE):
+            regressions.append(f"scale {scale}: peak RSS {measured['peak_rss_mb']} MB (baseline {base['peak_rss_mb']})")
+        for name, case in measured["cases"].items():
+            ref = base["cases"].get(name)
+            if ref is None:
+                continue
+            if case["error"]:
+                regressions.append(f"scale {scale} {name}: error {case['error']}")
+            for stat in ("p50_ms", "p95_ms"):
+                if _slower(case[stat], ref[stat]):
+                    regressions.append(f"scale {scale} {name}: {stat} {case[stat]} (baseline {ref[stat]})")
+            if case["bytes_out"] > ref["bytes_out"] * (1 + BYTES_TOLERANCE):
+                regressions.append(f"scale {scale} {name}: bytes_out {case['bytes_out']} (baseline {ref['bytes_out']})")
+    return regressions
+
+
+def missing_baselines(results: Dict[str, Any], baselines: Dict[str, Any]) -> List[str]:
+    """Scales and cases in results that compare() had no baseline to check against, as messages."""
+    missing = []
+    for scale, measured in results.items():
+        base = baselines.get(scale)
+        if not base:
+            missing.append(f"scale {scale}: no baseline recorded")
+            continue
+        missing += [
+            f"scale {scale} {name}: no baseline recorded"
+            for name in measured["cases"] if name not in base["cases"]
+        ]
+    return missing
+
+
+def load_baselines(path: str) -> Dict[str, Any]:
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get("scales", {})
+
+
+def save_baselines(path: str, results: Dict[str, Any]) -> None:
+    scales = load_baselines(path)
+    for scale, measured in results.items():
+        scales[scale] = {
+            "peak_rss_mb": measured["peak_rss_mb"],
+            "cases": {
+                name: {k: case[k] for k in ("p50_ms", "p95_ms", "bytes_out")}
+                for name, case in measured["cases"].items()
+            },
+        }
+    with open(path, "w") as f:
+        json.dump({"scales": dict(sorted(scales.items(), key=lambda kv: int(kv[0])))}, f, indent=2)
+        f.write("\n")
+
+
+def _print_report(results: Dict[str, Any], baselines: Dict[str, Any]) -> None:
+    for scale, measured in results.items():
+        base = baselines.get(scale, {}).get("cases", {})
+        print(f"\nscale {scale}x  peak RSS {measured['peak_rss_mb']:.1f} MB"
+              + ("" if scale in baselines else "  (no baseline)"))
+        print(f"  {'case':<38} {'first':>9} {'p50':>9} {'p95':>9} {'base p95':>9} {'bytes out':>11}")
+        for name, case in measured["cases"].items():
+            ref = base.get(name, {}).get("p95_ms")
+            print(f"  {name:<38} {case['first_ms']:>9.2f} {case['p50_ms']:>9.2f} {case['p95_ms']:>9.2f} "
+                  f"{ref if ref is not None else '-':>9} {case['bytes_out']:>11,}"
+                  + (f"  ERROR {case['error']}" if case["error"] else ""))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scaled latency / memory / bytes-out benchmark.")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="comma-separated row multipliers")
+    parser.add_argument("--datasets", default=",".join(DEFAULT_DATASETS), help="comma-separated dataset ids")
+    parser.add_argument("--runs", type=int, default=20, help="timed calls per case after the first (default 20)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="where synthetic data is generated (default .bench_data/)")
+    parser.add_argument("--baselines", default=BASELINES_PATH, help="baseline file (default benchmarks/baselines.json)")
+    parser.add_argument("--update-baselines", action="store_true", help="record this run as the baseline")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    datasets = args.datasets.split(",")
+
+    if args.child:
+        print(json.dumps(run_child(datasets, args.runs)))
+        return 0
+
+    results = {
+        scale: measure_scale(int(scale), datasets, args.runs, args.out)
+        for scale in args.scales.split(",")
+    }
+    baselines = load_baselines(args.baselines)
+    regressions = compare(results, baselines)
+    missing = missing_baselines(results, baselines)
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions, "missing_baselines": missing}, indent=2))
+    else:
+        _print_report(results, baselines)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        for message in missing:
+            print(f"NOT CHECKED {message}")
+        if missing and not args.update_baselines:
+            print(f"Record baselines with `make bench-baselines` ({os.path.relpath(args.baselines, REPO_ROOT)}).")
+    if args.update_baselines:
+        save_baselines(args.baselines, results)
+        print(f"Baselines written to {os.path.relpath(args.baselines, REPO_ROOT)}")
+        return 0
+    return 1 if regressions or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Per-call span attributes gathered below the tool layer.
+
+TelemetryMiddleware opens a collector around each tool call; code running on
+behalf of that call (the worker pool, ARTPARKData caches) adds attributes with
+record() / increment(), and they land on the tool.{tool_name} span.
+
+Stdlib only, so artpark/ can report without depending on fastmcp. Outside a
+tool call (tests, scripts) recording is a no-op.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_attributes: ContextVar[Optional[Dict[str, Any]]] = ContextVar("artpark_span_attributes", default=None)
+
+
+@contextmanager
+def collect() -> Iterator[Dict[str, Any]]:
+    """Collect attributes recorded in this context (and contexts copied from it)."""
+    attributes: Dict[str, Any] = {}
+    token = _attributes.set(attributes)
+    try:
+        yield attributes
+    finally:
+        _attributes.reset(token)
+
+
+def record(name: str, value: Any) -> None:
+    attributes = _attributes.get()
+    if attributes is not None:
+        attributes[name] = value
+
+
+def increment(name: str, amount: int = 1) -> None:
+    attributes = _attributes.get()
+    if attributes is not None:
+        attributes[name] = attributes.get(name, 0) + amount
@@ -0,0 +1,229 @@
+"""
+Prometheus-compatible metrics for the /metrics route.
+
+Counters, gauges and histograms kept in process and rendered in the Prometheus
+text exposition format (version 0.0.4). Stdlib only, like context.py, so
+artpark/ can observe load times without depending on fastmcp or
+prometheus_client.
+
+Key behaviors:
+    - Cheap enough to stay on for every call: each label set owns a small lock
+      held only for a few integer additions (bucket found with bisect before
+      taking it); the registry lock is taken only when a label set is first seen
+    - Values owned by other components (cache hit/miss counters, worker pool
+      queue, process memory) are read at scrape time by collectors registered
+      with add_collector(), so calls pay nothing for them
+"""
+
+import bisect
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds: sub-millisecond cache hits up to multi-second cold CSV parses
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bytes: error payloads up to full-table responses
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+LabelValues = Tuple[str, ...]
+# (name, type, help, [(labels, value)]) produced by a collector at scrape time
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def _child(self, labels: Dict[str, str]):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            lines += self._render_child(key, child)
+        return lines
+
+    def _render_child(self, key: LabelValues, child) -> List[str]:
+        raise NotImplementedError
+
+
+class _Value:
+    __slots__ = ("value", "lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        child = self._child(labels)
+        with child.lock:
+            child.value += amount
+
+    def value(self, **labels: str) -> float:
+        return self._child(labels).value
+
+    def _render_child(self, key, child):
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(child.value)}"]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class _Buckets:
+    __slots__ = ("counts", "sum", "lock")
+
+    def __init__(self, n: int):
+        self.counts = [0] * (n + 1)  # last slot: above the largest bound
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _Buckets(len(self.buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        child = self._child(labels)
+        slot = bisect.bisect_left(self.buckets, value)
+        with child.lock:
+            child.counts[slot] += 1
+            child.sum += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._child(labels).counts)
+
+    def _render_child(self, key, child):
+        with child.lock:
+            counts, total = list(child.counts), child.sum
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, ('le', _number(bound)))} {cumulative}")
+        lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+        lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Metrics plus scrape-time collectors, rendered together by render()."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines += metric.render()
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:  # a broken collector must not take /metrics down
+                print(f"[METRICS] collector {getattr(collector, '__name__', collector)} failed: {e}", file=sys.stderr)
+                continue
+            for name, kind, help, samples in families:
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(list(labels), list(labels.values()))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_REQUESTS = REGISTRY.register(Counter(
+    "artpark_tool_requests_total", "Tool calls by tool and status (ok or error).", ("tool", "status"),
+))
+TOOL_DURATION = REGISTRY.register(Histogram(
+    "artpark_tool_duration_seconds", "Tool call latency, including worker pool queueing.", ("tool",),
+))
+TOOL_OUTPUT_BYTES = REGISTRY.register(Histogram(
+    "artpark_tool_output_bytes", "Serialized size of tool responses.", ("tool",), buckets=SIZE_BUCKETS,
+))
+TOOL_IN_FLIGHT = REGISTRY.register(Gauge(
+    "artpark_tool_in_flight", "Tool calls currently being handled.", ("tool",),
+))
+TABLE_LOAD_SECONDS = REGISTRY.register(Histogram(
+    "artpark_table_load_seconds", "Time to load a table into memory, by source (columnar store or csv).", ("source",),
+))
+
+
+def process_memory() -> List[Family]:
+    """Current and peak resident memory of this process."""
+    families: List[Family] = []
+    try:
+        with open("/proc/self/status") as f:
+            rss = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:"))
+        families.append(("process_resident_memory_bytes", "gauge", "Resident memory size in bytes.", [({}, rss)]))
+    except (OSError, StopIteration):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+        families.append(("process_peak_resident_memory_bytes", "gauge", "Peak resident memory size in bytes.", [({}, peak)]))
+    return families
+
+
+REGISTRY.add_collector(process_memory)
@@ -0,0 +1,75 @@
+"""
+Stage-level child spans inside ARTPARKData operations.
+
+    with stage("filter", filters=len(filters)) as s:
+        df = ...
+        s.set("rows.after_filter", len(df))
+
+Inside a recording span -- a tool.{name} span from TelemetryMiddleware with an
+OpenTelemetry SDK configured -- each stage becomes a child span "artpark.{name}"
+carrying its attributes (row counts, bytes read, cache hit/miss, columns).
+Otherwise stage() hands back a shared no-op after a single current-span
+lookup, so untraced calls pay next to nothing.
+
+Key behaviors:
+    - opentelemetry-api is optional: without it every stage is a no-op
+    - ARTPARK_STAGE_SPANS=0 turns stages off even when tracing is on
+    - Attribute values must be str, bool, int or float (OpenTelemetry's types)
+"""
+
+import os
+from typing import Any
+
+try:
+    from opentelemetry import trace
+except ImportError:  # tracing not installed
+    trace = None
+
+ENABLED = trace is not None and os.environ.get("ARTPARK_STAGE_SPANS", "1") != "0"
+_tracer = trace.get_tracer("artpark.client") if trace is not None else None
+
+
+class _NoStage:
+    """Stand-in when nothing is recording."""
+
+    __slots__ = ()
+
+    def set(self, name: str, value: Any) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class _Stage:
+    """A child span of the current span, open for the duration of the with-block."""
+
+    __slots__ = ("_context", "_span")
+
+    def __init__(self, name: str, attributes: dict):
+        self._context = _tracer.start_as_current_span(f"artpark.{name}", attributes=attributes)
+        self._span = None
+
+    def set(self, name: str, value: Any) -> None:
+        self._span.set_attribute(name, value)
+
+    def __enter__(self):
+        self._span = self._context.__enter__()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return self._context.__exit__(*exc)
+
+
+def stage(name: str, **attributes: Any):
+    """Context manager timing one stage as a child span (a no-op unless the current span records)."""
+    if not ENABLED or not trace.get_current_span().is_recording():
+        return _NO_STAGE
+    return _Stage(name, attributes)
+
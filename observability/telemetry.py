@@ -5,41 +5,79 @@ Adapted from esankhyiki-mcp (nso-india/esankhyiki-mcp).
 Uses FastMCP's tracer to create child spans with custom attributes:
 - Client IP address (from X-Forwarded-For or direct connection)
 - User-Agent header
-- Tool inputs and outputs
+- Tool inputs and outputs (size-bounded; captured for errors, slow calls and a
+  sampled fraction of the rest)
 
 All data is visible in Jaeger for analysis.
 """
 
 import json
+import os
+import random
 import sys
+import time
 from typing import Any
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.telemetry import get_tracer
 
+from observability.context import collect
+from observability.metrics import TOOL_DURATION, TOOL_IN_FLIGHT, TOOL_OUTPUT_BYTES, TOOL_REQUESTS
+
 # Constants
 MAX_ATTRIBUTE_SIZE = 4096  # 4KB limit for span attributes
+DEFAULT_SAMPLE_RATE = 1.0  # fraction of calls whose input/output are captured
+DEFAULT_SLOW_MS = 1000     # calls at least this slow are always captured
+
+
+def _truncated(text: str, max_size: int, original_size: Any) -> str:
+    return text[:max_size - 50] + f"... [truncated, full size: {original_size} bytes]"
 
 
-def truncate_json(value: Any, max_size: int = MAX_ATTRIBUTE_SIZE) -> tuple[str, int]:
+def bounded_json(value: Any, max_size: int = MAX_ATTRIBUTE_SIZE) -> tuple[str, bool]:
     """
-    Serialize value to JSON and truncate if necessary.
+    Serialize value to JSON, encoding no more than about max_size characters.
+
+    json's iterencode yields the document piece by piece; encoding stops once
+    the budget is exceeded, so the cost follows max_size, not the payload.
 
     Returns:
-        Tuple of (truncated_string, original_size_bytes)
+        Tuple of (string of at most max_size characters, whether it was truncated)
     """
+    encoder = json.JSONEncoder(default=str, ensure_ascii=False)
+    parts, length = [], 0
     try:
-        serialized = json.dumps(value, default=str, ensure_ascii=False)
+        for chunk in encoder.iterencode(value):
+            parts.append(chunk)
+            length += len(chunk)
+            if length > max_size:
+                return _truncated("".join(parts), max_size, f"more than {max_size}"), True
     except (TypeError, ValueError):
-        serialized = str(value)
+        text = str(value)
+        if len(text) > max_size:
+            return _truncated(text, max_size, f"more than {max_size}"), True
+        return text, False
+    return "".join(parts), False
+
 
-    original_size = len(serialized.encode('utf-8'))
+def utf8_size(text: str) -> int:
+    """Bytes of text as UTF-8; O(1) for ASCII-only strings."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
 
-    if original_size > max_size:
-        truncated = serialized[:max_size - 50] + f"... [truncated, full size: {original_size} bytes]"
-        return truncated, original_size
 
-    return serialized, original_size
+def result_text(result: Any) -> str | None:
+    """The text the client receives for a tool result (FastMCP has already serialized it), if any."""
+    texts = [getattr(block, 'text', None) for block in getattr(result, 'content', None) or ()]
+    texts = [text for text in texts if isinstance(text, str)]
+    return "".join(texts) if texts else None
+
+
+def _is_error(result: Any) -> bool:
+    """MCP error results and the {"error": ...} dicts the tools return."""
+    if getattr(result, 'is_error', False):
+        return True
+    content = getattr(result, 'structured_content', None)
+    return isinstance(content, dict) and "error" in content
 
 
 def extract_client_ip(headers: dict) -> str:
@@ -70,12 +108,43 @@ class TelemetryMiddleware(Middleware):
     - tool.name: Name of the tool being called
     - tool.input: JSON-serialized input arguments (truncated to 4KB)
     - tool.output: JSON-serialized return value (truncated to 4KB)
-    - tool.output_size: Original size of output in bytes
+    - tool.output_size: Size of the serialized output in bytes (every call)
+    - telemetry.capture: Why tool.input/tool.output were captured -- error,
+      slow (>= ARTPARK_TELEMETRY_SLOW_MS) or sampled (a random
+      ARTPARK_TELEMETRY_SAMPLE_RATE fraction of calls) -- or "skipped"
+    - pool.queue_depth / pool.wait_ms: Worker pool queueing (artpark/workers.py),
+      and any other attributes recorded through observability/context.py
+
+    Every call also updates the /metrics counters and histograms
+    (observability/metrics.py): requests by status, latency, output size and
+    calls in flight.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        sample_rate: float | None = None,
+        slow_ms: float | None = None,
+        max_attribute_size: int = MAX_ATTRIBUTE_SIZE,
+    ):
         super().__init__()
         self._tracer = get_tracer()
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("ARTPARK_TELEMETRY_SAMPLE_RATE", DEFAULT_SAMPLE_RATE))
+        if slow_ms is None:
+            slow_ms = float(os.environ.get("ARTPARK_TELEMETRY_SLOW_MS", DEFAULT_SLOW_MS))
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.max_attribute_size = max_attribute_size
+
+    def _capture_reason(self, error: bool, elapsed_ms: float) -> str | None:
+        """Why this call's input/output are captured on the span: error, slow, sampled (or None)."""
+        if error:
+            return "error"
+        if elapsed_ms >= self.slow_ms:
+            return "slow"
+        if self.sample_rate >= 1 or (self.sample_rate > 0 and random.random() < self.sample_rate):
+            return "sampled"
+        return None
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Hook that intercepts all tool calls."""
@@ -88,24 +157,47 @@ class TelemetryMiddleware(Middleware):
             # Add pre-execution attributes
             span.set_attribute("tool.name", tool_name)
 
-            if tool_args is not None:
-                input_str, _ = truncate_json(tool_args)
-                span.set_attribute("tool.input", input_str)
-
             # Extract client info from request context
             self._add_client_info_to_span(context, span)
 
-            # Execute the tool
-            result = await call_next(context)
-
-            # Add post-execution attributes
-            output_data = getattr(result, 'structured_content', result)
-            if output_data is not None:
-                output_str, output_size = truncate_json(output_data)
-                span.set_attribute("tool.output", output_str)
+            # Execute the tool, collecting attributes recorded on its behalf
+            TOOL_IN_FLIGHT.inc(tool=tool_name)
+            start = time.perf_counter()
+            error = True
+            with collect() as attributes:
+                try:
+                    result = await call_next(context)
+                    error = _is_error(result)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    TOOL_IN_FLIGHT.dec(tool=tool_name)
+                    TOOL_DURATION.observe(elapsed, tool=tool_name)
+                    TOOL_REQUESTS.inc(tool=tool_name, status="error" if error else "ok")
+                    for name, value in attributes.items():
+                        span.set_attribute(name, value)
+                    # Input/output capture is sampled; it is decided after the call
+                    # so errors and slow calls are always kept
+                    reason = self._capture_reason(error, elapsed * 1000)
+                    span.set_attribute("telemetry.capture", reason or "skipped")
+                    if reason and tool_args is not None:
+                        span.set_attribute("tool.input", bounded_json(tool_args, self.max_attribute_size)[0])
+
+            # Add post-execution attributes. The size comes from the text FastMCP
+            # already serialized for the client; nothing is re-encoded in full.
+            text = result_text(result)
+            if text is not None:
+                output_size = utf8_size(text)
                 span.set_attribute("tool.output_size", output_size)
-                # Log summary to stderr (full output goes to span attributes / Jaeger)
+                TOOL_OUTPUT_BYTES.observe(output_size, tool=tool_name)
+                if reason:
+                    capped = text if len(text) <= self.max_attribute_size else _truncated(text, self.max_attribute_size, output_size)
+                    span.set_attribute("tool.output", capped)
+                # Log summary to stderr (captured output goes to span attributes / Jaeger)
                 print(f"[TELEMETRY] tool.{tool_name} -> {output_size} bytes", file=sys.stderr)
+            elif reason:
+                output_data = getattr(result, 'structured_content', result)
+                if output_data is not None:
+                    span.set_attribute("tool.output", bounded_json(output_data, self.max_attribute_size)[0])
 
         return result
 
@@ -0,0 +1,109 @@
+"""
+Tests for benchmarks/datagen.py and the regression check of benchmarks/suite.py.
+"""
+
+import csv
+import os
+
+import pytest
+import benchmarks.suite as suite
+from artpark.client import ARTPARKData
+from benchmarks.datagen import STAMP_FILE, generate
+from benchmarks.suite import compare, missing_baselines
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A dataset with a top-level table, a subdirectory table and metadata at both levels."""
+    ds = tmp_path / "src" / "0099"
+    (ds / "ka").mkdir(parents=True)
+    (ds / "metadata.yaml").write_text("tables:\n  cases:\n    data_dictionary:\n      district: {}\n")
+    (ds / "cases.csv").write_text('district,count,note\nMysuru,1,"two\nlines"\nUdupi,2,\nMysuru,3,x\n')
+    (ds / "ka" / "metadata.yaml").write_text("tables:\n  villages:\n    data_dictionary: {}\n")
+    (ds / "ka" / "villages.csv").write_text("village,population\nA,10\nB,20\n")
+    return str(tmp_path / "src")
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+class TestDatagen:
+    def test_mirrors_layout_and_scales_rows(self, source, tmp_path):
+        data_dir = generate(3, str(tmp_path / "out"), ["0099"], source_dir=source)
+        ds = os.path.join(data_dir, "0099")
+        assert os.path.isfile(os.path.join(ds, "metadata.yaml"))
+        assert os.path.isfile(os.path.join(ds, "ka", "metadata.yaml"))
+
+        rows = read_rows(os.path.join(ds, "cases.csv"))
+        source_rows = read_rows(os.path.join(source, "0099", "cases.csv"))
+        assert rows[0] == source_rows[0]
+        assert len(rows) - 1 == 3 * (len(source_rows) - 1)
+        assert sorted(rows[1:]) == sorted(source_rows[1:] * 3)
+        assert len(read_rows(os.path.join(ds, "ka", "villages.csv"))) - 1 == 6
+
+    def test_output_is_readable_by_the_client(self, source, tmp_path):
+        data_dir = generate(2, str(tmp_path / "out"), ["0099"], source_dir=source)
+        client = ARTPARKData(data_dir=data_dir, store_dir=str(tmp_path / "store"))
+        result = client.query_table("0099", "cases", filters={"district": "Mysuru"}, limit=100)
+        assert result["total_rows_before_filter"] == 6
+        assert result["total_rows_after_filter"] == 4
+
+    def test_reuses_up_to_date_copy(self, source, tmp_path):
+        out = str(tmp_path / "out")
+        data_dir = generate(2, out, ["0099"], source_dir=source)
+        stamp = os.path.join(os.path.dirname(data_dir), STAMP_FILE)
+        mtime = os.stat(stamp).st_mtime_ns
+        generate(2, out, ["0099"], source_dir=source)
+        assert os.stat(stamp).st_mtime_ns == mtime
+
+    def test_missing_source_dataset(self, source, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            generate(1, str(tmp_path / "out"), ["0404"], source_dir=source)
+
+
+class TestCompare:
+    BASELINE = {"1": {"peak_rss_mb": 100.0, "cases": {
+        "tool:4_get_data[0015]": {"p50_ms": 10.0, "p95_ms": 20.0, "bytes_out": 1000},
+    }}}
+
+    def result(self, p50=10.0, p95=20.0, bytes_out=1000, rss=100.0, error=None):
+        return {"1": {"peak_rss_mb": rss, "cases": {
+            "tool:4_get_data[0015]": {"first_ms": 50.0, "p50_ms": p50, "p95_ms": p95, "bytes_out": bytes_out, "error": error},
+        }}}
+
+    def test_within_tolerance(self):
+        assert compare(self.result(p50=14.0, p95=29.0, bytes_out=1050, rss=120.0), self.BASELINE) == []
+
+    def test_regressions_fail(self):
+        regressions = compare(self.result(p95=45.0, bytes_out=2000, rss=200.0), self.BASELINE)
+        assert len(regressions) == 3
+        assert any("p95_ms" in r for r in regressions)
+
+    def test_no_baseline_for_scale(self):
+        assert compare({"100": self.result()["1"]}, self.BASELINE) == []
+        assert missing_baselines({"100": self.result()["1"]}, self.BASELINE) == ["scale 100: no baseline recorded"]
+
+    def test_no_baseline_for_case(self):
+        result = self.result()
+        result["1"]["cases"]["tool:4_get_data[0087]"] = result["1"]["cases"]["tool:4_get_data[0015]"]
+        assert missing_baselines(result, self.BASELINE) == ["scale 1 tool:4_get_data[0087]: no baseline recorded"]
+        assert missing_baselines(self.result(), self.BASELINE) == []
+
+
+class TestExitCode:
+    RESULT = TestCompare().result()["1"]
+
+    @pytest.fixture(autouse=True)
+    def measured(self, monkeypatch):
+        monkeypatch.setattr(suite, "measure_scale", lambda scale, datasets, runs, out: self.RESULT)
+
+    def test_missing_baseline_fails(self, tmp_path, capsys):
+        assert suite.main(["--scales", "1", "--baselines", str(tmp_path / "none.json")]) == 1
+        assert "NOT CHECKED scale 1: no baseline recorded" in capsys.readouterr().out
+
+    def test_recording_then_checking_passes(self, tmp_path):
+        path = str(tmp_path / "baselines.json")
+        assert suite.main(["--scales", "1", "--baselines", path, "--update-baselines"]) == 0
+        assert suite.main(["--scales", "1", "--baselines", path]) == 0
@@ -0,0 +1,101 @@
+"""
+Tests for artpark/cache.py -- the byte-budgeted table cache.
+Uses small CSVs written to a temp dir so mtime/size changes can be simulated.
+"""
+
+import os
+import pytest
+import pandas as pd
+from artpark.cache import TableCache, frame_nbytes
+from artpark.client import ARTPARKData
+
+
+def _write_csv(path, n_rows):
+    pd.DataFrame({"state.name": ["KARNATAKA"] * n_rows, "value": range(n_rows)}).to_csv(path, index=False)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    for name, n in [("a.csv", 10), ("b.csv", 20), ("c.csv", 30)]:
+        _write_csv(tmp_path / name, n)
+    return tmp_path
+
+
+def _reader(calls):
+    def load(path):
+        calls.append(os.path.basename(path))
+        return pd.read_csv(path)
+    return load
+
+
+# =========================================================================
+# TableCache
+# =========================================================================
+
+class TestTableCache:
+    def test_second_get_is_a_hit(self, csv_dir):
+        calls = []
+        cache = TableCache(max_bytes=10 * 1024 * 1024)
+        first = cache.get(str(csv_dir / "a.csv"), _reader(calls))
+        second = cache.get(str(csv_dir / "a.csv"), _reader(calls))
+        assert first is second
+        assert calls == ["a.csv"]
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_changed_file_is_reloaded(self, csv_dir):
+        calls = []
+        cache = TableCache(max_bytes=10 * 1024 * 1024)
+        path = str(csv_dir / "a.csv")
+        assert len(cache.get(path, _reader(calls))) == 10
+        _write_csv(path, 15)
+        assert len(cache.get(path, _reader(calls))) == 15
+        assert calls == ["a.csv", "a.csv"]
+        assert cache.stats()["invalidations"] == 1
+
+    def test_lru_eviction_under_budget(self, csv_dir):
+        calls = []
+        a = pd.read_csv(csv_dir / "a.csv")
+        c = pd.read_csv(csv_dir / "c.csv")
+        cache = TableCache(max_bytes=frame_nbytes(a) + frame_nbytes(c))
+        cache.get(str(csv_dir / "a.csv"), _reader(calls))
+        cache.get(str(csv_dir / "b.csv"), _reader(calls))
+        cache.get(str(csv_dir / "a.csv"), _reader(calls))  # a becomes most recent
+        cache.get(str(csv_dir / "c.csv"), _reader(calls))  # evicts b
+        stats = cache.stats(base_dir=str(csv_dir))
+        assert [t["path"] for t in stats["tables"]] == ["a.csv", "c.csv"]
+        assert stats["evictions"] >= 1
+        assert stats["used_bytes"] <= stats["max_bytes"]
+
+    def test_oversized_table_is_not_cached(self, csv_dir):
+        calls = []
+        cache = TableCache(max_bytes=1)
+        cache.get(str(csv_dir / "a.csv"), _reader(calls))
+        cache.get(str(csv_dir / "a.csv"), _reader(calls))
+        assert calls == ["a.csv", "a.csv"]
+        assert cache.stats()["entries"] == 0
+
+
+# =========================================================================
+# ARTPARKData integration
+# =========================================================================
+
+class TestClientCache:
+    def test_schema_and_query_share_one_parse(self, tmp_path):
+        client = ARTPARKData(store_dir=str(tmp_path / "store"))
+        client.get_table_schema("0087", "seromonitoring")
+        client.query_table("0087", "seromonitoring", limit=5)
+        client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA"})
+        stats = client.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["tables"][0]["path"].endswith("seromonitoring.csv")
+        assert stats["tables"][0]["bytes"] > 0
+
+    def test_cached_frame_is_not_mutated_by_filters(self):
+        client = ARTPARKData()
+        client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA"})
+        result = client.query_table("0087", "seromonitoring", limit=5)
+        assert result["total_rows_before_filter"] == 238
@@ -4,6 +4,7 @@ Runs against the real publicdata/ CSV files in the repo.
 """
 
 import pytest
+import pandas as pd
 from artpark.client import ARTPARKData
 
 
@@ -174,6 +175,134 @@ class TestQueryTable:
         assert result["rows_returned"] <= 5
 
 
+class TestQueryProjection:
+    COLUMNS = ["state.name", "metadata.year"]
+
+    def test_returns_only_requested_columns(self, client):
+        result = client.query_table("0087", "seromonitoring", limit=5, columns=self.COLUMNS)
+        assert result["columns"] == self.COLUMNS
+        for row in result["data"]:
+            assert list(row) == self.COLUMNS
+
+    def test_projection_with_filter_on_other_column(self, client):
+        result = client.query_table(
+            "0087", "seromonitoring",
+            filters={"state.name": "karnataka"},
+            columns=["metadata.year"],
+        )
+        assert result["total_rows_before_filter"] == 238
+        assert result["total_rows_after_filter"] == 16
+        assert all(list(row) == ["metadata.year"] for row in result["data"])
+
+    def test_projection_does_not_load_full_table(self, client):
+        client.query_table("0087", "seromonitoring", columns=self.COLUMNS)
+        assert client.cache_stats()["entries"] == 0
+
+    def test_projected_rows_match_full_rows(self, client):
+        full = client.query_table("0015", "ka-dengue-daily-summary",
+                                  filters={"location.admin2.name": "Mysuru"}, limit=20)
+        fresh = ARTPARKData()
+        projected = fresh.query_table("0015", "ka-dengue-daily-summary",
+                                      filters={"location.admin2.name": "Mysuru"}, limit=20,
+                                      columns=["location.admin2.name"])
+        assert projected["total_rows_after_filter"] == full["total_rows_after_filter"]
+        assert projected["data"] == [{"location.admin2.name": r["location.admin2.name"]} for r in full["data"]]
+
+    def test_invalid_projection_column_returns_error(self, client):
+        result = client.query_table("0087", "seromonitoring", columns=["nonexistent_column"])
+        assert "error" in result
+        assert "valid_columns" in result
+
+
+class TestQueryStreaming:
+    def test_stops_early_with_lower_bounds(self, client):
+        result = client.query_table(
+            "0015", "ka-dengue-daily-summary",
+            filters={"location.admin2.name": "Mysuru"},
+            limit=5, stream=True,
+        )
+        assert result["rows_returned"] == 5
+        assert result["totals_are_lower_bounds"] is True
+        assert result["total_rows_before_filter"] < 70000
+        assert "_scan" in result
+
+    def test_streamed_rows_match_exact_query(self, client):
+        exact = ARTPARKData().query_table(
+            "0015", "ka-dengue-daily-summary", filters={"location.admin2.name": "Mysuru"}, limit=5,
+        )
+        streamed = client.query_table(
+            "0015", "ka-dengue-daily-summary", filters={"location.admin2.name": "Mysuru"}, limit=5, stream=True,
+        )
+        pd.testing.assert_frame_equal(pd.DataFrame(streamed["data"]), pd.DataFrame(exact["data"]))
+
+    def test_full_scan_is_exact(self, client):
+        result = client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA"},
+                                    limit=50, stream=True)
+        assert result["total_rows_after_filter"] == 16
+        assert "totals_are_lower_bounds" not in result
+
+    def test_small_table_read_to_the_end_is_exact(self, client):
+        result = client.query_table("0087", "seromonitoring", limit=100, stream=True)
+        assert result["rows_returned"] == 100
+        assert result["total_rows_before_filter"] == result["total_rows_after_filter"] == 238
+        assert "totals_are_lower_bounds" not in result
+        assert result["next_cursor"] is not None
+
+    def test_chunks_parse_like_the_whole_file(self, tmp_path):
+        data_dir = tmp_path / "data" / "0001"
+        data_dir.mkdir(parents=True)
+        # Integers until a missing value past the first chunk: the full parse says float64
+        rows = [f"{5 if i % 10 == 0 else 1},{i}" for i in range(3000)] + [",3000"]
+        (data_dir / "t.csv").write_text("rate,n\n" + "\n".join(rows) + "\n")
+        args = ("0001", "t")
+        filters = {"rate": "5.0"}
+
+        streamed = ARTPARKData(data_dir=str(tmp_path / "data"), store_dir=str(tmp_path / "s1"))
+        result = streamed.query_table(*args, filters=filters, limit=1000, stream=True)
+        exact = ARTPARKData(data_dir=str(tmp_path / "data"), store_dir=str(tmp_path / "s2")).query_table(
+            *args, filters=filters, limit=1000,
+        )
+        assert result["total_rows_after_filter"] == exact["total_rows_after_filter"] == 300
+        assert result["data"] == exact["data"]
+        assert streamed.cache_stats()["entries"] == 0
+
+
+# =========================================================================
+# Aggregation
+# =========================================================================
+
+class TestAggregateTable:
+    def test_group_counts_match_filtered_queries(self, client):
+        result = client.aggregate_table(
+            "0087", "seromonitoring", {"state.name": "count"}, group_by=["state.name"],
+        )
+        groups = {row["state.name"]: row["row_count"] for row in result["data"]}
+        assert groups["KARNATAKA"] == 16
+        assert sum(groups.values()) == 238
+        assert result["total_groups"] == len(groups)
+
+    def test_filtered_whole_table_totals(self, client):
+        result = client.aggregate_table(
+            "0015", "ka-dengue-daily-summary",
+            {"daily.positive.total": ["sum", "max"]},
+            filters={"location.admin2.name": "Mysuru"},
+        )
+        rows = client.query_table("0015", "ka-dengue-daily-summary",
+                                  filters={"location.admin2.name": "Mysuru"}, limit=100000)
+        assert result["groups_returned"] == 1
+        assert result["data"][0]["row_count"] == rows["total_rows_after_filter"]
+        assert result["data"][0]["daily.positive.total.max"] == rows["summary_stats"]["daily.positive.total"]["max"]
+
+    def test_unknown_function_returns_error(self, client):
+        result = client.aggregate_table("0087", "seromonitoring", {"state.name": "median"})
+        assert "error" in result
+        assert "valid_aggregations" in result
+
+    def test_unknown_column_returns_error(self, client):
+        result = client.aggregate_table("0087", "seromonitoring", {"x": "sum"}, group_by=["state.name"])
+        assert "valid_columns" in result
+
+
 # =========================================================================
 # CSV Path Resolution
 # =========================================================================
@@ -0,0 +1,88 @@
+"""
+Tests for artpark/columnar.py -- format="columnar" responses of 4_get_data.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.columnar import decode_columnar, encode_columnar
+
+
+def as_json(value):
+    """As sent to the client: NaN in records is serialized as null."""
+    return json.dumps(value, sort_keys=True, default=str).replace("NaN", "null")
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    return ARTPARKData(store_dir=str(tmp_path_factory.mktemp("store")))
+
+
+class TestEncodeColumnar:
+    def test_layout_and_dictionary_encoding(self):
+        df = pd.DataFrame({
+            "location.admin1.name": ["Karnataka", "Goa", "Karnataka", None],
+            "village": ["A", "B", "C", "D"],
+            "cases": np.array([1, 2, 3, 4], dtype=np.int16),
+            "rate": [0.5, np.nan, 1.0, 2.0],
+        })
+        data = encode_columnar(df)
+        assert data["columns"] == list(df.columns)
+        assert data["dictionaries"] == {"location.admin1.name": ["Karnataka", "Goa"]}
+        assert data["values"] == [[0, 1, 0, None], ["A", "B", "C", "D"], [1, 2, 3, 4], [0.5, None, 1.0, 2.0]]
+        assert all(type(v) is int for v in data["values"][2])
+
+    def test_categorical_columns_round_trip(self):
+        df = pd.DataFrame({"state": pd.Series(["GOA", "GOA", "KERALA", "GOA"], dtype="category"), "n": [1, 2, 3, 4]})
+        data = encode_columnar(df)
+        assert "state" in data["dictionaries"]
+        assert decode_columnar(data) == df.astype({"state": object}).to_dict(orient="records")
+
+    def test_empty_frame(self):
+        data = encode_columnar(pd.DataFrame({"a": pd.Series([], dtype=object)}))
+        assert data == {"columns": ["a"], "values": [[]], "dictionaries": {}}
+
+
+class TestColumnarResponses:
+    def test_same_rows_as_records_for_every_table(self, client):
+        checked = 0
+        for dataset_id, info in client.get_catalogue().items():
+            listing = info["listing"]
+            names = [t["name"] for t in listing["tables"]] + [t["name"] for t in listing.get("partitioned_tables", [])]
+            for table_name in names:
+                records = client.query_table(dataset_id, table_name, limit=300)
+                columnar = client.query_table(dataset_id, table_name, limit=300, format="columnar")
+                if "error" in records:
+                    continue
+                assert columnar["format"] == "columnar"
+                assert as_json(decode_columnar(columnar["data"])) == as_json(records["data"])
+                assert columnar["rows_returned"] == records["rows_returned"]
+                assert columnar["summary_stats"] == records["summary_stats"]
+                checked += 1
+        assert checked >= 5
+
+    def test_smaller_than_records(self, client):
+        args = ("0015", "ka-dengue-daily-summary")
+        records = client.query_table(*args, limit=2000)
+        columnar = client.query_table(*args, limit=2000, format="columnar")
+        assert len(json.dumps(columnar["data"])) < len(json.dumps(records["data"], default=str)) / 3
+
+    def test_pages_and_projection(self, client):
+        args = ("0087", "seromonitoring")
+        first = client.query_table(*args, limit=5, columns=["state.name"], format="columnar")
+        assert first["data"]["columns"] == ["state.name"]
+        second = client.query_table(*args, cursor=first["next_cursor"], format="columnar")
+        records = client.query_table(*args, cursor=first["next_cursor"])
+        assert decode_columnar(second["data"]) == records["data"]
+        assert second["offset"] == 5
+
+    def test_unknown_format(self, client):
+        result = client.query_table("0087", "seromonitoring", format="csv")
+        assert result["valid_formats"] == ["records", "columnar"]
+
+    def test_default_is_records(self, client):
+        result = client.query_table("0087", "seromonitoring", limit=2)
+        assert isinstance(result["data"], list) and "format" not in result
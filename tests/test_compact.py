@@ -0,0 +1,117 @@
+"""
+Tests for artpark/compact.py -- compact dtypes for cached tables.
+Responses must be identical with and without compaction.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.compact import compact_frame, expand_categoricals, restore_dtypes
+
+
+@pytest.fixture
+def frame():
+    n = 1000
+    return pd.DataFrame({
+        "state.name": np.array(["KARNATAKA", "GOA", "KERALA", None], dtype=object)[np.arange(n) % 4],
+        "village": [f"V{i}" for i in range(n)],
+        "cases": np.arange(n, dtype=np.int64),
+        "rate": np.linspace(0, 1, n),
+    })
+
+
+class TestCompactFrame:
+    def test_converts_repetitive_text_and_integers(self, frame):
+        compact, report = compact_frame(frame)
+        assert isinstance(compact["state.name"].dtype, pd.CategoricalDtype)
+        assert compact["cases"].dtype == np.int16
+        assert compact["village"].dtype == frame["village"].dtype
+        assert compact["rate"].dtype == np.float64
+        assert set(report["columns"]) == {"state.name", "cases"}
+        assert report["after_bytes"] < report["before_bytes"]
+        assert report["dtypes"]["cases"] == "int64"
+
+    def test_values_round_trip(self, frame):
+        compact, report = compact_frame(frame)
+        restored = restore_dtypes(compact, report["dtypes"])
+        pd.testing.assert_frame_equal(restored, frame)
+        assert compact.to_dict(orient="records") == frame.to_dict(orient="records")
+        assert expand_categoricals(compact)["state.name"].dtype == frame["state.name"].dtype
+
+
+def as_json(response):
+    """Responses compared as they are sent: NaN != NaN would fail a plain dict comparison."""
+    return json.dumps(response, sort_keys=True, default=str)
+
+
+@pytest.fixture(scope="module")
+def clients(tmp_path_factory):
+    store = str(tmp_path_factory.mktemp("store"))
+    return (
+        ARTPARKData(store_dir=store, compact_dtypes=False),
+        ARTPARKData(store_dir=store, compact_dtypes=True),
+    )
+
+
+def all_tables(client):
+    for dataset_id, info in client.get_catalogue().items():
+        listing = info["listing"]
+        names = [t["name"] for t in listing["tables"]]
+        names += [t["name"] for t in listing.get("partitioned_tables", [])]
+        for table_name in names:
+            yield dataset_id, table_name
+
+
+class TestIdenticalResponses:
+    def test_schema_query_and_aggregate_match(self, clients):
+        plain, compact = clients
+        checked = 0
+        for dataset_id, table_name in all_tables(plain):
+            schema = plain.get_table_schema(dataset_id, table_name)
+            assert as_json(compact.get_table_schema(dataset_id, table_name)) == as_json(schema)
+            assert as_json(compact.query_table(dataset_id, table_name, limit=200)) == \
+                as_json(plain.query_table(dataset_id, table_name, limit=200))
+
+            filter_values = {k: v for k, v in schema.get("filter_values", {}).items() if k != "_omitted" and v}
+            if not filter_values:
+                continue
+            col, values = next(iter(filter_values.items()))
+            filters = {col: str(values[0]).upper()}
+            assert as_json(compact.query_table(dataset_id, table_name, filters=filters, limit=50)) == \
+                as_json(plain.query_table(dataset_id, table_name, filters=filters, limit=50))
+
+            numeric = [c for c, s in (schema["csv_summary"].get("dtypes") or {}).items() if s.startswith(("int", "float"))]
+            aggregations = {col: ["count", "nunique", "min", "max"]}
+            if numeric:
+                aggregations[numeric[-1]] = ["sum", "mean", "min", "max"]
+            assert as_json(compact.aggregate_table(dataset_id, table_name, aggregations, group_by=[col])) == \
+                as_json(plain.aggregate_table(dataset_id, table_name, aggregations, group_by=[col]))
+            checked += 1
+        assert checked >= 5
+
+    def test_filtered_multi_column_group_by_matches(self, clients):
+        plain, compact = clients
+        args = ("0087", "seromonitoring", {"samples": "sum"})
+        kwargs = {"group_by": ["state.name", "serotype"], "filters": {"state.name": "KARNATAKA"}}
+        result = compact.aggregate_table(*args, **kwargs)
+        assert as_json(result) == as_json(plain.aggregate_table(*args, **kwargs))
+        assert {row["state.name"] for row in result["data"]} == {"KARNATAKA"}
+        assert all(row["row_count"] > 0 for row in result["data"])
+
+    def test_join_matches(self, clients):
+        plain, compact = clients
+        args = ("0087", "seromonitoring", "0089", "serosurveillance", ["state.name"], ["state.name"])
+        for how in ("inner", "left"):
+            assert as_json(compact.join_tables(*args, how=how, limit=100)) == \
+                as_json(plain.join_tables(*args, how=how, limit=100))
+
+    def test_memory_report(self, clients):
+        _, compact = clients
+        compact.query_table("0015", "ka-dengue-daily-summary", limit=1)
+        report = compact.memory_report()
+        table = next(t for t in report["tables"] if t["path"].startswith("0015/"))
+        assert table["after_bytes"] < table["before_bytes"]
+        assert report["saved_pct"] > 0
@@ -0,0 +1,65 @@
+"""
+Tests for artpark/index.py -- the inverted value index behind query_table filters.
+Each case is checked against the plain astype(str).str.lower() comparison.
+"""
+
+import numpy as np
+import pytest
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.index import ValueIndex, filter_keys
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "state.name": ["KARNATAKA", "Goa", "karnataka", None, "KERALA", "GOA"],
+        "metadata.year": [2019, 2020, 2019, 2021, 2020, 2019],
+        "pct": [1.5, 2.0, None, 1.5, 3.0, 2.0],
+    })
+
+
+def _scan(df, filters):
+    """Reference: the column-scan filter query_table used before the index."""
+    for col, value in filters.items():
+        col_vals = df[col].astype(str).str.lower()
+        df = df[col_vals.isin(filter_keys(value))]
+    return df.index.to_numpy()
+
+
+class TestValueIndex:
+    @pytest.mark.parametrize("filters", [
+        {"state.name": "karnataka"},
+        {"state.name": "GOA,kerala"},
+        {"state.name": "goa , Karnataka"},
+        {"state.name": "nowhere"},
+        {"metadata.year": "2019"},
+        {"metadata.year": 2020},
+        {"pct": "1.5"},
+        {"state.name": "goa", "metadata.year": "2019"},
+        {"state.name": "karnataka,goa", "pct": "1.5,2.0"},
+    ])
+    def test_matches_column_scan(self, frame, filters):
+        positions = ValueIndex(frame).select(filters)
+        assert positions.tolist() == _scan(frame, filters).tolist()
+
+    def test_no_filters_selects_everything(self, frame):
+        assert ValueIndex(frame).select({}).tolist() == list(range(6))
+
+    def test_columns_are_indexed_lazily(self, frame):
+        grown = []
+        index = ValueIndex(frame, on_grow=grown.append)
+        index.select({"state.name": "goa"})
+        index.select({"state.name": "kerala"})
+        assert len(grown) == 1
+        assert index.nbytes == grown[0] > 0
+
+
+class TestClientIndex:
+    def test_index_is_kept_with_cached_table(self):
+        client = ARTPARKData()
+        client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA"})
+        before = client.cache_stats()["used_bytes"]
+        result = client.query_table("0087", "seromonitoring", filters={"state.name": "karnataka"})
+        assert result["total_rows_after_filter"] == 16
+        assert client.cache_stats()["used_bytes"] == before
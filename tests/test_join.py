@@ -0,0 +1,98 @@
+"""
+Tests for artpark/join.py and ARTPARKData.join_tables -- location-keyed joins.
+"""
+
+import numpy as np
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.join import LocationDirectory, composite_keys, infer_level, normalize_keys, normalize_name
+
+
+class TestNormalization:
+    def test_names_ignore_case_spacing_and_punctuation(self):
+        assert normalize_name("Bengaluru Urban") == normalize_name("BENGALURU  URBAN") == "bengaluruurban"
+        assert normalize_name("Daman & Diu") == normalize_name("daman and diu")
+
+    def test_lgd_ids_kept(self):
+        assert normalize_name("District_525") == "district_525"
+        assert normalize_name(float("nan")) is None
+
+    def test_level_from_column_name(self):
+        assert infer_level("location.admin2.name") == "district"
+        assert infer_level("location.admin3.ID") == "subdistrict"
+        assert infer_level("state.name") == "state"
+        assert infer_level("samples") is None
+
+    def test_directory_maps_unambiguous_names_to_ids(self):
+        lgd = pd.DataFrame({
+            "regionID": ["district_1", "district_2", "subdistrict_9", "state_29"],
+            "regionName": ["Mysuru", "Aurangabad", "Aurangabad", "Karnataka"],
+        })
+        directory = LocationDirectory(lgd)
+        keys = normalize_keys(pd.Series(["MYSURU", None, "Aurangabad"]), directory, "district")
+        assert list(keys) == ["district_1", None, "district_2"]
+        # Without a level, "Aurangabad" is ambiguous and stays a name
+        assert directory.resolve("aurangabad", None) == "aurangabad"
+
+    def test_composite_keys_drop_rows_with_missing_parts(self):
+        keys = composite_keys([np.array(["a", "b"], dtype=object), np.array(["x", None], dtype=object)])
+        assert list(keys) == ["a|x", None]
+
+
+class TestJoinTables:
+    def test_self_join_on_state(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring",
+            left_on=["state.name"], right_on=["state.name"],
+            left_filters={"state.name": "KARNATAKA"}, right_filters={"state.name": "karnataka"},
+            left_columns=["samples"], right_columns=["serotype"],
+        )
+        assert result["total_rows"] == 16 * 16
+        assert set(result["data"][0]) == {"join_key", "state.name.left", "samples", "state.name.right", "serotype"}
+
+    def test_name_column_joins_lgd_id_column(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0015", "ka-dengue-daily-summary", "0034", "regionids",
+            left_on=["location.admin2.name"], right_on=["regionID"],
+            left_filters={"location.admin2.name": "Mysuru"}, right_columns=["regionName"],
+            limit=1,
+        )
+        assert result["key_normalization"] == "lgd"
+        assert result["total_rows"] == result["left"]["rows_after_filter"]
+        assert result["data"][0]["regionName"] == "Mysuru"
+
+    def test_left_join_reports_unmatched_keys(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring",
+            left_on=["state.name"], right_on=["state.name"],
+            left_filters={"state.name": "KARNATAKA,GOA"}, right_filters={"state.name": "KARNATAKA"},
+            left_columns=["samples"], right_columns=["serotype"], how="left",
+        )
+        assert {"state.name": "GOA"} in result["unmatched_left_keys"]
+        assert {"state.name": "KARNATAKA"} not in result["unmatched_left_keys"]
+
+    def test_oversized_join_is_refused(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0015", "ka-dengue-daily-summary", "0015", "ka-dengue-daily-summary",
+            left_on=["location.admin2.name"], right_on=["location.admin2.name"],
+        )
+        assert "error" in result
+        assert "hint" in result
+
+    def test_mismatched_key_lists_return_error(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring", left_on=["state.name"], right_on=[],
+        )
+        assert "error" in result
+
+    def test_unknown_column_returns_valid_columns(self):
+        client = ARTPARKData()
+        result = client.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring", left_on=["nope"], right_on=["state.name"],
+        )
+        assert "valid_columns" in result
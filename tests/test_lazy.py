@@ -0,0 +1,55 @@
+"""
+Tests for artpark/lazy.py -- deferred heavy imports and the cold-start budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from artpark.lazy import LazyModule, is_loaded, lazy_import, module_available
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_fresh(code: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestLazyModule:
+    def test_imports_on_first_attribute_and_caches_it(self):
+        mod = lazy_import("colorsys")
+        assert isinstance(mod, LazyModule)
+        rgb_to_hsv = mod.rgb_to_hsv
+        assert is_loaded(mod)
+        assert "rgb_to_hsv" in vars(mod)
+        assert mod.rgb_to_hsv is rgb_to_hsv
+
+    def test_module_attributes_are_not_shadowed(self):
+        np = lazy_import("numpy")
+        import numpy
+        assert np.load is numpy.load
+
+    def test_module_available_does_not_import(self):
+        assert module_available("json")
+        assert not module_available("artpark_no_such_module")
+
+
+class TestColdImport:
+    def test_server_import_defers_pandas_numpy_and_pyarrow(self):
+        result = run_fresh(
+            "import json, sys; import artpark_server; "
+            "print(json.dumps([m for m in ('pandas', 'numpy', 'pyarrow') if m in sys.modules]))"
+        )
+        assert result == []
+
+    def test_first_data_touch_imports_pandas(self):
+        result = run_fresh(
+            "import json, sys; import artpark_server; "
+            "artpark_server.get_metadata('0087', 'seromonitoring'); "
+            "print(json.dumps('pandas' in sys.modules))"
+        )
+        assert result is True
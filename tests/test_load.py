@@ -0,0 +1,80 @@
+"""
+Tests for benchmarks/load.py -- the multi-session /mcp load harness.
+"""
+
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.load import (
+    TOOLS,
+    Recorder,
+    choose_filters,
+    process_rss_mb,
+    run_session,
+    saturation_level,
+    summarize,
+)
+
+FILTER_VALUES = {
+    "state.name": ["GOA", "KARNATAKA"],
+    "district.name": ["Mysuru", "Udupi", "Kolar", "Hassan"],
+    "_omitted": {"village": "too many values"},
+}
+
+
+class TestChooseFilters:
+    def test_selectivities(self):
+        rng = random.Random(0)
+        assert choose_filters(FILTER_VALUES, "none", rng) is None
+        assert list(choose_filters(FILTER_VALUES, "broad", rng)) == ["state.name"]
+        assert list(choose_filters(FILTER_VALUES, "narrow", rng)) == ["district.name"]
+        (col, value), = choose_filters(FILTER_VALUES, "multi", rng).items()
+        assert col in ("state.name", "district.name")
+        assert set(value.split(",")) <= set(FILTER_VALUES[col])
+
+    def test_no_filterable_columns(self):
+        assert choose_filters({"_omitted": {}}, "narrow", random.Random(0)) is None
+
+
+class TestReport:
+    def test_summarize(self):
+        recorder = Recorder()
+        for ms in range(1, 101):
+            recorder.record("4_get_data", ms / 1000, None)
+        recorder.record("3_get_metadata", 0.01, "Unknown table: x")
+        summary = summarize(recorder, sessions=2, elapsed=10.0, rss=[[0.0, 100.0], [1.0, 120.0]])
+        data = summary["tools"]["4_get_data"]
+        assert (data["calls"], data["p50_ms"], data["p95_ms"], data["p99_ms"]) == (100, 51.0, 96.0, 100.0)
+        assert summary["tools"]["3_get_metadata"]["error_rate"] == 1.0
+        assert summary["calls_per_second"] == 10.1
+        assert summary["peak_rss_mb"] == 120.0
+        assert summary["top_errors"] == {"3_get_metadata: Unknown table: x": 1}
+
+    def test_saturation_level(self):
+        def levels(*pairs):
+            return [{"sessions": s, "calls_per_second": c} for s, c in pairs]
+        assert saturation_level(levels((1, 30), (4, 57), (16, 57.5), (64, 40))) == 16
+        assert saturation_level(levels((1, 30), (4, 57), (16, 100))) is None
+
+    def test_process_rss(self):
+        assert process_rss_mb(os.getpid()) > 0
+
+
+class TestSession:
+    def test_workflow_in_memory(self):
+        """One session against the in-process server walks tools 1-4 without errors."""
+        from fastmcp import Client
+        import artpark_server
+
+        recorder = Recorder()
+
+        async def main():
+            async with Client(artpark_server.mcp) as client:
+                await run_session(client, recorder, time.monotonic() + 1.0, random.Random(1), datasets=["0087", "0089"])
+
+        asyncio.run(main())
+        assert recorder.workflows >= 1
+        assert all(len(recorder.latencies[name]) >= 1 for name in TOOLS)
+        assert sum(recorder.errors.values()) == 0, recorder.messages
@@ -0,0 +1,93 @@
+"""
+Tests for artpark/metadata.py -- the parsed metadata.yaml registry.
+Uses a temp dataset dir with top-level and subdirectory metadata.yaml files.
+"""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from artpark import metadata as metadata_module
+from artpark.client import ARTPARKData
+from artpark.metadata import MetadataRegistry, load_yaml
+
+
+def write_yaml(path, tables):
+    path.write_text(yaml.safe_dump({"tables": tables}, sort_keys=False))
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    root = tmp_path / "data" / "0041"
+    (root / "goa").mkdir(parents=True)
+    write_yaml(root / "metadata.yaml", {
+        "livestock": {"info": {"about": "Livestock census"}, "data_dictionary": {"cattle": "Head of cattle"}},
+        "village-livestock": {"info": {"about": "Top-level stub"}},
+        "broken": "not a mapping",
+    })
+    write_yaml(root / "goa" / "metadata.yaml", {
+        "village-livestock": {"info": {"about": "Goa villages"}, "data_dictionary": {"village": "Village name"}},
+        "livestock": {"data_dictionary": {"ignored": "Top-level entry wins"}},
+    })
+    (root / "livestock.csv").write_text("cattle\n1\n")
+    (root / "goa" / "village-livestock.csv").write_text("village\nA\n")
+    return root
+
+
+class TestLoadYaml:
+    def test_invalid_and_non_mapping_yaml_are_empty(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("tables: [unclosed")
+        listing = tmp_path / "list.yaml"
+        listing.write_text("- a\n- b\n")
+        assert load_yaml(str(bad)) == {}
+        assert load_yaml(str(listing)) == {}
+
+
+class TestMetadataRegistry:
+    def test_table_map_prefers_top_level_then_subdirectories(self, dataset):
+        meta = MetadataRegistry().get(str(dataset))
+        assert meta.declared == ["livestock", "village-livestock", "broken"]
+        assert [t.name for t in meta.top_level] == ["livestock", "village-livestock"]
+        assert meta.table("livestock").data_dictionary == {"cattle": "Head of cattle"}
+        village = meta.table("village-livestock")
+        assert village.info == {"about": "Goa villages"}
+        assert village.source == str(dataset / "goa" / "metadata.yaml")
+        assert meta.table("broken") is None
+
+    def test_parses_once_until_a_file_changes(self, dataset, monkeypatch):
+        registry = MetadataRegistry()
+        registry.get(str(dataset))
+        calls = []
+        original = metadata_module.load_yaml
+        monkeypatch.setattr(metadata_module, "load_yaml", lambda path: calls.append(path) or original(path))
+        for _ in range(3):
+            registry.get(str(dataset))
+        assert calls == []
+        assert registry.stats()["hits"] == 3
+
+        write_yaml(dataset / "goa" / "metadata.yaml", {"village-livestock": {"data_dictionary": {"ward": "Ward"}}})
+        assert registry.get(str(dataset)).table("village-livestock").data_dictionary == {"ward": "Ward"}
+        assert len(calls) == 2
+
+    def test_new_subdirectory_metadata_is_picked_up(self, dataset):
+        registry = MetadataRegistry()
+        assert registry.get(str(dataset)).table("bihar-livestock") is None
+        (dataset / "bihar").mkdir()
+        write_yaml(dataset / "bihar" / "metadata.yaml", {"bihar-livestock": {"data_dictionary": {"cattle": "x"}}})
+        os.utime(dataset, ns=(time.time_ns(), time.time_ns() + 2 * 10**9))
+        assert registry.get(str(dataset)).table("bihar-livestock") is not None
+
+
+class TestClientUsesRegistry:
+    def test_schema_lookups_do_not_reparse(self, dataset, monkeypatch):
+        client = ARTPARKData(data_dir=str(dataset.parent))
+        client.get_catalogue()
+        monkeypatch.setattr(metadata_module, "load_yaml", lambda path: pytest.fail(f"re-parsed {path}"))
+        schema = client.get_table_schema("0041", "village-livestock")
+        assert schema["data_dictionary"] == {"village": "Village name"}
+        assert schema["info"] == {"about": "Goa villages"}
+        assert client.get_dataset_tables("0041")["tables"][0]["columns"] == ["cattle"]
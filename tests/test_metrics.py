@@ -0,0 +1,111 @@
+"""
+Tests for observability/metrics.py and the /metrics route.
+"""
+
+import asyncio
+import threading
+
+from fastmcp import Client
+from observability.metrics import Counter, Gauge, Histogram, Registry
+
+
+def scrape() -> str:
+    import artpark_server
+    response = asyncio.run(artpark_server.metrics(None))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    return response.body.decode()
+
+
+def sample(text: str, line_prefix: str) -> float:
+    """Value of the first exposition line starting with line_prefix."""
+    line = next(line for line in text.splitlines() if line.startswith(line_prefix))
+    return float(line.rsplit(" ", 1)[1])
+
+
+class TestPrimitives:
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = Registry()
+        hist = registry.register(Histogram("t_seconds", "test", ("tool",), buckets=(0.1, 1.0)))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            hist.observe(value, tool="a")
+        text = registry.render()
+        assert "# TYPE t_seconds histogram" in text
+        assert 't_seconds_bucket{tool="a",le="0.1"} 1' in text
+        assert 't_seconds_bucket{tool="a",le="1"} 3' in text
+        assert 't_seconds_bucket{tool="a",le="+Inf"} 4' in text
+        assert 't_seconds_count{tool="a"} 4' in text
+        assert 't_seconds_sum{tool="a"} 4.05' in text
+
+    def test_counter_gauge_and_label_escaping(self):
+        registry = Registry()
+        counter = registry.register(Counter("t_total", "test", ("name",)))
+        gauge = registry.register(Gauge("t_in_flight", "test"))
+        counter.inc(name='say "hi"\n')
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        text = registry.render()
+        assert 't_total{name="say \\"hi\\"\\n"} 1' in text
+        assert "t_in_flight 1" in text
+
+    def test_concurrent_updates_are_not_lost(self):
+        hist = Histogram("t_seconds", "test")
+        counter = Counter("t_total", "test")
+
+        def work():
+            for _ in range(5000):
+                hist.observe(0.01)
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert hist.count() == 40000
+        assert counter.value() == 40000
+
+    def test_failing_collector_is_skipped(self):
+        registry = Registry()
+        registry.add_collector(lambda: 1 / 0)
+        registry.add_collector(lambda: [("t_up", "gauge", "test", [({}, 1)])])
+        assert "t_up 1" in registry.render()
+
+
+class TestMetricsRoute:
+    def test_tool_calls_are_counted(self):
+        import artpark_server
+
+        before = scrape()
+
+        async def calls():
+            async with Client(artpark_server.mcp) as client:
+                await client.call_tool("3_get_metadata", {"dataset_id": "0087", "table_name": "seromonitoring"})
+                await client.call_tool("4_get_data", {"dataset_id": "9999", "table_name": "x"})
+
+        asyncio.run(calls())
+        text = scrape()
+
+        def delta(prefix):
+            old = sample(before, prefix) if prefix in before else 0.0
+            return sample(text, prefix) - old
+
+        assert delta('artpark_tool_requests_total{tool="3_get_metadata",status="ok"}') == 1
+        assert delta('artpark_tool_requests_total{tool="4_get_data",status="error"}') == 1
+        assert delta('artpark_tool_duration_seconds_count{tool="3_get_metadata"}') == 1
+        assert delta('artpark_tool_output_bytes_count{tool="3_get_metadata"}') == 1
+        assert sample(text, 'artpark_tool_in_flight{tool="3_get_metadata"}') == 0
+
+    def test_loads_caches_and_memory(self):
+        import artpark_server
+
+        artpark_server.artpark_data.query_table("0089", "serosurveillance", limit=1)
+        text = scrape()
+        assert "# TYPE artpark_table_load_seconds histogram" in text
+        assert 'artpark_table_load_seconds_count{source="' in text
+        for cache in ("table", "response", "metadata"):
+            assert f'artpark_cache_hit_ratio{{cache="{cache}"}}' in text
+        assert sample(text, "artpark_table_cache_entries") >= 1
+        assert sample(text, "process_resident_memory_bytes") > 0
+        assert "artpark_worker_pool_queued" in text
@@ -0,0 +1,85 @@
+"""
+Tests for artpark/names.py -- the table-name resolution index.
+Uses a temp dataset dir with top-level, subdirectory and round files.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.names import NameIndex
+from artpark.partitions import find_partitioned_tables
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    root = tmp_path / "data" / "0055"
+    (root / "goa").mkdir(parents=True)
+    for name in ("ka_dengue-summary.csv", "round1.csv", "round2.csv", "vaccination-census.csv",
+                 "vaccination-survey.csv", "goa/goa-villages.csv"):
+        pd.DataFrame({"a": [1]}).to_csv(root / name, index=False)
+    (root / "metadata.yaml").write_text(
+        "tables:\n  nadcp-progress:\n    info: {}\n  vaccination:\n    info: {}\n"
+    )
+    return root
+
+
+class TestNameIndex:
+    def test_variants_and_subdirectories(self, dataset):
+        names = NameIndex(str(dataset))
+        assert names.csv_path("ka_dengue-summary") == str(dataset / "ka_dengue-summary.csv")
+        assert names.csv_path("goa_villages") == str(dataset / "goa" / "goa-villages.csv")
+        assert names.csv_path("round2") == str(dataset / "round2.csv")
+        assert names.csv_path("missing") is None
+
+    def test_subdirectories_are_tried_in_order_with_every_variant(self, dataset):
+        for name in ("bihar/shared.csv", "kerala/shared.csv", "bihar/state-list.csv", "kerala/state_list.csv"):
+            (dataset / os.path.dirname(name)).mkdir(exist_ok=True)
+            pd.DataFrame({"a": [1]}).to_csv(dataset / name, index=False)
+        names = NameIndex(str(dataset))
+        assert names.csv_path("shared") == str(dataset / "bihar" / "shared.csv")
+        assert names.csv_path("state_list") == str(dataset / "bihar" / "state-list.csv")
+
+    def test_ambiguous_declared_names_are_reported_at_build(self, dataset):
+        names = NameIndex(str(dataset), ["vaccination"])
+        assert names.ambiguous == {"vaccination": ["vaccination-census.csv", "vaccination-survey.csv"]}
+        assert names.csv_path("vaccination") == str(dataset / "vaccination-census.csv")
+
+    def test_partitioned_tables_resolve_to_partition_sets(self, dataset):
+        declared = ["nadcp-progress"]
+        names = NameIndex(str(dataset), declared, find_partitioned_tables(str(dataset), declared))
+        ptable = names.resolve("nadcp_progress")
+        assert ptable.name == "nadcp-progress"
+        assert [os.path.basename(p.csv_path) for p in ptable.partitions] == ["round1.csv", "round2.csv"]
+
+    def test_no_filesystem_access_after_build(self, dataset, monkeypatch):
+        names = NameIndex(str(dataset), ["vaccination"])
+        monkeypatch.setattr(os, "listdir", lambda *_: pytest.fail("listdir after build"))
+        monkeypatch.setattr(os.path, "exists", lambda *_: pytest.fail("exists after build"))
+        assert names.csv_path("goa-villages") is not None
+        assert names.csv_path("dengue") == str(dataset / "ka_dengue-summary.csv")
+
+
+class TestClientResolution:
+    def test_listing_reports_ambiguous_tables(self, dataset):
+        client = ARTPARKData(data_dir=str(dataset.parent))
+        listing = client.get_dataset_tables("0055")
+        assert listing["ambiguous_tables"] == {"vaccination": ["vaccination-census.csv", "vaccination-survey.csv"]}
+
+    def test_added_and_removed_files_are_picked_up_without_the_watcher(self, dataset):
+        client = ARTPARKData(data_dir=str(dataset.parent))
+        assert client._resolve_csv_path("0055", "new-table") is None
+        pd.DataFrame({"a": [1]}).to_csv(dataset / "new-table.csv", index=False)
+        assert client._resolve_csv_path("0055", "new-table") == str(dataset / "new-table.csv")
+        assert "new-table.csv" in client.get_dataset_tables("0055")["csv_files"]
+        os.remove(dataset / "new-table.csv")
+        assert "new-table.csv" not in client.get_dataset_tables("0055")["csv_files"]
+        assert client._resolve_csv_path("0055", "new-table") is None
+
+    def test_unchanged_layout_is_not_rescanned(self, dataset, monkeypatch):
+        client = ARTPARKData(data_dir=str(dataset.parent))
+        client.get_dataset_tables("0055")
+        monkeypatch.setattr(client, "reload_datasets", lambda ids: pytest.fail("re-scanned"))
+        client.get_dataset_tables("0055")
+        assert client._resolve_csv_path("0055", "round1") is not None
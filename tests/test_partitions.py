@@ -0,0 +1,116 @@
+"""
+Tests for artpark/partitions.py -- partitioned virtual tables and pruning.
+Uses a temp data dir laid out like publicdata/data/{dataset_id}/.
+"""
+
+import pytest
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.partitions import find_partitioned_tables
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    (root / "0055").mkdir(parents=True)
+    (root / "0055" / "metadata.yaml").write_text(
+        "tables:\n  nadcp-vaccination-progress:\n    info:\n      about: rounds\n"
+    )
+    for n in (1, 2, 3):
+        pd.DataFrame({
+            "location.admin2.name": ["Mysuru", "Udupi"],
+            "vaccinated": [n * 10, n * 100],
+        }).to_csv(root / "0055" / f"round{n}.csv", index=False)
+    for state in ("goa", "kerala"):
+        (root / "0041" / state).mkdir(parents=True)
+        pd.DataFrame({"village": ["A", "B"], "cattle": [1, 2]}).to_csv(
+            root / "0041" / state / f"{state}-village-livestock.csv", index=False
+        )
+    return root
+
+
+@pytest.fixture
+def client(data_dir, tmp_path):
+    return ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+
+
+class TestDiscovery:
+    def test_rounds_back_declared_table(self, data_dir):
+        tables = find_partitioned_tables(str(data_dir / "0055"), ["nadcp-vaccination-progress"])
+        table = tables["nadcp-vaccination-progress"]
+        assert table.column == "partition.round"
+        assert table.values == [1, 2, 3]
+
+    def test_rounds_without_unbacked_declaration_are_left_alone(self, data_dir):
+        assert find_partitioned_tables(str(data_dir / "0055"), ["round1", "round2", "round3"]) == {}
+
+    def test_state_subdirectories(self, data_dir):
+        tables = find_partitioned_tables(str(data_dir / "0041"), [])
+        assert tables["village-livestock"].values == ["goa", "kerala"]
+
+    def test_prune_drops_the_partition_filter(self, data_dir):
+        table = find_partitioned_tables(str(data_dir / "0055"), ["nadcp-vaccination-progress"])["nadcp-vaccination-progress"]
+        survivors, remaining = table.prune({"partition.round": "1, 3", "vaccinated": "10"})
+        assert [p.value for p in survivors] == [1, 3]
+        assert remaining == {"vaccinated": "10"}
+
+
+class TestPartitionedQueries:
+    def test_full_table_is_union_of_partitions(self, client):
+        result = client.query_table("0055", "nadcp-vaccination-progress", limit=100)
+        assert result["total_rows_after_filter"] == 6
+        assert result["data"][0]["partition.round"] == 1
+        assert result["partitions"]["partitions_read"] == [1, 2, 3]
+
+    def test_pruned_partitions_are_never_opened(self, client, data_dir):
+        (data_dir / "0055" / "round3.csv").write_text("not,a\nvalid\"csv")
+        result = client.query_table(
+            "0055", "nadcp-vaccination-progress",
+            filters={"partition.round": "2", "location.admin2.name": "udupi"},
+        )
+        assert result["data"] == [{"partition.round": 2, "location.admin2.name": "Udupi", "vaccinated": 200}]
+        assert result["total_rows_before_filter"] == 2
+
+    def test_columns_are_read_once_until_a_partition_changes(self, client, data_dir, monkeypatch):
+        reads = []
+        table_columns = client._table_columns
+        monkeypatch.setattr(client, "_table_columns", lambda path: reads.append(path) or table_columns(path))
+        args = ("0055", "nadcp-vaccination-progress")
+        client.query_table(*args, filters={"partition.round": "1"})
+        assert len(reads) == 3
+        client.query_table(*args, filters={"partition.round": "2"}, columns=["vaccinated"])
+        client.aggregate_table(*args, {"vaccinated": "sum"}, filters={"partition.round": "2"})
+        assert len(reads) == 3
+
+        pd.DataFrame({"location.admin2.name": ["Mysuru"], "vaccinated": [1], "doses": [2]}).to_csv(
+            data_dir / "0055" / "round3.csv", index=False
+        )
+        result = client.query_table(*args, filters={"partition.round": "3"}, columns=["doses"])
+        assert result["data"] == [{"doses": 2}]
+        assert len(reads) == 6
+
+    def test_cursor_pages(self, client):
+        first = client.query_table("0055", "nadcp-vaccination-progress", page_size=4)
+        second = client.query_table("0055", "nadcp-vaccination-progress", cursor=first["next_cursor"])
+        assert second["rows_returned"] == 2
+        assert second["next_cursor"] is None
+
+    def test_aggregate_by_partition(self, client):
+        result = client.aggregate_table(
+            "0041", "village-livestock", {"cattle": "sum"}, group_by=["partition.state"],
+        )
+        assert result["data"] == [
+            {"partition.state": "goa", "row_count": 2, "cattle.sum": 3},
+            {"partition.state": "kerala", "row_count": 2, "cattle.sum": 3},
+        ]
+
+    def test_metadata_lists_partitions(self, client):
+        tables = client.get_dataset_tables("0041")
+        assert tables["partitioned_tables"][0]["name"] == "village-livestock"
+        schema = client.get_table_schema("0041", "village-livestock")
+        assert schema["csv_summary"]["total_rows"] == 4
+        assert schema["filter_values"]["partition.state"] == ["goa", "kerala"]
+
+    def test_unknown_column_lists_partition_column(self, client):
+        result = client.query_table("0055", "nadcp-vaccination-progress", filters={"round": "1"})
+        assert "partition.round" in result["valid_columns"]
@@ -0,0 +1,56 @@
+"""
+Tests for artpark/profile.py -- persisted table profiles behind 3_get_metadata.
+"""
+
+import pytest
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.profile import build_profile, MAX_CATEGORICAL_VALUES
+
+
+@pytest.fixture
+def frame():
+    n = 120
+    return pd.DataFrame({
+        "state.name": ["KARNATAKA", "GOA", "KERALA"] * (n // 3),
+        "village.ID": [f"village_{i}" for i in range(n)],
+        "metadata.year": [2019 + i % 4 for i in range(n)],
+        "count": range(n),
+        "single": ["x"] * n,
+    })
+
+
+class TestBuildProfile:
+    def test_summary_counts(self, frame):
+        summary = build_profile(frame)["csv_summary"]
+        assert summary["total_rows"] == 120
+        assert summary["total_columns"] == 5
+        assert summary["distinct_counts"]["village.ID"] == 120
+
+    def test_low_cardinality_values_are_sorted(self, frame):
+        fv = build_profile(frame)["filter_values"]
+        assert fv["state.name"] == ["GOA", "KARNATAKA", "KERALA"]
+        assert fv["metadata.year"] == [2019, 2020, 2021, 2022]
+
+    def test_high_cardinality_columns_are_omitted(self, frame):
+        fv = build_profile(frame)["filter_values"]
+        assert "village.ID" not in fv
+        assert f"village.ID (120 unique values)" in fv["_omitted"]
+        assert 120 > MAX_CATEGORICAL_VALUES
+
+    def test_constant_and_plain_numeric_columns_skipped(self, frame):
+        fv = build_profile(frame)["filter_values"]
+        assert "single" not in fv
+        assert "count" not in fv
+
+
+class TestPersistedProfile:
+    def test_schema_served_without_loading_table(self, tmp_path):
+        store_dir = str(tmp_path / "store")
+        ARTPARKData(store_dir=store_dir).get_table_schema("0087", "seromonitoring")
+
+        fresh = ARTPARKData(store_dir=store_dir)
+        result = fresh.get_table_schema("0087", "seromonitoring")
+        assert result["csv_summary"]["total_rows"] == 238
+        assert "state.name" in result["filter_values"]
+        assert fresh.cache_stats()["misses"] == 0
@@ -0,0 +1,95 @@
+"""
+Tests for artpark/responses.py -- the normalized response cache.
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.responses import MAX_CACHED_ROWS, ResponseCache
+from observability.context import collect
+
+
+class TestResponseCache:
+    def test_hit_requires_same_fingerprint(self):
+        cache = ResponseCache(max_entries=4, ttl_seconds=60)
+        cache.put("k", (1, 2), {"data": []})
+        assert cache.get("k", (1, 2)) == {"data": []}
+        assert cache.get("k", (1, 3)) is None
+        assert cache.stats()["invalidations"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        cache = ResponseCache(max_entries=4, ttl_seconds=10)
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache.put("k", None, {"data": []})
+        now[0] += 11
+        assert cache.get("k", None) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", None, {})
+        cache.put("b", None, {})
+        cache.get("a", None)
+        cache.put("c", None, {})
+        assert cache.get("b", None) is None
+        assert cache.get("a", None) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_errors_are_not_cached(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        cache.put("k", None, {"error": "nope"})
+        assert cache.stats()["entries"] == 0
+
+    def test_large_pages_are_not_cached_in_either_format(self):
+        cache = ResponseCache(max_entries=4, ttl_seconds=60)
+        rows = MAX_CACHED_ROWS + 1
+        cache.put("records", None, {"data": [{"a": 1}] * rows})
+        cache.put("columnar", None, {"data": {"columns": ["a"], "values": [[1] * rows], "dictionaries": {}}})
+        cache.put("counted", None, {"rows_returned": rows, "data": {"columns": [], "values": [], "dictionaries": {}}})
+        cache.put("small", None, {"data": {"columns": ["a"], "values": [[1] * 10], "dictionaries": {}}})
+        assert cache.stats()["entries"] == 1
+        assert cache.get("small", None) is not None
+
+    def test_zero_ttl_disables(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=0)
+        cache.put("k", None, {})
+        assert cache.get("k", None) is None
+
+    def test_hit_ratio_recorded(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        cache.put("k", None, {})
+        with collect() as attributes:
+            cache.get("k", None)
+        assert attributes == {"response_cache.hit": True, "response_cache.hit_ratio": 1.0}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    (root / "0087").mkdir(parents=True)
+    pd.DataFrame({"state.name": ["KARNATAKA", "GOA"], "samples": [1, 2]}).to_csv(
+        root / "0087" / "seromonitoring.csv", index=False
+    )
+    return root
+
+
+class TestClientResponseCache:
+    def test_equivalent_filters_share_an_entry(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        first = client.query_table("0087", "seromonitoring", filters={"state.name": "Goa, karnataka"})
+        second = client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA,goa"})
+        assert client.response_cache_stats()["hits"] == 1
+        assert second["data"] == first["data"]
+        assert second["filters_applied"] == {"state.name": "KARNATAKA,goa"}
+
+    def test_changed_file_is_never_served_stale(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        assert client.get_table_schema("0087", "seromonitoring")["csv_summary"]["total_rows"] == 2
+        csv = data_dir / "0087" / "seromonitoring.csv"
+        pd.DataFrame({"state.name": ["GOA"], "samples": [3]}).to_csv(csv, index=False)
+        os.utime(csv, ns=(time.time_ns(), time.time_ns() + 10**9))
+        assert client.get_table_schema("0087", "seromonitoring")["csv_summary"]["total_rows"] == 1
@@ -0,0 +1,70 @@
+"""
+Tests for artpark/results.py -- cursor pagination over cached result sets.
+"""
+
+import pytest
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.results import CursorError, decode_cursor, encode_cursor, normalize_filters
+
+
+class TestCursorEncoding:
+    def test_round_trip(self):
+        state = {"offset": 50, "fingerprint": [1, 2], "filters": {"state.name": "GOA"}}
+        assert decode_cursor(encode_cursor(state)) == state
+
+    def test_garbage_is_rejected(self):
+        with pytest.raises(CursorError):
+            decode_cursor("not-a-cursor!")
+
+    def test_filter_normalization_ignores_case_order_and_spacing(self):
+        a = normalize_filters({"state.name": "Goa, KARNATAKA", "year": "2019"})
+        b = normalize_filters({"year": 2019, "state.name": "karnataka,goa"})
+        assert a == b
+
+
+class TestPagination:
+    def test_pages_cover_all_matches_once(self):
+        client = ARTPARKData()
+        first = client.query_table("0087", "seromonitoring", page_size=100)
+        assert first["rows_returned"] == 100
+        pages = [first]
+        while pages[-1]["next_cursor"]:
+            pages.append(client.query_table("0087", "seromonitoring", cursor=pages[-1]["next_cursor"]))
+        assert [p["offset"] for p in pages] == [0, 100, 200]
+        assert sum(p["rows_returned"] for p in pages) == 238
+
+        full = client.query_table("0087", "seromonitoring", limit=300)
+        paged = pd.DataFrame([row for p in pages for row in p["data"]])
+        pd.testing.assert_frame_equal(paged, pd.DataFrame(full["data"]))
+
+    def test_cursor_keeps_filters_and_columns(self):
+        client = ARTPARKData()
+        first = client.query_table("0087", "seromonitoring", filters={"state.name": "KARNATAKA"},
+                                   columns=["state.name"], limit=10)
+        second = client.query_table("0087", "seromonitoring", cursor=first["next_cursor"])
+        assert second["rows_returned"] == 6
+        assert second["next_cursor"] is None
+        assert all(row == {"state.name": "KARNATAKA"} for row in second["data"])
+
+    def test_later_pages_reuse_result_set(self):
+        client = ARTPARKData()
+        first = client.query_table("0087", "seromonitoring", limit=50)
+        client.query_table("0087", "seromonitoring", cursor=first["next_cursor"])
+        assert client._results.stats()["hits"] == 1
+
+    def test_cursor_for_other_table_is_rejected(self):
+        client = ARTPARKData()
+        first = client.query_table("0087", "seromonitoring", limit=5)
+        result = client.query_table("0089", "serosurveillance", cursor=first["next_cursor"])
+        assert "error" in result
+
+    def test_cursor_expires_when_file_changes(self, tmp_path):
+        (tmp_path / "0087").mkdir()
+        csv_path = tmp_path / "0087" / "seromonitoring.csv"
+        pd.DataFrame({"state.name": ["GOA"] * 10}).to_csv(csv_path, index=False)
+        client = ARTPARKData(data_dir=str(tmp_path), store_dir=str(tmp_path / "store"))
+        first = client.query_table("0087", "seromonitoring", limit=4)
+        pd.DataFrame({"state.name": ["GOA"] * 12}).to_csv(csv_path, index=False)
+        result = client.query_table("0087", "seromonitoring", cursor=first["next_cursor"])
+        assert "expired" in result["error"]
@@ -102,6 +102,78 @@ class TestGetData:
         assert result["total_rows_after_filter"] == 0
         assert "_hint" in result
 
+    def test_columns_projection(self):
+        result = artpark_server.get_data(
+            "0087", "seromonitoring",
+            filters={"state.name": "KARNATAKA"},
+            columns=["state.name"],
+        )
+        assert result["total_rows_after_filter"] == 16
+        assert all(list(row) == ["state.name"] for row in result["data"])
+
+    def test_pagination_hint_and_cursor(self):
+        first = artpark_server.get_data("0087", "seromonitoring", page_size=200)
+        assert first["next_cursor"]
+        assert "_next_page" in first
+        second = artpark_server.get_data("0087", "seromonitoring", cursor=first["next_cursor"])
+        assert second["rows_returned"] == 38
+        assert second["next_cursor"] is None
+
     def test_invalid_dataset(self):
         result = artpark_server.get_data("9999", "anything")
         assert "error" in result
+
+
+# =========================================================================
+# Tool 5: Aggregate data
+# =========================================================================
+
+class TestAggregateData:
+    def test_group_by_state(self):
+        result = artpark_server.aggregate_data(
+            "0087", "seromonitoring",
+            aggregations={"state.name": "count"},
+            group_by=["state.name"],
+            filters={"state.name": "KARNATAKA"},
+        )
+        assert result["data"] == [{"state.name": "KARNATAKA", "row_count": 16, "state.name.count": 16}]
+
+    def test_empty_filter_result_has_hint(self):
+        result = artpark_server.aggregate_data(
+            "0087", "seromonitoring",
+            aggregations={"state.name": "count"},
+            filters={"state.name": "NONEXISTENT_STATE"},
+        )
+        assert "_hint" in result
+
+    def test_invalid_dataset(self):
+        result = artpark_server.aggregate_data("9999", "anything", aggregations={"x": "sum"})
+        assert "error" in result
+
+
+# =========================================================================
+# Tool 6: Join tables
+# =========================================================================
+
+class TestJoinTables:
+    def test_join_on_state(self):
+        result = artpark_server.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring",
+            left_on=["state.name"], right_on=["state.name"],
+            left_filters={"state.name": "KARNATAKA"}, right_filters={"state.name": "KARNATAKA"},
+            left_columns=["samples"], right_columns=["serotype"], limit=5,
+        )
+        assert result["rows_returned"] == 5
+
+    def test_no_match_has_hint(self):
+        result = artpark_server.join_tables(
+            "0087", "seromonitoring", "0087", "seromonitoring",
+            left_on=["state.name"], right_on=["state.name"],
+            left_filters={"state.name": "KARNATAKA"}, right_filters={"state.name": "GOA"},
+        )
+        assert result["total_rows"] == 0
+        assert "_hint" in result
+
+    def test_invalid_dataset(self):
+        result = artpark_server.join_tables("0087", "seromonitoring", "9999", "x", ["state.name"], ["y"])
+        assert "error" in result
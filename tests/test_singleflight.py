@@ -0,0 +1,82 @@
+"""
+Tests for artpark/singleflight.py -- coalescing identical concurrent calls.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.singleflight import SingleFlight
+from observability.context import collect
+
+
+def burst(flights, key, fn, n):
+    """Start n identical calls; fn blocks until all n have been submitted."""
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return [f.result() for f in [pool.submit(flights.do, key, fn) for _ in range(n)]]
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        threading.Timer(0.2, release.set).start()
+        results = burst(flights, ("query", "t"), slow, 4)
+        assert results == ["value"] * 4
+        assert len(calls) == 1
+        stats = flights.stats()
+        assert stats["leaders"] == 1
+        assert stats["coalesced"] == 3
+        assert stats["top_keys"][0]["coalesced"] == 3
+
+    def test_sequential_calls_are_not_cached(self):
+        flights = SingleFlight()
+        assert flights.do(("k",), lambda: 1) == 1
+        assert flights.do(("k",), lambda: 2) == 2
+
+    def test_leader_error_reaches_waiters(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        threading.Timer(0.2, release.set).start()
+        with pytest.raises(RuntimeError):
+            burst(flights, ("k",), failing, 3)
+        assert flights.stats()["in_flight"] == 0
+
+    def test_waiters_record_span_attribute(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        threading.Timer(0.2, release.set).start()
+
+        def waiter_attributes():
+            with collect() as attributes:
+                flights.do(("schema", "x"), lambda: release.wait(5))
+            return attributes
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = [f.result() for f in [pool.submit(waiter_attributes) for _ in range(2)]]
+        assert {"singleflight.schema.coalesced": 1} in results
+        assert {"singleflight.schema.shared_with": 1} in results
+
+
+class TestClientCoalescing:
+    def test_identical_queries_return_independent_copies(self):
+        client = ARTPARKData()
+        a = client.query_table("0087", "seromonitoring", filters={"state.name": "Goa"}, limit=5)
+        b = client.query_table("0087", "seromonitoring", filters={"state.name": "goa"}, limit=5)
+        a["_hint"] = "mutated"
+        assert "_hint" not in b
+        assert pd.DataFrame(a["data"]).equals(pd.DataFrame(b["data"]))
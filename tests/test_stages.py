@@ -0,0 +1,80 @@
+"""
+Tests for observability/stages.py -- stage-level child spans in ARTPARKData.
+"""
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+import observability.stages as stages
+from artpark.client import ARTPARKData
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """A private SDK tracer (the global provider is left alone) and its finished spans."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("test")
+    monkeypatch.setattr(stages, "_tracer", tracer)
+    tracer.exporter = exporter
+    return tracer
+
+
+def spans_of(tracer, call):
+    tracer.exporter.clear()
+    with tracer.start_as_current_span("tool.test"):
+        call()
+    return {span.name: span for span in tracer.exporter.get_finished_spans()}
+
+
+@pytest.fixture
+def client(tmp_path):
+    return ARTPARKData(store_dir=str(tmp_path / "store"), compact_dtypes=True)
+
+
+class TestStages:
+    def test_query_stages_carry_counts(self, tracer, client):
+        spans = spans_of(tracer, lambda: client.query_table(
+            "0087", "seromonitoring", filters={"state.name": "KARNATAKA"}, limit=5,
+        ))
+        for name in ("resolve", "load_table", "read_table", "compact_table", "filter", "summary_stats", "serialize"):
+            assert f"artpark.{name}" in spans, name
+        parent = spans["tool.test"].context.span_id
+        assert spans["artpark.filter"].parent.span_id == parent
+        assert spans["artpark.read_table"].parent.span_id == spans["artpark.load_table"].context.span_id
+
+        load = spans["artpark.load_table"].attributes
+        read = spans["artpark.read_table"].attributes
+        flt = spans["artpark.filter"].attributes
+        assert load["cache.hit"] is False
+        assert read["source"] == "csv" and read["bytes.read"] > 0
+        assert flt["rows.before_filter"] == read["rows"] > flt["rows.after_filter"] > 0
+        assert spans["artpark.serialize"].attributes["rows"] <= 5
+
+    def test_cache_hit_on_second_load(self, tracer, client):
+        client.query_table("0087", "seromonitoring", limit=1)
+        spans = spans_of(tracer, lambda: client.query_table("0087", "seromonitoring", limit=2))
+        assert spans["artpark.load_table"].attributes["cache.hit"] is True
+        assert "artpark.read_table" not in spans
+
+    def test_schema_and_aggregate_stages(self, tracer, client):
+        spans = spans_of(tracer, lambda: client.get_table_schema("0089", "serosurveillance"))
+        assert spans["artpark.profile"].attributes["cache.hit"] is False
+        spans = spans_of(tracer, lambda: client.aggregate_table(
+            "0089", "serosurveillance", {"state.name": "count"}, group_by=["state.name"],
+        ))
+        assert spans["artpark.aggregate"].attributes["groups"] > 0
+
+    def test_no_spans_without_a_recording_parent(self, tracer, client):
+        tracer.exporter.clear()
+        client.query_table("0087", "seromonitoring", limit=1)
+        assert tracer.exporter.get_finished_spans() == ()
+        assert stages.stage("x") is stages._NO_STAGE
+
+    def test_disabled(self, tracer, client, monkeypatch):
+        monkeypatch.setattr(stages, "ENABLED", False)
+        spans = spans_of(tracer, lambda: client.query_table("0087", "seromonitoring", limit=1))
+        assert list(spans) == ["tool.test"]
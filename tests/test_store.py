@@ -0,0 +1,87 @@
+"""
+Tests for artpark/store.py -- the compiled columnar table store.
+Uses a temp data dir laid out like publicdata/data/{dataset_id}/.
+"""
+
+import os
+import pytest
+import pandas as pd
+from artpark.client import ARTPARKData
+from artpark.store import TableStore, read_csv
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    (root / "0087").mkdir(parents=True)
+    (root / "0041" / "goa").mkdir(parents=True)
+    pd.DataFrame({
+        "state.name": ["KARNATAKA", "GOA", None, "KERALA"],
+        "metadata.year": [2019, 2020, 2021, 2022],
+        "pct": [1.5, None, 3.0, 4.25],
+    }).to_csv(root / "0087" / "seromonitoring.csv", index=False)
+    pd.DataFrame({"village": ["A", "B"], "cattle": [10, 20]}).to_csv(
+        root / "0041" / "goa" / "goa-village.csv", index=False
+    )
+    return root
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TableStore(str(tmp_path / "store"))
+
+
+class TestCompile:
+    def test_compiles_top_level_and_subdirectory_csvs(self, data_dir, store):
+        records = store.compile_dir(str(data_dir))
+        assert len(records) == 2
+        assert all(r["status"] == "compiled" for r in records)
+
+    def test_recompile_is_a_noop(self, data_dir, store):
+        store.compile_dir(str(data_dir))
+        records = store.compile_dir(str(data_dir))
+        assert all(r["status"] == "cached" for r in records)
+
+    def test_artifact_is_keyed_by_content_hash(self, data_dir, store):
+        csv_path = str(data_dir / "0087" / "seromonitoring.csv")
+        store.compile(csv_path)
+        assert os.path.basename(store.artifact_path(csv_path)) == store.content_hash(csv_path) + ".arrow"
+
+
+class TestLoad:
+    def test_artifact_matches_csv_parse(self, data_dir, store):
+        csv_path = str(data_dir / "0087" / "seromonitoring.csv")
+        store.compile(csv_path)
+        pd.testing.assert_frame_equal(store.load(csv_path), read_csv(csv_path))
+
+    def test_column_subset(self, data_dir, store):
+        csv_path = str(data_dir / "0087" / "seromonitoring.csv")
+        store.compile(csv_path)
+        assert list(store.load(csv_path, columns=["pct"]).columns) == ["pct"]
+
+    def test_missing_artifact_returns_none(self, data_dir, store):
+        assert store.load(str(data_dir / "0087" / "seromonitoring.csv")) is None
+
+    def test_edited_csv_misses_old_artifact(self, data_dir, store):
+        csv_path = str(data_dir / "0087" / "seromonitoring.csv")
+        store.compile(csv_path)
+        with open(csv_path, "a") as f:
+            f.write("TAMIL NADU,2023,5.0\n")
+        assert store.load(csv_path) is None
+
+
+class TestClientUsesStore:
+    def test_query_reads_compiled_table(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        client.compile_tables()
+        result = client.query_table("0087", "seromonitoring", filters={"state.name": "karnataka"})
+        assert result["total_rows_before_filter"] == 4
+        assert result["total_rows_after_filter"] == 1
+        assert result["data"][0]["metadata.year"] == 2019
+
+    def test_falls_back_to_csv_without_artifact(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "empty"))
+        result = client.query_table("0041", "goa-village")
+        assert result["total_rows_before_filter"] == 2
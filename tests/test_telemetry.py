@@ -0,0 +1,100 @@
+"""
+Tests for observability/telemetry.py -- bounded serialization and sampled capture.
+"""
+
+import asyncio
+import contextlib
+import json
+
+from fastmcp import Client
+from observability.telemetry import TelemetryMiddleware, bounded_json, utf8_size
+
+
+class Counted:
+    """Serializes through default=str; counts how many were encoded."""
+    encoded = 0
+
+    def __str__(self):
+        Counted.encoded += 1
+        return "x" * 20
+
+
+class TestBoundedJson:
+    def test_small_values_are_complete(self):
+        value = {"a": [1, 2.5, None], "b": "é"}
+        text, truncated = bounded_json(value, 4096)
+        assert not truncated
+        assert json.loads(text) == value
+
+    def test_encoding_stops_at_the_budget(self):
+        Counted.encoded = 0
+        text, truncated = bounded_json({"data": [Counted() for _ in range(100_000)]}, 4096)
+        assert truncated
+        assert len(text) <= 4096
+        assert text.endswith("bytes]")
+        assert Counted.encoded < 300
+
+    def test_utf8_size(self):
+        assert utf8_size("abc") == 3
+        assert utf8_size("é") == 2
+
+
+class FakeSpan:
+    def __init__(self):
+        self.attributes = {}
+
+    def set_attribute(self, name, value):
+        self.attributes[name] = value
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name):
+        span = FakeSpan()
+        self.spans.append(span)
+        yield span
+
+
+def call(middleware, tool, arguments):
+    """Run one tool call of the real server through middleware; returns its span attributes."""
+    import artpark_server
+
+    tracer = FakeTracer()
+    middleware._tracer = tracer
+    artpark_server.mcp.add_middleware(middleware)
+    try:
+        async def run():
+            async with Client(artpark_server.mcp) as client:
+                await client.call_tool(tool, arguments, raise_on_error=False)
+        asyncio.run(run())
+    finally:
+        artpark_server.mcp.middleware.remove(middleware)
+    return next(span.attributes for span in tracer.spans if span.attributes.get("tool.name") == tool)
+
+
+class TestCapture:
+    def test_sampled_call_captures_bounded_output_and_exact_size(self):
+        attrs = call(TelemetryMiddleware(sample_rate=1.0, max_attribute_size=512), "4_get_data",
+                     {"dataset_id": "0087", "table_name": "seromonitoring", "limit": 500})
+        assert attrs["telemetry.capture"] == "sampled"
+        assert json.loads(attrs["tool.input"])["limit"] == 500
+        assert len(attrs["tool.output"]) <= 512
+        assert attrs["tool.output_size"] > 512
+
+    def test_unsampled_call_records_only_size(self):
+        attrs = call(TelemetryMiddleware(sample_rate=0.0, slow_ms=60_000), "2_get_tables", {"dataset_id": "0087"})
+        assert attrs["telemetry.capture"] == "skipped"
+        assert "tool.input" not in attrs and "tool.output" not in attrs
+        assert attrs["tool.output_size"] > 0
+
+    def test_errors_and_slow_calls_are_always_captured(self):
+        attrs = call(TelemetryMiddleware(sample_rate=0.0, slow_ms=60_000), "2_get_tables", {"dataset_id": "9999"})
+        assert attrs["telemetry.capture"] == "error"
+        assert "Unknown dataset" in attrs["tool.output"]
+
+        attrs = call(TelemetryMiddleware(sample_rate=0.0, slow_ms=0), "2_get_tables", {"dataset_id": "0087"})
+        assert attrs["telemetry.capture"] == "slow"
+        assert "tool.input" in attrs
@@ -0,0 +1,64 @@
+"""
+Tests for artpark/warmup.py and the /ready route -- startup warm-up.
+Uses a temp data dir laid out like publicdata/data/{dataset_id}/.
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.warmup import Readiness, warm_up
+
+
+@pytest.fixture
+def client(tmp_path):
+    root = tmp_path / "data"
+    (root / "0087").mkdir(parents=True)
+    (root / "0086" / "goa").mkdir(parents=True)
+    pd.DataFrame({"state.name": ["KARNATAKA", "GOA"], "samples": [1, 2]}).to_csv(
+        root / "0087" / "seromonitoring.csv", index=False
+    )
+    pd.DataFrame({"district.name": ["NORTH GOA"], "doses": [10]}).to_csv(
+        root / "0086" / "goa" / "goa-fmd.csv", index=False
+    )
+    return ARTPARKData(data_dir=str(root), store_dir=str(tmp_path / "store"))
+
+
+class TestWarmUp:
+    @pytest.mark.parametrize("use_processes", [True, False])
+    def test_loads_and_profiles_every_table(self, client, use_processes):
+        readiness = Readiness()
+        seen = []
+        records = warm_up(client, readiness, workers=2, on_table=seen.append, use_processes=use_processes)
+
+        assert [r["csv"].split("/")[-1] for r in records] == ["goa-fmd.csv", "seromonitoring.csv"]
+        for r in records:
+            assert "prepare_error" not in r and "load_error" not in r
+            assert {"prepare_seconds", "load_seconds", "profile_seconds"} <= set(r)
+        assert len(seen) == 2
+        assert readiness.ready
+        assert readiness.stats()["tables_done"] == 2
+        assert client.cache_stats()["entries"] == 2
+        assert client._store.load_profile(records[1]["csv"]) is not None
+
+    def test_failing_table_is_reported_and_server_still_ready(self, client, monkeypatch):
+        def broken(csv_path):
+            raise ValueError("unreadable")
+        monkeypatch.setattr(client, "warm_table", broken)
+        readiness = Readiness()
+        records = warm_up(client, readiness, workers=1, use_processes=False)
+        assert all(r["load_error"] == "unreadable" for r in records)
+        assert readiness.ready
+
+
+class TestReadyRoute:
+    def test_ready_returns_503_until_warm_up_finishes(self, monkeypatch):
+        import artpark_server
+
+        readiness = Readiness()
+        monkeypatch.setattr(artpark_server, "readiness", readiness)
+        readiness.begin(3)
+        assert asyncio.run(artpark_server.ready_check(None)).status_code == 503
+        readiness.mark_ready()
+        assert asyncio.run(artpark_server.ready_check(None)).status_code == 200
@@ -0,0 +1,102 @@
+"""
+Tests for artpark/watcher.py and ARTPARKData.reload_datasets -- catalogue hot-reload.
+Uses a temp data dir laid out like publicdata/data/{dataset_id}/.
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+from artpark.client import ARTPARKData
+from artpark.watcher import CatalogueWatcher, changed_datasets, snapshot
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    root = tmp_path / "data"
+    for dataset_id in ("0086", "0087"):
+        (root / dataset_id).mkdir(parents=True)
+        pd.DataFrame({"state.name": ["KARNATAKA", "GOA"], "samples": [1, 2]}).to_csv(
+            root / dataset_id / "seromonitoring.csv", index=False
+        )
+    return root
+
+
+def touch_csv(path, frame):
+    frame.to_csv(path, index=False)
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+
+class TestSnapshot:
+    def test_detects_only_changed_datasets(self, data_dir):
+        before = snapshot(str(data_dir))
+        touch_csv(data_dir / "0087" / "seromonitoring.csv", pd.DataFrame({"state.name": ["GOA"]}))
+        (data_dir / "0099").mkdir()
+        assert changed_datasets(before, snapshot(str(data_dir))) == {"0087", "0099"}
+
+    def test_polling_reports_changes(self, data_dir):
+        seen = []
+        watcher = CatalogueWatcher(str(data_dir), seen.append, use_inotify=False)
+        watcher.poll_once()
+        (data_dir / "0086" / "extra.csv").write_text("a\n1\n")
+        assert watcher.poll_once() == {"0086"}
+        assert seen == [{"0086"}]
+        assert watcher.mode == "polling"
+
+
+class TestReload:
+    def test_reload_swaps_catalogue_and_evicts_tables(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        assert client.query_table("0087", "seromonitoring")["total_rows_after_filter"] == 2
+        before = client.get_catalogue()
+        (data_dir / "0087" / "rounds.csv").write_text("a\n1\n")
+        touch_csv(data_dir / "0087" / "seromonitoring.csv", pd.DataFrame({"state.name": ["GOA"]}))
+
+        client.reload_datasets({"0087"})
+        after = client.get_catalogue()
+        assert after is not before
+        assert after["0086"] is before["0086"]
+        assert after["0087"]["csv_files"] == ["rounds.csv", "seromonitoring.csv"]
+        assert client.cache_stats()["entries"] == 0
+        assert client.query_table("0087", "seromonitoring")["total_rows_after_filter"] == 1
+
+    def test_removed_dataset_disappears(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        client.get_catalogue()
+        for f in (data_dir / "0086").iterdir():
+            f.unlink()
+        (data_dir / "0086").rmdir()
+        client.reload_datasets({"0086"})
+        assert "0086" not in client.get_catalogue()
+        assert "error" in client.get_dataset_tables("0086")
+
+    def test_watcher_thread_reloads(self, data_dir, tmp_path):
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        client.get_catalogue()
+        watcher = client.start_watching(poll_seconds=0.05, use_inotify=False)
+        try:
+            (data_dir / "0086" / "extra.csv").write_text("a\n1\n")
+            deadline = time.time() + 5
+            while "extra.csv" not in client.get_catalogue()["0086"]["csv_files"] and time.time() < deadline:
+                time.sleep(0.05)
+            assert "extra.csv" in client.get_catalogue()["0086"]["csv_files"]
+            assert watcher.reloads >= 1
+        finally:
+            client.stop_watching()
+
+    def test_server_lifespan_starts_and_stops_the_watcher(self, data_dir, tmp_path, monkeypatch):
+        import asyncio
+        from fastmcp import Client
+        import artpark_server
+
+        client = ARTPARKData(data_dir=str(data_dir), store_dir=str(tmp_path / "store"))
+        monkeypatch.setattr(artpark_server, "artpark_data", client)
+        monkeypatch.setattr(artpark_server, "WATCH_ENABLED", True)
+
+        async def session():
+            async with Client(artpark_server.mcp):
+                return client.watcher_stats()
+
+        assert asyncio.run(session()) is not None
+        assert client.watcher_stats() is None
@@ -0,0 +1,100 @@
+"""
+Tests for artpark/workers.py -- the bounded tool worker pool.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+
+import pytest
+from artpark.workers import PoolSaturated, WorkerPool
+from observability.context import collect
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestWorkerPool:
+    def test_runs_off_the_event_loop_thread(self):
+        pool = WorkerPool(max_workers=2, max_queue=0)
+        caller = threading.get_ident()
+        assert run(pool.run(threading.get_ident)) != caller
+        assert pool.stats()["completed"] == 1
+        pool.shutdown()
+
+    def test_full_queue_rejects_immediately(self):
+        pool = WorkerPool(max_workers=1, max_queue=1)
+        gate = threading.Event()
+
+        async def burst():
+            first = asyncio.ensure_future(pool.run(gate.wait))
+            second = asyncio.ensure_future(pool.run(gate.wait))
+            await asyncio.sleep(0)
+            with pytest.raises(PoolSaturated):
+                await pool.run(gate.wait)
+            gate.set()
+            await asyncio.gather(first, second)
+
+        run(burst())
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+        assert stats["in_flight"] == 0
+        pool.shutdown()
+
+    def test_records_queue_depth_and_wait(self):
+        pool = WorkerPool(max_workers=1, max_queue=4)
+
+        async def call():
+            with collect() as attributes:
+                await pool.run(sum, [1, 2])
+            return attributes
+
+        attributes = run(call())
+        assert attributes["pool.queue_depth"] == 0
+        assert attributes["pool.wait_ms"] >= 0
+        pool.shutdown()
+
+    def test_process_workers(self):
+        pool = WorkerPool(max_workers=1, max_queue=0, kind="process")
+        assert run(pool.run(math.factorial, 5)) == 120
+        pool.shutdown()
+
+    def test_process_workers_run_a_tool(self):
+        import artpark_server
+
+        pool = WorkerPool(max_workers=1, max_queue=0, kind="process")
+        try:
+            args = {"dataset_id": "0087", "table_name": "seromonitoring", "limit": 3}
+            result = run(pool.run(artpark_server.get_data, **args))
+            assert result["rows_returned"] == 3
+            expected = artpark_server.get_data(**args)["data"]
+            assert json.dumps(result["data"], default=str) == json.dumps(expected, default=str)
+        finally:
+            pool.shutdown()
+
+    def test_process_workers_load_unimportable_modules_from_file(self, tmp_path):
+        import importlib.util
+        import sys
+
+        path = tmp_path / "tools_file.py"
+        path.write_text("import os\n\ndef pid_and_name():\n    return os.getpid(), __name__\n")
+        spec = importlib.util.spec_from_file_location("server_module_test", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["server_module_test"] = module
+        spec.loader.exec_module(module)
+        pool = WorkerPool(max_workers=1, max_queue=0, kind="process")
+        try:
+            pid, name = run(pool.run(module.pid_and_name))
+            assert pid != os.getpid()
+            assert name == "server_module_test"
+        finally:
+            pool.shutdown()
+            del sys.modules["server_module_test"]
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            WorkerPool(kind="fiber")